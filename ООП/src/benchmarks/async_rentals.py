@@ -0,0 +1,70 @@
+"""Нагрузочный тест асинхронного процесса онлайн-аренды.
+
+Тысячи одновременных аренд конкурируют за небольшой парк инструментов;
+подтверждение имитирует сетевой вызов через asyncio.sleep. Проверяется, что
+ни один инструмент не забронирован дважды на пересекающиеся периоды.
+Запуск из каталога src:
+    python -m benchmarks.async_rentals [--rentals 5000] [--instruments 200] [--confirm-delay 0.02]
+"""
+import argparse
+import asyncio
+import logging
+import random
+import time
+from datetime import date, timedelta
+
+from instruments import Guitar
+from rental import AvailabilityIndex, AsyncOnlineRentalProcess, Customer, Rental
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=5000)
+    parser.add_argument('--instruments', type=int, default=200)
+    parser.add_argument('--confirm-delay', type=float, default=0.02, help="время отправки подтверждения, с")
+    parser.add_argument('--concurrency', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    rng = random.Random(args.seed)
+
+    guitars = [Guitar(f"Гитара {i}", "new", 50.0, 6) for i in range(args.instruments)]
+    customers = [Customer(f"Клиент {i}", f"client{i}@example.com", "+70000000000", ["can_rent"]) for i in range(100)]
+    first_day = date.today() + timedelta(days=1)  # Будущие периоды: флаг is_available не меняется
+    records = []
+    for _ in range(args.rentals):
+        start = first_day + timedelta(days=rng.randrange(60))
+        records.append((rng.choice(customers), rng.choice(guitars), start, start + timedelta(days=rng.randint(1, 7))))
+    rentals = Rental.bulk_create(records, notify=False)
+
+    availability = AvailabilityIndex()
+    availability.add_instruments(guitars)
+    confirmations = 0
+
+    async def send(recipient: str, message: str) -> None:
+        nonlocal confirmations
+        await asyncio.sleep(args.confirm_delay)
+        confirmations += 1
+
+    process = AsyncOnlineRentalProcess(availability, sender=send)
+    began = time.perf_counter()
+    results = asyncio.run(process.rent_many(rentals, concurrency=args.concurrency))
+    seconds = time.perf_counter() - began
+
+    rented = sum(result is None for result in results)
+    rejected = sum(isinstance(result, ValueError) for result in results)
+    errors = len(results) - rented - rejected
+    overlaps = 0
+    for guitar in guitars:
+        bookings = availability.bookings(guitar.instrument_id)
+        overlaps += sum(1 for previous, current in zip(bookings, bookings[1:]) if current[0] < previous[1])
+
+    print(f"Аренд: {args.rentals:,}, инструментов: {args.instruments}, подтверждение: {args.confirm_delay * 1000:.0f} мс")
+    print(f"  оформлено {rented:,}, отклонено {rejected:,}, ошибок {errors}, подтверждений {confirmations:,}")
+    print(f"  время {seconds:.3f} с ({args.rentals / seconds:,.0f} аренд/с); "
+          f"последовательно только подтверждения заняли бы {rented * args.confirm_delay:.1f} с")
+    print(f"  пересекающихся бронирований: {overlaps}")
+
+
+if __name__ == '__main__':
+    main()
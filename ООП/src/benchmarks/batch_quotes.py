@@ -0,0 +1,51 @@
+"""Пакетный расчёт стоимости аренды (NumPy) против поштучных вызовов calculate_rental_cost.
+
+Требует NumPy. Запуск из каталога src:
+    python -m benchmarks.batch_quotes [--instruments 10000] [--durations 1 3 7 8 14 30 90]
+"""
+import argparse
+import random
+import time
+
+from instruments import Guitar, Piano, Violin, quote_catalog
+
+
+def make_catalog(count: int) -> list:
+    catalog = []
+    for number in range(count):
+        rate = float(random.randrange(20, 200)) + random.random()
+        kind = number % 3
+        if kind == 0:
+            catalog.append(Guitar(f"Гитара {number}", 'new', rate, random.choice([6, 7, 12])))
+        elif kind == 1:
+            catalog.append(Piano(f"Пианино {number}", 'used', rate, random.choice([61, 76, 88])))
+        else:
+            catalog.append(Violin(f"Скрипка {number}", 'refurbished', rate, random.random() < 0.5))
+    return catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--instruments', type=int, default=10_000)
+    parser.add_argument('--durations', type=int, nargs='+', default=[1, 3, 7, 8, 14, 30, 90])
+    args = parser.parse_args()
+    random.seed(42)
+    catalog = make_catalog(args.instruments)
+
+    start = time.perf_counter()
+    expected = [[inst.calculate_rental_cost(days) for days in args.durations] for inst in catalog]
+    per_object = time.perf_counter() - start
+
+    start = time.perf_counter()
+    quotes = quote_catalog(catalog, args.durations)
+    batch = time.perf_counter() - start
+
+    assert quotes.tolist() == expected, "Пакетный расчёт расходится с calculate_rental_cost"
+    total = len(catalog) * len(args.durations)
+    print(f"Котировок: {total:,}")
+    print(f"  поштучно: {per_object * 1000:8.1f} мс ({total / per_object:12,.0f} в с)")
+    print(f"  пакетом:  {batch * 1000:8.1f} мс ({total / batch:12,.0f} в с), ускорение {per_object / batch:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
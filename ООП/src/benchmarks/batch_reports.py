@@ -0,0 +1,51 @@
+"""Генерация отчётов по арендам: поштучный generate_report против Rental.write_reports в пуле процессов.
+
+Запуск из каталога src:
+    python -m benchmarks.batch_reports [--rentals 200000] [--workers 1 2 4]
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from benchmarks.bulk_import import make_records
+from rental import Rental
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=200_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=None)
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    cpus = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, 2, 4, cpus} - {n for n in (2, 4) if n > cpus})
+
+    rentals = Rental.bulk_create(make_records(args.rentals), notify=False)
+    with tempfile.TemporaryDirectory() as directory:
+        serial_path = os.path.join(directory, 'serial.txt')
+        start = time.perf_counter()
+        with open(serial_path, 'w', encoding='utf-8') as f:
+            for rental in rentals:
+                f.write(rental.generate_report())
+                f.write("\n\n")
+        serial = time.perf_counter() - start
+        print(f"Аренд: {args.rentals:,}, ядер: {cpus}")
+        print(f"  generate_report по одному     {serial:7.3f} с")
+        with open(serial_path, encoding='utf-8') as f:
+            expected = f.read()
+        for workers in worker_counts:
+            path = os.path.join(directory, f'batch_{workers}.txt')
+            start = time.perf_counter()
+            Rental.write_reports(rentals, path, workers=workers, chunk_size=args.chunk_size)
+            seconds = time.perf_counter() - start
+            with open(path, encoding='utf-8') as f:
+                same = f.read() == expected
+            print(f"  write_reports, процессов {workers:>2}   {seconds:7.3f} с  ({serial / seconds:4.1f}x)"
+                  f"{'' if same else '  ВЫВОД ОТЛИЧАЕТСЯ'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Импорт аренд: поштучные Rental(...)/Rental.from_dict против Rental.bulk_create/bulk_from_dict.
+
+Запуск из каталога src:
+    python -m benchmarks.bulk_import [--rentals 100000]
+"""
+import argparse
+import contextlib
+import os
+import random
+import time
+from datetime import date, timedelta
+
+from instruments import Guitar, Piano, Violin
+from rental import Customer, Rental
+
+
+def make_records(count: int) -> list:
+    customers = [Customer(f"Клиент {n}", f"client{n}@example.com", permissions=['can_rent']) for n in range(500)]
+    instruments = [Guitar(f"Гитара {n}", 'new', 50.0, 6) for n in range(300)]
+    instruments += [Piano(f"Пианино {n}", 'used', 100.0, 88) for n in range(100)]
+    instruments += [Violin(f"Скрипка {n}", 'new', 80.0, True) for n in range(100)]
+    records = []
+    for _ in range(count):
+        start = date(2020, 1, 1) + timedelta(days=random.randrange(2000))
+        records.append((random.choice(customers), random.choice(instruments), start,
+                        start + timedelta(days=random.randrange(1, 30))))
+    return records
+
+
+def timed(func) -> float:
+    Rental._registry.clear()
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=100_000)
+    args = parser.parse_args()
+    random.seed(42)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        records = make_records(args.rentals)
+        one_by_one = timed(lambda: [Rental(*record) for record in records])
+        bulk = timed(lambda: Rental.bulk_create(records))
+        dicts = [rental.to_dict() for rental in Rental._registry]
+        from_dict = timed(lambda: [Rental.from_dict(data) for data in dicts])
+        bulk_from_dict = timed(lambda: Rental.bulk_from_dict(dicts))
+
+    print(f"Аренд: {args.rentals:,}")
+    print(f"  Rental(...)            {one_by_one:7.3f} с")
+    print(f"  Rental.bulk_create     {bulk:7.3f} с  ({one_by_one / bulk:.1f}x)")
+    print(f"  Rental.from_dict       {from_dict:7.3f} с")
+    print(f"  Rental.bulk_from_dict  {bulk_from_dict:7.3f} с  ({from_dict / bulk_from_dict:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""Многопоточный стресс-тест оформления аренд.
+
+Потоки одновременно проводят аренды через OnlineRentalProcess с общим
+AvailabilityIndex, читают реестр аренд и захватывают флаг доступности
+инструментов через try_reserve. Для каждого числа потоков печатается
+пропускная способность и число двойных бронирований (должно быть 0).
+Запуск из каталога src:
+    python -m benchmarks.concurrent_checkout [--rentals 20000] [--instruments 300] [--threads 1 2 4 8]
+"""
+import argparse
+import logging
+import random
+import sys
+import threading
+import time
+from datetime import date, timedelta
+
+from instruments import Guitar
+from rental import AvailabilityIndex, Customer, OnlineRentalProcess, Rental
+from utils import FakeTransport, NotificationDispatcher, set_notification_dispatcher
+
+
+def _run(threads: int, rentals, guitars, flag_guitars) -> dict:
+    availability = AvailabilityIndex()
+    availability.add_instruments(guitars)
+    process = OnlineRentalProcess(availability)
+    for guitar in flag_guitars:
+        guitar.release()
+    results = {'rented': 0, 'rejected': 0, 'flag_wins': [0] * len(flag_guitars)}
+    counters_lock = threading.Lock()
+    start_barrier = threading.Barrier(threads)
+    chunks = [rentals[position::threads] for position in range(threads)]
+
+    def worker(chunk) -> None:
+        rented = rejected = 0
+        wins = [0] * len(flag_guitars)
+        start_barrier.wait()
+        for rental in chunk:
+            try:
+                process.rent_instrument(rental)
+                rented += 1
+            except Exception:
+                rejected += 1
+            Rental.find_rentals_by_instrument(rental.instrument.instrument_id)
+        for position, guitar in enumerate(flag_guitars):
+            if guitar.try_reserve():
+                wins[position] += 1
+        with counters_lock:
+            results['rented'] += rented
+            results['rejected'] += rejected
+            results['flag_wins'] = [total + won for total, won in zip(results['flag_wins'], wins)]
+
+    workers = [threading.Thread(target=worker, args=(chunk,)) for chunk in chunks]
+    began = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    results['seconds'] = time.perf_counter() - began
+
+    overlaps = 0
+    for guitar in guitars:
+        bookings = availability.bookings(guitar.instrument_id)
+        overlaps += sum(1 for previous, current in zip(bookings, bookings[1:]) if current[0] < previous[1])
+    results['overlaps'] = overlaps
+    results['flag_double'] = sum(1 for won in results['flag_wins'] if won != 1)
+    for rental in rentals:
+        rental.instrument.release()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=20_000)
+    parser.add_argument('--instruments', type=int, default=300)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    sys.setswitchinterval(1e-5)  # Частые переключения потоков повышают шанс поймать гонку
+    rng = random.Random(args.seed)
+
+    guitars = [Guitar(f"Гитара {i}", "new", 50.0, 6) for i in range(args.instruments)]
+    flag_guitars = [Guitar(f"Витрина {i}", "new", 50.0, 6) for i in range(100)]
+    customers = [Customer(f"Клиент {i}", f"client{i}@example.com", "+70000000000", ["can_rent"]) for i in range(100)]
+    first_day = date.today() + timedelta(days=1)
+    records = []
+    for _ in range(args.rentals):
+        start = first_day + timedelta(days=rng.randrange(90))
+        records.append((rng.choice(customers), rng.choice(guitars), start, start + timedelta(days=rng.randint(1, 7))))
+    rentals = Rental.bulk_create(records, notify=False)
+
+    dispatcher = NotificationDispatcher(FakeTransport(), overflow='drop_new')
+    set_notification_dispatcher(dispatcher)
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Аренд: {args.rentals:,}, инструментов: {args.instruments}, GIL {'включён' if gil else 'выключен'}")
+    baseline = None
+    for threads in args.threads:
+        result = _run(threads, rentals, guitars, flag_guitars)
+        throughput = args.rentals / result['seconds']
+        baseline = baseline or throughput
+        print(
+            f"  потоков {threads:>2}: {throughput:>9,.0f} аренд/с ({throughput / baseline:4.2f}x), "
+            f"оформлено {result['rented']:,}, отклонено {result['rejected']:,}, "
+            f"пересечений {result['overlaps']}, двойных захватов флага {result['flag_double']}"
+        )
+    dispatcher.close()
+    set_notification_dispatcher(None)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Генераторы синтетических данных для бенчмарков.
+
+Все генераторы детерминированы: одинаковые масштаб и seed дают одинаковые
+данные (кроме случайных UUID объектов).
+"""
+import contextlib
+import os
+import random
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+from instruments import InstrumentMeta, MusicalInstrument
+from rental import Accessory, Customer, Rental, RentalRequest, RequestType
+
+# Масштаб -> количество аренд; клиентов и инструментов создаётся пропорционально
+SCALES: Dict[str, int] = {'small': 1_000, 'medium': 10_000, 'large': 100_000}
+
+_CONDITIONS = ('new', 'used', 'refurbished')
+
+
+def make_customers(count: int, rng: random.Random) -> List[Customer]:
+    permissions = ['can_rent', 'can_modify_rental']
+    return [
+        Customer(f"Клиент {n}", f"client{n}@example.com", f"+7900{n:07d}" if rng.random() < 0.5 else None, permissions)
+        for n in range(count)
+    ]
+
+
+def make_instruments(count: int, rng: random.Random) -> List[MusicalInstrument]:
+    """Создаёт инструменты всех типов в пропорции 3:1:1 (гитары, пианино, скрипки)."""
+    rows: Dict[str, list] = {'guitar': [], 'piano': [], 'violin': []}
+    for n in range(count):
+        condition, rate = rng.choice(_CONDITIONS), round(rng.uniform(20.0, 200.0), 2)
+        kind = rng.choice(('guitar', 'guitar', 'guitar', 'piano', 'violin'))
+        extra = {'guitar': rng.choice((6, 7, 12)), 'piano': 88, 'violin': rng.random() < 0.5}[kind]
+        rows[kind].append((f"{kind.capitalize()} {n}", condition, rate, extra))
+    instruments = []
+    for kind, kind_rows in rows.items():
+        instruments += InstrumentMeta.create_many(kind, kind_rows)
+    rng.shuffle(instruments)
+    return instruments
+
+
+def make_accessories(count: int, rng: random.Random) -> List[Accessory]:
+    return [Accessory(f"Аксессуар {n}", round(rng.uniform(1.0, 30.0), 2)) for n in range(count)]
+
+
+def make_rental_records(
+        count: int,
+        customers: List[Customer],
+        instruments: List[MusicalInstrument],
+        rng: random.Random
+) -> List[Tuple[Customer, MusicalInstrument, date, date]]:
+    records = []
+    for _ in range(count):
+        start = date(2020, 1, 1) + timedelta(days=rng.randrange(2000))
+        records.append((rng.choice(customers), rng.choice(instruments), start,
+                        start + timedelta(days=rng.randrange(1, 30))))
+    return records
+
+
+def make_requests(count: int, rng: random.Random) -> List[RentalRequest]:
+    types = list(RequestType)
+    return [RentalRequest(rng.choice(types), round(rng.uniform(0, 3000), 2), f"Запрос {n}") for n in range(count)]
+
+
+class Dataset:
+    """Связанный набор клиентов, инструментов и аренд заданного масштаба."""
+
+    def __init__(self, rentals: int, seed: int = 42):
+        """Создаёт данные: аренды регистрируются в реестре Rental пакетом.
+
+        Args:
+            rentals: Количество аренд.
+            seed: Начальное значение генератора случайных чисел.
+        """
+        rng = random.Random(seed)
+        self.seed = seed
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            self.customers = make_customers(max(10, rentals // 20), rng)
+            self.instruments = make_instruments(max(10, rentals // 10), rng)
+            self.accessories = make_accessories(50, rng)
+            self.rentals = Rental.bulk_create(
+                make_rental_records(rentals, self.customers, self.instruments, rng), notify=False
+            )
+            for rental in self.rentals:
+                for accessory in rng.sample(self.accessories, rng.randrange(4)):
+                    rental._put_accessory(accessory)
+                rental._calculate_total_quietly()
+        self.requests = make_requests(min(rentals, 100_000), rng)
+        self.rng = rng
+
+    @classmethod
+    def for_scale(cls, scale: str, seed: int = 42) -> 'Dataset':
+        """Создаёт набор данных по имени масштаба из SCALES."""
+        return cls(SCALES[scale], seed)
@@ -0,0 +1,106 @@
+"""Измерительная часть набора бенчмарков: пропускная способность, перцентили задержки и пик памяти."""
+import gc
+import math
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+Operation = Callable[[], object]
+
+
+class BenchmarkResult:
+    """Результат одного бенчмарка."""
+
+    __slots__ = ('name', 'operations', 'seconds', 'p50_us', 'p99_us', 'peak_kib')
+
+    def __init__(self, name: str, operations: int, seconds: float, p50_us: float, p99_us: float, peak_kib: float):
+        self.name = name
+        self.operations = operations
+        self.seconds = seconds
+        self.p50_us = p50_us
+        self.p99_us = p99_us
+        self.peak_kib = peak_kib
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.operations / self.seconds if self.seconds else float('inf')
+
+    def to_dict(self) -> Dict:
+        return {
+            'name': self.name,
+            'operations': self.operations,
+            'seconds': round(self.seconds, 6),
+            'ops_per_sec': round(self.ops_per_sec, 1),
+            'p50_us': round(self.p50_us, 3),
+            'p99_us': round(self.p99_us, 3),
+            'peak_kib': round(self.peak_kib, 1),
+        }
+
+
+def percentile(sorted_values: List[int], fraction: float) -> int:
+    """Возвращает перцентиль отсортированной выборки (метод ближайшего ранга)."""
+    if not sorted_values:
+        return 0
+    rank = max(1, math.ceil(len(sorted_values) * fraction))
+    return sorted_values[rank - 1]
+
+
+def measure(
+        name: str,
+        operation: Operation,
+        operations: int,
+        warmup: int = 0,
+        memory: bool = True,
+        setup: Optional[Callable[[], None]] = None
+) -> BenchmarkResult:
+    """Выполняет операцию заданное число раз и измеряет каждый вызов.
+
+    Задержка каждого вызова измеряется perf_counter_ns, поэтому для
+    операций короче микросекунды в неё входит и цена самого таймера.
+    Пик памяти измеряется отдельным прогоном под tracemalloc (он
+    замедляет код и не должен влиять на время): это максимум памяти,
+    выделенной сверх уже занятой к началу прогона.
+
+    Args:
+        name: Имя бенчмарка.
+        operation: Операция без аргументов.
+        operations: Количество измеряемых вызовов.
+        warmup: Количество вызовов до измерений.
+        memory: Измерять ли пик памяти.
+        setup: Подготовка перед каждым прогоном (измеряемым и прогоном памяти).
+
+    Returns:
+        Результат бенчмарка.
+    """
+    for _ in range(warmup):
+        operation()
+    if setup is not None:
+        setup()
+    timings = [0] * operations
+    clock = time.perf_counter_ns
+    gc.collect()  # Мусор подготовки не должен собираться во время измерений
+    start = clock()
+    for position in range(operations):
+        begin = clock()
+        operation()
+        timings[position] = clock() - begin
+    total = clock() - start
+    timings.sort()
+
+    peak = 0.0
+    if memory:
+        if setup is not None:
+            setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            for _ in range(operations):
+                operation()
+            peak = (tracemalloc.get_traced_memory()[1] - baseline) / 1024
+        finally:
+            tracemalloc.stop()
+
+    return BenchmarkResult(
+        name, operations, total / 1e9, percentile(timings, 0.50) / 1e3, percentile(timings, 0.99) / 1e3, peak
+    )
@@ -0,0 +1,52 @@
+"""Создание инструментов: прежняя фабрика против реестра InstrumentMeta и create_many.
+
+Запуск из каталога src:
+    python -m benchmarks.instrument_factory [--instruments 100000]
+"""
+import argparse
+import logging
+import time
+
+from instruments import InstrumentMeta
+from utils import InstrumentFactory
+
+
+def legacy_create_instrument(instrument_type: str, *args, **kwargs):
+    """Прежняя реализация InstrumentFactory.create_instrument: импорт и словарь на каждый вызов."""
+    from instruments import Guitar, Piano, Violin
+
+    instrument_classes = {
+        "guitar": Guitar,
+        "piano": Piano,
+        "violin": Violin
+    }
+    instrument_class = instrument_classes.get(instrument_type.lower())
+    if not instrument_class:
+        raise ValueError(f"Неизвестный тип инструмента: {instrument_type}")
+    return instrument_class(*args, **kwargs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--instruments', type=int, default=100_000)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+    rows = [(f"Гитара {n}", 'new', 50.0, 6) for n in range(args.instruments)]
+
+    cases = [
+        ("прежняя фабрика", lambda: [legacy_create_instrument('guitar', *row) for row in rows]),
+        ("InstrumentFactory.create_instrument", lambda: [InstrumentFactory.create_instrument('guitar', *row) for row in rows]),
+        ("InstrumentMeta.create_many", lambda: InstrumentMeta.create_many('guitar', rows)),
+    ]
+    print(f"Инструментов: {args.instruments:,}")
+    for title, func in cases:
+        best = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        print(f"  {title:<38} {best:7.3f} с  ({best / args.instruments * 1e6:5.2f} мкс/шт)")
+
+
+if __name__ == '__main__':
+    main()
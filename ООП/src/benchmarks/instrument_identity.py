@@ -0,0 +1,68 @@
+"""Идентичность инструментов после загрузки: число объектов и поиск по ID.
+
+Файл в прежнем формате (инструменты вложены в каждую аренду) загружается
+через load_inventory; затем поиск инструмента каждой аренды линейным
+проходом по списку сравнивается с InstrumentInventory.get.
+Запуск из каталога src:
+    python -m benchmarks.instrument_identity [--rentals 50000] [--instruments 2000]
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from instruments import Guitar
+from rental import Customer, Rental
+from utils.serialization import load_inventory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=50_000)
+    parser.add_argument('--instruments', type=int, default=2000)
+    parser.add_argument('--lookups', type=int, default=2000, help="аренд для сверки линейным поиском")
+    args = parser.parse_args()
+    random.seed(42)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        customer = Customer("Клиент", "client@example.com", permissions=['can_rent'])
+        instruments = [Guitar(f"Гитара {n}", 'new', 50.0, 6) for n in range(args.instruments)]
+        records = []
+        for _ in range(args.rentals):
+            start = date(2020, 1, 1) + timedelta(days=random.randrange(2000))
+            records.append((customer, random.choice(instruments), start, start + timedelta(days=7)))
+        rentals = Rental.bulk_create(records)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'embedded.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'instruments': [inst.to_dict() for inst in instruments],
+                           'rentals': [rental.to_dict() for rental in rentals]}, f, ensure_ascii=False)
+            Rental._registry.clear()
+            start = time.perf_counter()
+            inventory, loaded = load_inventory(path)
+            load_seconds = time.perf_counter() - start
+
+    objects = len({id(rental.instrument) for rental in loaded} | {id(inst) for inst in inventory})
+    stable = all(inventory.get(inst.instrument_id) is not None for inst in instruments)
+    print(f"Аренд: {args.rentals:,}, инструментов: {args.instruments:,}")
+    print(f"  загрузка {load_seconds:.2f} с, объектов инструментов {objects:,}, ID сохранены: {stable}")
+
+    sample = loaded[:args.lookups]
+    inventory_list = list(inventory)
+    start = time.perf_counter()
+    for rental in sample:
+        next(inst for inst in inventory_list if inst.instrument_id == rental.instrument.instrument_id)
+    scan = (time.perf_counter() - start) / len(sample)
+    start = time.perf_counter()
+    for rental in loaded:
+        inventory.get(rental.instrument.instrument_id)
+    indexed = (time.perf_counter() - start) / len(loaded)
+    print(f"  поиск проходом по списку {scan * 1e6:9.2f} мкс/аренда")
+    print(f"  InstrumentInventory.get  {indexed * 1e6:9.2f} мкс/аренда ({scan / indexed:,.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Стоимость сохранения одной операции: save_to_json целиком против журнала RentalJournal.
+
+Операция — добавление аксессуара к аренде. Для журнала показаны сброс на
+диск после каждого события и пакетный сброс, а также время восстановления
+и фоновой свёртки. Запуск из каталога src:
+    python -m benchmarks.journal_persistence [--rentals 20000] [--operations 2000]
+"""
+import argparse
+import contextlib
+import logging
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from instruments import Guitar
+from rental import Accessory, Customer, Rental
+from utils import RentalJournal, save_to_json, set_journal
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=20_000)
+    parser.add_argument('--operations', type=int, default=2000)
+    parser.add_argument('--full-saves', type=int, default=5, help="сколько раз замерить save_to_json")
+    args = parser.parse_args()
+    random.seed(42)
+    logging.disable(logging.CRITICAL)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), \
+            tempfile.TemporaryDirectory() as directory:
+        customer = Customer("Клиент", "client@example.com", permissions=['can_rent', 'can_modify_rental'])
+        instruments = [Guitar(f"Гитара {n}", 'new', 50.0, 6) for n in range(500)]
+        rentals = Rental.bulk_create(
+            (customer, random.choice(instruments), start, start + timedelta(days=7))
+            for start in (date(2020, 1, 1) + timedelta(days=random.randrange(2000)) for _ in range(args.rentals))
+        )
+        accessory = Accessory("Чехол", 5.0)
+        snapshot = os.path.join(directory, 'rental_data.json')
+
+        start = time.perf_counter()
+        for _ in range(args.full_saves):
+            random.choice(rentals).add_accessory(accessory)
+            save_to_json(instruments, rentals, snapshot)
+        full = (time.perf_counter() - start) / args.full_saves
+
+        results = []
+        for title, sync_every in (("журнал, fsync на событие", 1), ("журнал, fsync пакетом", 100)):
+            journal = RentalJournal(snapshot, sync_every=sync_every, compact_every=0)
+            journal.recover()
+            set_journal(journal)
+            start = time.perf_counter()
+            for _ in range(args.operations):
+                random.choice(rentals).add_accessory(accessory)
+            journal.sync()
+            results.append((title, (time.perf_counter() - start) / args.operations, journal.syncs))
+            set_journal(None)
+            journal.close()
+
+        Rental._registry.clear()
+        journal = RentalJournal(snapshot, compact_every=0)
+        start = time.perf_counter()
+        journal.recover()
+        recover = time.perf_counter() - start
+        start = time.perf_counter()
+        journal.compact(wait=True)
+        compact = time.perf_counter() - start
+        journal.close()
+        logging.disable(logging.NOTSET)
+
+    print(f"Аренд: {args.rentals:,}, операций с журналом: {args.operations:,}")
+    print(f"  {'save_to_json после операции':<28} {full * 1e3:9.3f} мс/операция")
+    for title, seconds, syncs in results:
+        print(f"  {title:<28} {seconds * 1e3:9.3f} мс/операция ({full / seconds:,.0f}x), сбросов {syncs:,}")
+    print(f"  восстановление (снимок + {2 * args.operations:,} событий) {recover:.2f} с, свёртка {compact:.2f} с")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Накладные расходы логирования на горячих путях: до и после перехода на ленивые логгеры.
+
+Уровень INFO отключён (как без setup_logging), поэтому измеряется именно цена
+сообщений, которые не будут записаны. Запуск из каталога src:
+    python -m benchmarks.logging_overhead [--calls 200000]
+"""
+import argparse
+import logging
+import timeit
+
+from instruments import Guitar
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200_000)
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    guitar = Guitar("Fender", "new", 50.0, 6)
+    logger = logging.getLogger('Guitar')
+    name, days, cost = guitar.name, 10, 400.0
+    muted = Guitar("Gibson", "new", 50.0, 6)
+    muted.logging_enabled = False
+
+    cases = [
+        ("getLogger в каждом объекте (до)", lambda: logging.getLogger(Guitar.__name__)),
+        ("общий логгер класса (после)", lambda: guitar._logger),
+        ("f-строка, INFO выключен (до)",
+         lambda: logger.info(f"Рассчитана стоимость аренды гитары {name} на {days} дней: {cost}")),
+        ("ленивые аргументы, INFO выключен (после)",
+         lambda: logger.info("Рассчитана стоимость аренды гитары %s на %s дней: %s", name, days, cost)),
+        ("сеттер daily_rate, INFO выключен", lambda: setattr(guitar, 'daily_rate', 55.0)),
+        ("сеттер daily_rate, логирование объекта выключено", lambda: setattr(muted, 'daily_rate', 55.0)),
+    ]
+    for title, func in cases:
+        seconds = min(timeit.repeat(func, number=args.calls, repeat=3))
+        print(f"{title:<50} {seconds / args.calls * 1e9:8.1f} нс/вызов")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Память на объект для Accessory, Customer и Rental (tracemalloc) в сравнении с объектами на __dict__.
+
+Запуск из каталога src:
+    python -m benchmarks.memory_footprint [--count 1000000] [--rentals 200000]
+"""
+import argparse
+import contextlib
+import gc
+import os
+import tracemalloc
+from datetime import date, timedelta
+from uuid import uuid4
+
+from instruments import Guitar
+from rental import Accessory, Customer, Rental
+
+
+class LegacyAccessory:
+    """Прежнее представление аксессуара: атрибуты в __dict__ экземпляра."""
+
+    def __init__(self, name: str, cost: float):
+        self._accessory_id = uuid4()
+        self._name = name
+        self._cost = cost
+
+
+class LegacyCustomer:
+    """Прежнее представление клиента: атрибуты в __dict__ экземпляра."""
+
+    def __init__(self, name: str, email: str, phone=None, permissions=None):
+        self._customer_id = uuid4()
+        self._name = name
+        self._email = email
+        self._phone = phone
+        self._permissions = permissions or []
+
+
+def measure(factory, count: int) -> float:
+    """Возвращает средний объём памяти на объект в байтах."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(number) for number in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--rentals', type=int, default=200_000)
+    args = parser.parse_args()
+    permissions = ['can_rent']
+    customer = Customer("Клиент", "client@example.com", permissions=permissions)
+    guitar = Guitar("Fender", "new", 50.0, 6)
+    first_day = date(2000, 1, 1)
+
+    cases = [
+        ("Accessory (__dict__)", lambda n: LegacyAccessory("Чехол", 5.0), args.count),
+        ("Accessory (__slots__)", lambda n: Accessory("Чехол", 5.0), args.count),
+        ("Customer (__dict__)", lambda n: LegacyCustomer("Клиент", "client@example.com", permissions=permissions),
+         args.count),
+        ("Customer (__slots__)", lambda n: Customer("Клиент", "client@example.com", permissions=permissions),
+         args.count),
+        ("Rental (__slots__, с записью в реестре)",
+         lambda n: Rental(customer, guitar, first_day + timedelta(days=n), first_day + timedelta(days=n + 3)),
+         args.rentals),
+    ]
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        results = [(title, measure(factory, count), count) for title, factory, count in cases]
+    for title, per_object, count in results:
+        print(f"{title:<42} {count:>9,} шт. {per_object:8.1f} Б/объект, всего {per_object * count / 2 ** 20:8.1f} МБ")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Сохранение аренд в JSON: вложенные клиенты и инструменты против ссылок по ID.
+
+Сравниваются размер файла, время загрузки и число различных объектов клиентов
+после загрузки. Запуск из каталога src:
+    python -m benchmarks.normalized_json [--rentals 50000] [--customers 500]
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from instruments import Guitar
+from rental import Customer, Rental
+from utils.serialization import load_from_json, save_to_json
+
+
+def save_embedded(instruments: list, rentals: list, filename: str) -> None:
+    """Прежний формат: каждая аренда содержит полные словари клиента и инструмента."""
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump({'instruments': [inst.to_dict() for inst in instruments],
+                   'rentals': [rental.to_dict() for rental in rentals]}, f, ensure_ascii=False, indent=2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=50_000)
+    parser.add_argument('--customers', type=int, default=500)
+    args = parser.parse_args()
+    random.seed(42)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        customers = [Customer(f"Клиент {n}", f"client{n}@example.com", permissions=['can_rent'])
+                     for n in range(args.customers)]
+        instruments = [Guitar(f"Гитара {n}", 'new', 50.0, 6) for n in range(500)]
+        records = []
+        for _ in range(args.rentals):
+            start = date(2020, 1, 1) + timedelta(days=random.randrange(2000))
+            records.append((random.choice(customers), random.choice(instruments), start,
+                            start + timedelta(days=random.randrange(1, 30))))
+        rentals = Rental.bulk_create(records)
+
+        with tempfile.TemporaryDirectory() as directory:
+            results = []
+            for title, save in (("вложенные объекты", save_embedded), ("ссылки по ID", save_to_json)):
+                path = os.path.join(directory, 'rentals.json')
+                save(instruments, rentals, path)
+                size = os.path.getsize(path)
+                Rental._registry.clear()
+                start = time.perf_counter()
+                _, loaded = load_from_json(path)
+                seconds = time.perf_counter() - start
+                distinct = len({id(rental.customer) for rental in loaded})
+                results.append((title, size, seconds, distinct))
+
+    print(f"Аренд: {args.rentals:,}, клиентов: {args.customers:,}")
+    for title, size, seconds, distinct in results:
+        print(f"  {title:<18} {size / 2 ** 20:8.1f} МБ  загрузка {seconds:6.2f} с  "
+              f"объектов клиентов {distinct:,}")
+
+
+if __name__ == '__main__':
+    main()
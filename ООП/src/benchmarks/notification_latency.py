@@ -0,0 +1,65 @@
+"""Задержка создания аренды при синхронной и фоновой доставке уведомлений.
+
+Транспорт имитирует медленную внешнюю службу (email/SMS). Запуск из каталога src:
+    python -m benchmarks.notification_latency [--rentals 500] [--delay 0.002]
+"""
+import argparse
+import logging
+import time
+from datetime import date, timedelta
+
+from instruments import Guitar
+from rental import Customer, Rental
+from utils import FakeTransport, NotificationDispatcher, set_notification_dispatcher
+
+
+class _SyncDispatcher:
+    """Доставка прямо в вызывающем потоке, как при print() в notify."""
+
+    def __init__(self, transport: FakeTransport):
+        self.transport = transport
+
+    def submit(self, recipient: str, message: str) -> bool:
+        self.transport.send(recipient, [message])
+        return True
+
+
+def _create(count: int, customers, guitar) -> float:
+    start = date.today()
+    began = time.perf_counter()
+    for position in range(count):
+        Rental(customers[position % len(customers)], guitar, start, start + timedelta(days=3))
+    return time.perf_counter() - began
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=500)
+    parser.add_argument('--delay', type=float, default=0.002, help="время доставки одного пакета, с")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    customers = [Customer(f"Клиент {i}", f"client{i}@example.com", "+70000000000", ["can_rent"]) for i in range(20)]
+    guitar = Guitar("Fender", "new", 50.0, 6)
+
+    sync_transport = FakeTransport(delay=args.delay)
+    set_notification_dispatcher(_SyncDispatcher(sync_transport))
+    sync_seconds = _create(args.rentals, customers, guitar)
+
+    async_transport = FakeTransport(delay=args.delay)
+    dispatcher = NotificationDispatcher(async_transport)
+    set_notification_dispatcher(dispatcher)
+    async_seconds = _create(args.rentals, customers, guitar)
+    began = time.perf_counter()
+    dispatcher.close()
+    drain_seconds = time.perf_counter() - began
+    set_notification_dispatcher(None)
+
+    print(f"Аренд: {args.rentals:,}, доставка пакета: {args.delay * 1000:.1f} мс")
+    print(f"  синхронно        {sync_seconds / args.rentals * 1e6:9.1f} мкс/аренда, вызовов транспорта: {sync_transport.calls}")
+    print(f"  через диспетчер  {async_seconds / args.rentals * 1e6:9.1f} мкс/аренда, вызовов транспорта: {async_transport.calls}")
+    print(f"  досылка очереди  {drain_seconds:9.3f} с, доставлено: {dispatcher.delivered}, пакетов: {dispatcher.batches}")
+
+
+if __name__ == '__main__':
+    main()
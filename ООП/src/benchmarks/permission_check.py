@@ -0,0 +1,89 @@
+"""Накладные расходы check_permissions на вызов декорированного метода.
+
+Сравниваются: метод без декоратора, пустая обёртка (цена самого вызова через
+декоратор), прежний декоратор (hasattr + поиск в списке), декоратор с битовой
+маской и он же внутри permission_scope.
+Запуск из каталога src:
+    python -m benchmarks.permission_check [--calls 500000] [--permissions 20]
+"""
+import argparse
+import timeit
+from functools import wraps
+
+from rental import Customer
+from utils import PermissionDeniedError, check_permissions, permission_scope
+
+
+def legacy_check_permissions(required_permission: str):
+    """Прежняя реализация: hasattr и линейный поиск в списке на каждом вызове."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            # _permissions — те же имена, что раньше хранились списком в Customer.permissions
+            if not hasattr(self, 'customer') or required_permission not in self.customer._permissions:
+                raise PermissionDeniedError(required_permission)
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def passthrough(func):
+    """Обёртка без проверки: показывает цену вызова через декоратор."""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return func(self, *args, **kwargs)
+    return wrapper
+
+
+class _Subject:
+    __slots__ = ('_customer',)
+
+    def __init__(self, customer: Customer):
+        self._customer = customer
+
+    @property
+    def customer(self) -> Customer:
+        return self._customer
+
+    def plain(self) -> None:
+        pass
+
+    @passthrough
+    def wrapped(self) -> None:
+        pass
+
+    @legacy_check_permissions('can_rent')
+    def legacy(self) -> None:
+        pass
+
+    @check_permissions('can_rent')
+    def bitmask(self) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=500_000)
+    parser.add_argument('--permissions', type=int, default=20, help="разрешений у клиента ('can_rent' последнее)")
+    args = parser.parse_args()
+
+    permissions = [f"perm_{n}" for n in range(args.permissions - 1)] + ['can_rent']
+    customer = Customer("Клиент", "client@example.com", permissions=permissions)
+    subject = _Subject(customer)
+
+    cases = [
+        ("без декоратора", subject.plain),
+        ("пустая обёртка", subject.wrapped),
+        ("прежний декоратор (список)", subject.legacy),
+        ("битовая маска", subject.bitmask),
+    ]
+    for title, func in cases:
+        seconds = min(timeit.repeat(func, number=args.calls, repeat=5))
+        print(f"{title:<36} {seconds / args.calls * 1e9:8.1f} нс/вызов")
+    with permission_scope(customer, 'can_rent'):
+        seconds = min(timeit.repeat(subject.bitmask, number=args.calls, repeat=5))
+    print(f"{'битовая маска в permission_scope':<36} {seconds / args.calls * 1e9:8.1f} нс/вызов")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Сравнение поиска аренды: линейный просмотр списка против RentalRegistry.
+
+Запуск из каталога src:
+    python -m benchmarks.registry_lookup [--sizes 10000 100000 1000000]
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+from rental.registry import RentalRegistry
+
+
+def make_rentals(count: int, customers: int = 1000, instruments: int = 5000):
+    """Создаёт лёгкие записи с теми же атрибутами, что читает реестр."""
+    customer_pool = [SimpleNamespace(customer_id=uuid4()) for _ in range(customers)]
+    instrument_pool = [SimpleNamespace(instrument_id=uuid4()) for _ in range(instruments)]
+    first_day = date(2020, 1, 1)
+    rentals = []
+    for _ in range(count):
+        start = first_day + timedelta(days=random.randrange(2000))
+        rentals.append(SimpleNamespace(
+            rental_id=uuid4(),
+            customer=random.choice(customer_pool),
+            instrument=random.choice(instrument_pool),
+            start_date=start,
+            end_date=start + timedelta(days=random.randrange(1, 30)),
+        ))
+    return rentals
+
+
+def find_by_scan(rentals, rental_id):
+    """Прежний алгоритм Rental.find_rental_by_id."""
+    for rental in rentals:
+        if rental.rental_id == rental_id:
+            return rental
+    raise LookupError(rental_id)
+
+
+def per_call(func, args_list) -> float:
+    start = time.perf_counter()
+    for args in args_list:
+        func(*args)
+    return (time.perf_counter() - start) / len(args_list)
+
+
+def run(size: int) -> None:
+    rentals = make_rentals(size)
+    registry = RentalRegistry()
+    start = time.perf_counter()
+    registry.add_many(rentals)
+    build = time.perf_counter() - start
+
+    targets = [random.choice(rentals) for _ in range(1000)]
+    scan_targets = targets[:max(10, 200_000 // size)]
+    scan = per_call(lambda r: find_by_scan(rentals, r.rental_id), [(r,) for r in scan_targets])
+    by_id = per_call(lambda r: registry.get(r.rental_id), [(r,) for r in targets])
+    by_customer = per_call(lambda r: registry.by_customer(r.customer.customer_id), [(r,) for r in targets])
+    by_date = per_call(lambda r: registry.by_start_date(r.start_date, r.start_date + timedelta(days=7)),
+                       [(r,) for r in targets])
+
+    print(f"{size:>9,} аренд | построение {build:7.3f} с | "
+          f"скан {scan * 1e6:11.1f} мкс | по id {by_id * 1e6:6.2f} мкс | "
+          f"по клиенту {by_customer * 1e6:7.2f} мкс | по датам (7 дн.) {by_date * 1e6:8.2f} мкс | "
+          f"ускорение {scan / by_id:,.0f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    random.seed(42)
+    for size in args.sizes:
+        run(size)
+
+
+if __name__ == '__main__':
+    main()
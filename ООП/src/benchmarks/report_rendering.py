@@ -0,0 +1,101 @@
+"""Пропускная способность отчётов: прежний generate_report против шаблона, кэша и потоковой записи.
+
+Сравниваются поштучная генерация (прежняя реализация, первый и повторный
+вызов generate_report, render_report из кэша) и пакетная выгрузка в
+io.StringIO и в файл. Запуск из каталога src:
+    python -m benchmarks.report_rendering [--rentals 100000]
+"""
+import argparse
+import contextlib
+import io
+import logging
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+
+from instruments import Guitar, Piano, Violin
+from rental import Accessory, Customer, Rental, stream_reports
+
+
+def legacy_generate_report(rental: Rental) -> str:
+    """Прежняя реализация Rental.generate_report: f-строки, join по аксессуарам и лог на каждый вызов."""
+    accessories_str = ", ".join(str(acc) for acc in rental.accessories) or "нет аксессуаров"
+    report = (
+        f"Отчет по аренде #{rental.rental_id}:\n"
+        f"Клиент: {rental.customer.name}\n"
+        f"Инструмент: {rental.instrument.name}\n"
+        f"Период: {rental.start_date} - {rental.end_date}\n"
+        f"Аксессуары: {accessories_str}\n"
+        f"Общая стоимость: {rental.total_cost:.2f}"
+    )
+    Rental._logger.info("Сгенерирован отчет для аренды #%s", rental.rental_id)
+    return report
+
+
+def make_rentals(count: int) -> list:
+    customers = [Customer(f"Клиент {n}", f"client{n}@example.com", permissions=['can_rent']) for n in range(500)]
+    instruments = [Guitar(f"Гитара {n}", 'new', 50.0, 6) for n in range(300)]
+    instruments += [Piano(f"Пианино {n}", 'used', 100.0, 88) for n in range(100)]
+    instruments += [Violin(f"Скрипка {n}", 'new', 80.0, True) for n in range(100)]
+    accessories = [Accessory(f"Аксессуар {n}", 5.0 + n) for n in range(20)]
+    records = []
+    for _ in range(count):
+        start = date(2020, 1, 1) + timedelta(days=random.randrange(2000))
+        records.append((random.choice(customers), random.choice(instruments), start,
+                        start + timedelta(days=random.randrange(1, 30))))
+    rentals = Rental.bulk_create(records, notify=False)
+    for rental in rentals:
+        for accessory in random.sample(accessories, random.randrange(4)):
+            rental._put_accessory(accessory)
+        rental.calculate_total()
+    return rentals
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=100_000)
+    args = parser.parse_args()
+    random.seed(42)
+    logging.getLogger().setLevel(logging.WARNING)  # Вызов лога остаётся, запись в обработчики — нет
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        rentals = make_rentals(args.rentals)
+    instruments = [rental.instrument for rental in rentals]
+
+    def to_file(rentals_: list, path: str) -> None:
+        Rental.write_reports(rentals_, path, workers=1)
+
+    def legacy_to_file(path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n\n".join(legacy_generate_report(rental) for rental in rentals))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'reports.txt')
+        rows = [
+            ("прежний generate_report", timed(lambda: [legacy_generate_report(r) for r in rentals])),
+            ("generate_report, первый вызов", timed(lambda: [r.generate_report() for r in rentals])),
+            ("generate_report, повторный", timed(lambda: [r.generate_report() for r in rentals])),
+            ("render_report из кэша", timed(lambda: [r.render_report() for r in rentals])),
+            ("отчёт инструмента", timed(lambda: [i.generate_report() for i in instruments])),
+            ("прежняя выгрузка в файл (join)", timed(lambda: legacy_to_file(path))),
+            ("write_reports в файл", timed(lambda: to_file(rentals, path))),
+            ("stream_reports в io.StringIO", timed(lambda: stream_reports(rentals, io.StringIO()))),
+        ]
+        for rental in rentals:
+            rental._report_cache = None
+        rows.append(("write_reports в файл, без кэша", timed(lambda: to_file(rentals, path))))
+
+    print(f"Отчётов: {args.rentals:,}")
+    for title, seconds in rows:
+        print(f"  {title:<34} {seconds:7.3f} с  {args.rentals / seconds:>12,.0f} отчётов/с")
+
+
+if __name__ == '__main__':
+    main()
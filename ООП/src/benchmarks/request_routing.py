@@ -0,0 +1,53 @@
+"""Маршрутизация запросов: обход цепочки обработчиков против RequestRouter.
+
+В цепочку перед Admin добавляются дополнительные уровни менеджеров с растущими
+порогами сумм. Запуск из каталога src:
+    python -m benchmarks.request_routing [--requests 200000] [--tiers 0 5 20]
+"""
+import argparse
+import random
+import sys
+import time
+
+from rental import Admin, Manager, Operator, RentalRequest, RequestRouter, RequestType
+
+
+def build_chain(tiers: int) -> Operator:
+    handler = Admin()
+    for tier in range(tiers, 0, -1):
+        handler = Manager(successor=handler, max_amount=100.0 * (tier + 1))
+    return Operator(successor=Manager(successor=handler, max_amount=100.0))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=200_000)
+    parser.add_argument('--tiers', type=int, nargs='+', default=[0, 5, 20])
+    args = parser.parse_args()
+    sys.setrecursionlimit(10_000)
+    rng = random.Random(1)
+    types = list(RequestType)
+    requests = [
+        RentalRequest(rng.choice(types), rng.uniform(0, 3000), "Запрос")
+        for _ in range(args.requests)
+    ]
+
+    print(f"Запросов: {args.requests:,}")
+    for tiers in args.tiers:
+        chain = build_chain(tiers)
+        start = time.perf_counter()
+        expected = [chain.handle_request(request) for request in requests]
+        chain_seconds = time.perf_counter() - start
+
+        router = RequestRouter(chain)
+        start = time.perf_counter()
+        results = router.handle_many(requests)
+        router_seconds = time.perf_counter() - start
+        assert results == expected, "Маршрутизатор разошёлся с цепочкой"
+        print(f"  уровней {tiers + 3:>3}: цепочка {args.requests / chain_seconds:>10,.0f} запр/с, "
+              f"RequestRouter {args.requests / router_seconds:>10,.0f} запр/с "
+              f"({chain_seconds / router_seconds:4.1f}x), отклонено {router.rejected:,}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Время запуска и пиковая память: load_from_json против бинарного снимка через mmap.
+
+Каждый замер выполняется в отдельном процессе, чтобы пиковый RSS не смешивался.
+Запуск из каталога src:
+    python -m benchmarks.snapshot_startup [--rentals 20000]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from uuid import uuid4
+
+
+def make_dataset(rentals: int, customers: int, instruments: int) -> dict:
+    """Создаёт словари в формате save_to_json без создания доменных объектов."""
+    kinds = [('guitar', 'number_of_strings', lambda: random.choice([6, 7, 12])),
+             ('piano', 'key_count', lambda: random.choice([61, 76, 88])),
+             ('violin', 'bow_included', lambda: random.random() < 0.5)]
+    instrument_dicts = []
+    for number in range(instruments):
+        kind, attribute, value = random.choice(kinds)
+        instrument_dicts.append({
+            'type': kind, 'instrument_id': str(uuid4()), 'name': f"{kind} #{number}",
+            'condition': random.choice(['new', 'used', 'refurbished']),
+            'daily_rate': float(random.randrange(20, 200)), 'is_available': True, attribute: value(),
+        })
+    customer_dicts = [{
+        'customer_id': str(uuid4()), 'name': f"Клиент {number}", 'email': f"client{number}@example.com",
+        'phone': None, 'permissions': ['can_rent', 'can_modify_rental'],
+    } for number in range(customers)]
+    rental_dicts = []
+    for _ in range(rentals):
+        start = date(2020, 1, 1) + timedelta(days=random.randrange(2000))
+        rental_dicts.append({
+            'rental_id': str(uuid4()), 'customer': random.choice(customer_dicts),
+            'instrument': random.choice(instrument_dicts), 'start_date': start.isoformat(),
+            'end_date': (start + timedelta(days=random.randrange(1, 30))).isoformat(),
+            'accessories': [{'accessory_id': str(uuid4()), 'name': 'Чехол', 'cost': 5.0}],
+            'total_cost': 0.0,
+        })
+    return {'instruments': instrument_dicts, 'rentals': rental_dicts}
+
+
+def peak_rss_kb() -> int:
+    """Пиковый RSS процесса в КБ; ru_maxrss на Linux наследуется от родителя, поэтому сначала VmHWM."""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def child(mode: str, path: str) -> None:
+    """Замер внутри дочернего процесса: печатает JSON с временем и пиковым RSS."""
+    baseline = peak_rss_kb()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == 'json':
+            from utils.serialization import load_from_json
+            _, rentals = load_from_json(path)
+            rentals[len(rentals) // 2].generate_report()
+        else:
+            from utils.snapshot import RentalSnapshot
+            snapshot = RentalSnapshot(path)
+            snapshot.rentals[len(snapshot.rentals) // 2].generate_report()
+    elapsed = time.perf_counter() - start
+    peak = peak_rss_kb()
+    print(json.dumps({'seconds': elapsed, 'peak_kb': peak, 'delta_kb': peak - baseline}))
+
+
+def measure(mode: str, path: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.snapshot_startup', '--child', mode, path],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rentals', type=int, default=20_000)
+    parser.add_argument('--customers', type=int, default=2_000)
+    parser.add_argument('--instruments', type=int, default=5_000)
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+
+    from utils.snapshot import convert_json_to_snapshot
+    random.seed(42)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, 'rental_data.json')
+        snapshot_path = os.path.join(directory, 'rental_data.snap')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(make_dataset(args.rentals, args.customers, args.instruments), f, ensure_ascii=False, indent=2)
+        convert_json_to_snapshot(json_path, snapshot_path)
+        print(f"Аренд: {args.rentals:,}; JSON {os.path.getsize(json_path) / 1e6:.1f} МБ, "
+              f"снимок {os.path.getsize(snapshot_path) / 1e6:.1f} МБ")
+        for mode, path in (('json', json_path), ('snapshot', snapshot_path)):
+            result = measure(mode, path)
+            print(f"{mode:>9}: запуск {result['seconds'] * 1000:9.1f} мс, "
+                  f"пиковый RSS {result['peak_kb'] / 1024:7.1f} МБ (+{result['delta_kb'] / 1024:.1f} МБ)")
+
+
+if __name__ == '__main__':
+    main()
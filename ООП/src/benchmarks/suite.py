@@ -0,0 +1,234 @@
+"""Набор бенчмарков предметной области аренды с результатами в JSON.
+
+Измеряются создание инструментов и аренд, calculate_total, поиск аренды по
+ID, save_to_json/load_from_json, цепочка Operator -> Manager -> Admin и
+RequestRouter, отчёты. Для каждого бенчмарка выводятся операций в секунду,
+задержки p50/p99 и пик памяти; --output сохраняет результаты в JSON,
+--baseline сравнивает их с результатами другого коммита.
+Запуск из каталога src:
+    python -m benchmarks.suite [--scale small|medium|large] [--output results.json]
+        [--baseline baseline.json] [--threshold 0.10] [--only rental_create ...]
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from instruments import InstrumentMeta
+from rental import Admin, Manager, Operator, Rental, RequestRouter
+from utils.serialization import load_from_json, save_to_json
+
+from .datagen import SCALES, Dataset
+from .harness import BenchmarkResult, measure
+
+# Бенчмарк: (имя, функция (данные, масштаб, рабочий каталог) -> (операция, число вызовов, подготовка))
+Case = Tuple[str, Callable[[Dataset, int, str], Tuple[Callable[[], object], int, Optional[Callable[[], None]]]]]
+
+
+def _cycle(items: list) -> Callable[[], object]:
+    """Возвращает функцию, по кругу выдающую элементы списка."""
+    return itertools.cycle(items).__next__
+
+
+def _instrument_create(data: Dataset, size: int, workdir: str):
+    rows = itertools.cycle([(f"Гитара {n}", 'new', 50.0, 6) for n in range(1000)]).__next__
+    return lambda: InstrumentMeta.create_instrument('guitar', *rows()), size, None
+
+
+def _rental_create(data: Dataset, size: int, workdir: str):
+    customer, instrument = _cycle(data.customers), _cycle(data.instruments)
+    start = date(2024, 1, 1)
+    end = start + timedelta(days=7)
+    return lambda: Rental(customer(), instrument(), start, end), size, None
+
+
+def _calculate_total(data: Dataset, size: int, workdir: str):
+    rental = _cycle(data.rentals)
+    return lambda: rental().calculate_total(), size, None
+
+
+def _calculate_total_repriced(data: Dataset, size: int, workdir: str):
+    """calculate_total после изменения тарифа инструмента: каждый вызов пересчитывает стоимость."""
+    pairs = _cycle([(rental, rental.instrument.daily_rate) for rental in data.rentals])
+
+    def operation():
+        rental, rate = pairs()
+        rental.instrument.daily_rate = rate
+        rental.calculate_total()
+    return operation, size, None
+
+
+def _find_rental_by_id(data: Dataset, size: int, workdir: str):
+    rental_id = _cycle([rental.rental_id for rental in data.rentals])
+    return lambda: Rental.find_rental_by_id(rental_id()), size, None
+
+
+def _save_to_json(data: Dataset, size: int, workdir: str):
+    path = os.path.join(workdir, 'rental_data.json')
+    return lambda: save_to_json(data.instruments, data.rentals, path), _whole_dataset_runs(size), None
+
+
+def _load_from_json(data: Dataset, size: int, workdir: str):
+    path = os.path.join(workdir, 'rental_data.json')
+    save_to_json(data.instruments, data.rentals, path)
+    return lambda: load_from_json(path), _whole_dataset_runs(size), None
+
+
+def _handler_chain(data: Dataset, size: int, workdir: str):
+    chain = Operator(successor=Manager(successor=Admin()))
+    request = _cycle(data.requests)
+    return lambda: chain.handle_request(request()), size, None
+
+
+def _request_router(data: Dataset, size: int, workdir: str):
+    router = RequestRouter(Operator(successor=Manager(successor=Admin())))
+    request = _cycle(data.requests)
+    return lambda: router.handle(request()), size, None
+
+
+def _generate_report(data: Dataset, size: int, workdir: str):
+    rental = _cycle(data.rentals)
+
+    def reset():
+        for item in data.rentals:
+            item._report_cache = None
+    return lambda: rental().generate_report(), min(size, len(data.rentals)), reset
+
+
+def _whole_dataset_runs(size: int) -> int:
+    """Количество прогонов для операций над всем набором данных."""
+    return max(3, min(20, 200_000 // size))
+
+
+CASES: List[Case] = [
+    ('instrument_create', _instrument_create),
+    ('rental_create', _rental_create),
+    ('calculate_total', _calculate_total),
+    ('calculate_total_repriced', _calculate_total_repriced),
+    ('find_rental_by_id', _find_rental_by_id),
+    ('save_to_json', _save_to_json),
+    ('load_from_json', _load_from_json),
+    ('handler_chain', _handler_chain),
+    ('request_router', _request_router),
+    ('generate_report', _generate_report),
+]
+
+
+def run_suite(scale: str, seed: int = 42, only: Optional[List[str]] = None, memory: bool = True) -> List[BenchmarkResult]:
+    """Создаёт данные масштаба scale и выполняет бенчмарки.
+
+    Args:
+        scale: Имя масштаба из SCALES.
+        seed: Начальное значение генератора данных.
+        only: Имена бенчмарков для запуска (по умолчанию — все).
+        memory: Измерять ли пик памяти.
+
+    Returns:
+        Результаты в порядке CASES.
+    """
+    size = SCALES[scale]
+    results = []
+    with tempfile.TemporaryDirectory(prefix='rental-bench-') as workdir:
+        for name, prepare in CASES:
+            if only and name not in only:
+                continue
+            Rental._registry.clear()  # Каждый бенчмарк получает свежие данные и пустой реестр
+            data = Dataset(size, seed)
+            operation, operations, setup = prepare(data, size, workdir)
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                results.append(measure(name, operation, operations, warmup=min(100, operations // 10),
+                                       memory=memory, setup=setup))
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[Dict], baseline: List[Dict], threshold: float) -> List[str]:
+    """Сравнивает ops/s с базовыми результатами.
+
+    Args:
+        results: Текущие результаты (BenchmarkResult.to_dict()).
+        baseline: Базовые результаты.
+        threshold: Допустимое относительное падение ops/s, например 0.10.
+
+    Returns:
+        Имена бенчмарков, замедлившихся сильнее порога.
+    """
+    previous = {item['name']: item for item in baseline}
+    regressions = []
+    print(f"\n{'бенчмарк':<26} {'было оп/с':>14} {'стало оп/с':>14} {'изменение':>10}")
+    for item in results:
+        before = previous.get(item['name'])
+        if before is None:
+            continue
+        change = item['ops_per_sec'] / before['ops_per_sec'] - 1
+        mark = ''
+        if change < -threshold:
+            regressions.append(item['name'])
+            mark = '  РЕГРЕССИЯ'
+        print(f"{item['name']:<26} {before['ops_per_sec']:>14,.0f} {item['ops_per_sec']:>14,.0f} {change:>+9.1%}{mark}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scale', choices=list(SCALES), default='small')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', nargs='+', choices=[name for name, _ in CASES])
+    parser.add_argument('--no-memory', action='store_true', help="не измерять пик памяти (быстрее)")
+    parser.add_argument('--output', help="файл для результатов в JSON")
+    parser.add_argument('--baseline', help="JSON с результатами для сравнения")
+    parser.add_argument('--threshold', type=float, default=0.10, help="допустимое падение ops/s")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    started = time.time()
+    results = run_suite(args.scale, args.seed, args.only, not args.no_memory)
+    print(f"Масштаб: {args.scale} ({SCALES[args.scale]:,} аренд), Python {platform.python_version()}")
+    print(f"{'бенчмарк':<26} {'оп/с':>14} {'p50, мкс':>10} {'p99, мкс':>10} {'пик, КиБ':>10}")
+    for result in results:
+        print(f"{result.name:<26} {result.ops_per_sec:>14,.0f} {result.p50_us:>10.2f} "
+              f"{result.p99_us:>10.2f} {result.peak_kib:>10,.0f}")
+
+    report = {
+        'scale': args.scale,
+        'rentals': SCALES[args.scale],
+        'seed': args.seed,
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(started)),
+        'results': [result.to_dict() for result in results],
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nРезультаты записаны в {args.output}")
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('scale') != args.scale:
+            print(f"Внимание: базовые результаты получены на масштабе {baseline.get('scale')}")
+        if compare(report['results'], baseline['results'], args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
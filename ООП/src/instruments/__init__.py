@@ -1,4 +1,6 @@
 from .musical_instrument import MusicalInstrument, InstrumentMeta
 from .guitar import Guitar
 from .piano import Piano
-from .violin import Violin
\ No newline at end of file
+from .violin import Violin
+from .inventory import InstrumentInventory
+from .pricing import quote_batch, quote_catalog
@@ -1,13 +1,17 @@
 from .musical_instrument import MusicalInstrument
-from utils import NotificationMixin
+from .pricing import LONG_RENTAL_DAYS, LONG_RENTAL_DISCOUNT
+from utils import NotificationMixin, cache_rental_cost
 from typing import Optional, Dict
 from uuid import UUID
-import logging
 
 
 class Guitar(MusicalInstrument, NotificationMixin):
     """Класс для представления гитары, наследуется от MusicalInstrument."""
 
+    __slots__ = ('_number_of_strings',)
+
+    _REPORT_TEMPLATE = "Отчет: Гитара {0}, Состояние: {1}, Струн: {2}".format  # Шаблон, разобранный один раз
+
     def __init__(self, name: str, condition: str, daily_rate: float, number_of_strings: int):
         """Инициализирует объект гитары.
 
@@ -22,12 +26,11 @@ class Guitar(MusicalInstrument, NotificationMixin):
             InvalidInstrumentError: Если параметры недопустимы.
         """
         super().__init__(name, condition, daily_rate)
-        self._logger = logging.getLogger(self.__class__.__name__)
         if number_of_strings < 4 or number_of_strings > 12:
             raise ValueError("Количество струн должно быть от 4 до 12")
         self._number_of_strings: int = number_of_strings
-        self.is_available = True  # Добавлено для совместимости с Rentable
-        self._logger.info(f"Создана гитара: {name}")
+        self._is_available = True  # Не через сеттер: создание инструмента не журналируется
+        self._logger.info("Создана гитара: %s", name)
 
     @property
     def number_of_strings(self) -> int:
@@ -38,23 +41,28 @@ class Guitar(MusicalInstrument, NotificationMixin):
         if value < 4 or value > 12:
             raise ValueError("Количество струн должно быть от 4 до 12")
         self._number_of_strings = value
-        self._logger.info(f"Изменено количество струн на: {value}")
+        self._journal('instrument_updated')
+        self._logger.info("Изменено количество струн на: %s", value)
 
     def rent_instrument(self) -> None:
-        if not self.is_available:
+        if not self.try_reserve():
             raise ValueError(f"Гитара {self.name} уже арендована")
-        self.is_available = False
-        self._logger.info(f"Гитара {self.name} арендована")
+        self._logger.info("Гитара %s арендована", self.name)
 
+    @cache_rental_cost
     def calculate_rental_cost(self, days: int) -> float:
-        base_cost = self.daily_rate * days
-        if days > 7:
-            base_cost *= 0.8  # Скидка 20% за аренду более 7 дней
-        self._logger.info(f"Рассчитана стоимость аренды гитары {self.name} на {days} дней: {base_cost}")
+        base_cost = self._price(days)
+        self._logger.info("Рассчитана стоимость аренды гитары %s на %s дней: %s", self.name, days, base_cost)
+        return base_cost
+
+    def _price(self, days: int) -> float:
+        base_cost = self._daily_rate * days
+        if days > LONG_RENTAL_DAYS:
+            base_cost *= LONG_RENTAL_DISCOUNT  # Скидка 20% за аренду более 7 дней
         return base_cost
 
     def generate_report(self) -> str:
-        return f"Отчет: Гитара {self.name}, Состояние: {self.condition}, Струн: {self._number_of_strings}"
+        return self._REPORT_TEMPLATE(self._name, self._condition, self._number_of_strings)
 
     def to_dict(self) -> Dict:
         return {
@@ -74,7 +82,7 @@ class Guitar(MusicalInstrument, NotificationMixin):
             condition=data['condition'],
             daily_rate=data['daily_rate'],
             number_of_strings=data['number_of_strings']
-        )
+        )._restore_state(data)
 
     def __str__(self) -> str:
         return f"Гитара: {self.name}, Состояние: {self.condition}, Струн: {self._number_of_strings}, Доступна: {self.is_available}"
@@ -0,0 +1,117 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+from uuid import UUID
+from .musical_instrument import MusicalInstrument
+
+
+class InstrumentInventory:
+    """Инвентарь инструментов: один общий объект на каждый instrument_id.
+
+    Поиск по идентификатору выполняется за O(1), выборка по типу — за O(k),
+    где k — число инструментов этого типа. При загрузке данных инвентарь
+    служит картой идентичности: инструмент, встречающийся в нескольких
+    записях, восстанавливается один раз.
+    """
+
+    def __init__(self, instruments: Iterable[MusicalInstrument] = ()):
+        """Инициализирует инвентарь.
+
+        Args:
+            instruments: Начальные инструменты.
+        """
+        self._by_id: Dict[UUID, MusicalInstrument] = {}
+        self._by_text: Dict[str, MusicalInstrument] = {}  # Тот же индекс по строковому ID из сериализованных данных
+        self._by_type: Dict[str, Dict[UUID, MusicalInstrument]] = {}
+        self.add_many(instruments)
+
+    def add(self, instrument: MusicalInstrument) -> MusicalInstrument:
+        """Добавляет инструмент в инвентарь.
+
+        Args:
+            instrument: Инструмент.
+
+        Returns:
+            Инструмент инвентаря с тем же ID (уже зарегистрированный или переданный).
+        """
+        existing = self._by_id.get(instrument.instrument_id)
+        if existing is not None:
+            return existing
+        self._by_id[instrument.instrument_id] = instrument
+        self._by_text[str(instrument.instrument_id)] = instrument
+        self._by_type.setdefault(type(instrument).__name__.lower(), {})[instrument.instrument_id] = instrument
+        return instrument
+
+    def add_many(self, instruments: Iterable[MusicalInstrument]) -> List[MusicalInstrument]:
+        """Добавляет пакет инструментов.
+
+        Args:
+            instruments: Инструменты.
+
+        Returns:
+            Инструменты инвентаря в порядке переданных.
+        """
+        return [self.add(instrument) for instrument in instruments]
+
+    def intern(self, data: Dict) -> MusicalInstrument:
+        """Возвращает инструмент инвентаря для словаря, восстанавливая его при первом обращении.
+
+        Если инструмент с таким instrument_id уже есть, остальные поля словаря
+        не сравниваются: действует первая зарегистрированная запись. Подходит
+        для снимков, где каждый инструмент записан один раз; для файлов с
+        дозаписью используйте update().
+
+        Args:
+            data: Словарь в формате MusicalInstrument.to_dict().
+
+        Returns:
+            Инструмент инвентаря.
+        """
+        instrument = self._by_text.get(data.get('instrument_id'))
+        if instrument is None:
+            instrument = self.add(MusicalInstrument.from_dict(data))
+        return instrument
+
+    def update(self, data: Dict) -> MusicalInstrument:
+        """Как intern(), но действует последняя запись: для журналов и логов с дозаписью.
+
+        Если инструмент с таким instrument_id уже есть, его состояние
+        заменяется состоянием из словаря; объект инвентаря остаётся тем же.
+
+        Args:
+            data: Словарь в формате MusicalInstrument.to_dict().
+
+        Returns:
+            Инструмент инвентаря.
+        """
+        instrument = self._by_text.get(data.get('instrument_id'))
+        if instrument is None:
+            return self.add(MusicalInstrument.from_dict(data))
+        if type(instrument).__name__.lower() == data.get('type', '').lower():
+            instrument._refresh_from(data)
+            return instrument
+        replacement = MusicalInstrument.from_dict(data)  # Тип сменился: объект заменяется
+        del self._by_type[type(instrument).__name__.lower()][instrument.instrument_id]
+        del self._by_id[instrument.instrument_id]
+        return self.add(replacement)
+
+    def get(self, instrument_id: Union[UUID, str]) -> Optional[MusicalInstrument]:
+        """Возвращает инструмент по ID (UUID или его строковая запись) или None."""
+        if isinstance(instrument_id, str):
+            return self._by_text.get(instrument_id)
+        return self._by_id.get(instrument_id)
+
+    def by_type(self, instrument_type: str) -> List[MusicalInstrument]:
+        """Возвращает инструменты указанного типа (например, 'guitar')."""
+        return list(self._by_type.get(instrument_type.lower(), {}).values())
+
+    def identity_map(self) -> Dict[str, MusicalInstrument]:
+        """Возвращает словарь {строковый instrument_id: инструмент} для Rental.bulk_from_dict."""
+        return dict(self._by_text)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, instrument_id: object) -> bool:
+        return instrument_id in self._by_id or instrument_id in self._by_text
+
+    def __iter__(self) -> Iterator[MusicalInstrument]:
+        return iter(list(self._by_id.values()))
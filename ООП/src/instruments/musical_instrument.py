@@ -1,12 +1,16 @@
 from abc import ABC, ABCMeta, abstractmethod
-from typing import Optional, Type, Dict
+from typing import Optional, Type, Dict, Iterable, List, Mapping, Sequence, Union
 from uuid import UUID, uuid4
-from utils import InvalidInstrumentError
-import logging
+from utils import InvalidInstrumentError, LoggingMixin, StripedLock, get_journal
 
 
 class InstrumentMeta(ABCMeta):
-    """Метакласс для регистрации подклассов музыкальных инструментов."""
+    """Метакласс для регистрации подклассов музыкальных инструментов.
+
+    Реестр метакласса — единственный источник классов инструментов: его
+    используют create_instrument, create_many, MusicalInstrument.from_dict и
+    utils.InstrumentFactory. Ключи — имена классов в нижнем регистре.
+    """
 
     _registry: Dict[str, type] = {}  # Реестр подклассов
 
@@ -36,7 +40,9 @@ class InstrumentMeta(ABCMeta):
         Returns:
             Класс инструмента или None, если тип не найден.
         """
-        return mcs._registry.get(instrument_type.lower())
+        registry = mcs._registry
+        cls = registry.get(instrument_type)  # Типы из данных обычно уже в нижнем регистре
+        return cls if cls is not None else registry.get(instrument_type.lower())
 
     @classmethod
     def create_instrument(mcs, instrument_type: str, *args, **kwargs) -> 'MusicalInstrument':
@@ -58,17 +64,50 @@ class InstrumentMeta(ABCMeta):
             raise ValueError(f"Инструмент типа '{instrument_type}' не зарегистрирован")
         return cls(*args, **kwargs)
 
+    @classmethod
+    def create_many(
+            mcs,
+            instrument_type: str,
+            rows: Iterable[Union[Sequence, Mapping]]
+    ) -> List['MusicalInstrument']:
+        """Создаёт пакет инструментов одного типа, определяя класс один раз.
+
+        Args:
+            instrument_type: Тип инструмента.
+            rows: Аргументы конструктора для каждого инструмента: кортежи
+                позиционных аргументов или словари именованных.
+
+        Returns:
+            Список инструментов в порядке строк.
+
+        Raises:
+            ValueError: Если тип инструмента не зарегистрирован.
+        """
+        cls = mcs.get_class(instrument_type)
+        if not cls:
+            raise ValueError(f"Инструмент типа '{instrument_type}' не зарегистрирован")
+        return [cls(**row) if isinstance(row, Mapping) else cls(*row) for row in rows]
+
     @classmethod
     def get_registered_classes(mcs) -> Dict[str, type]:
         return mcs._registry
 
 
-class MusicalInstrument(ABC, metaclass=InstrumentMeta):
+class MusicalInstrument(ABC, LoggingMixin, metaclass=InstrumentMeta):
     """Абстрактный базовый класс для музыкальных инструментов."""
 
+    __slots__ = (
+        '_instrument_id', '_name', '_condition', '_daily_rate', '_is_available',
+        '_cost_cache', '_pricing_version', '_logging_muted'
+    )
+
     # Порядок состояний для сравнения
     _CONDITION_ORDER = {'new': 2, 'refurbished': 1, 'used': 0}
 
+    _RUNTIME_SLOTS = frozenset(('_cost_cache', '_pricing_version', '_logging_muted'))  # Не входят в to_dict()
+
+    _availability_locks = StripedLock()  # Блокировки флага доступности по instrument_id
+
     def __init__(self, name: str, condition: str, daily_rate: float):
         """Инициализирует музыкальный инструмент.
 
@@ -80,7 +119,7 @@ class MusicalInstrument(ABC, metaclass=InstrumentMeta):
         Raises:
             InvalidInstrumentError: Если параметры недопустимы.
         """
-        self._logger = logging.getLogger(self.__class__.__name__)
+        self._logging_muted: bool = False
         self._instrument_id: UUID = uuid4()
         if not name.strip():
             raise InvalidInstrumentError("Название инструмента не может быть пустым")
@@ -92,7 +131,9 @@ class MusicalInstrument(ABC, metaclass=InstrumentMeta):
         self._condition: str = condition.lower()
         self._daily_rate: float = daily_rate
         self._is_available: bool = True
-        self._logger.info(f"Создан инструмент: {name}")
+        self._cost_cache: Dict[int, float] = {}  # Кэш стоимости аренды по сроку
+        self._pricing_version: int = 0
+        self._logger.info("Создан инструмент: %s", name)
 
     @property
     def instrument_id(self) -> UUID:
@@ -114,12 +155,29 @@ class MusicalInstrument(ABC, metaclass=InstrumentMeta):
     def is_available(self) -> bool:
         return self._is_available
 
+    @property
+    def pricing_version(self) -> int:
+        """Номер версии тарифных параметров; растёт при каждом их изменении."""
+        return self._pricing_version
+
+    def _journal(self, event: str) -> None:
+        """Записывает изменение инструмента в журнал, если он назначен (см. utils.set_journal)."""
+        journal = get_journal()
+        if journal is not None:
+            journal.instrument_changed(event, self)
+
+    def _invalidate_pricing(self) -> None:
+        """Сбрасывает кэш стоимости аренды после изменения тарифных параметров."""
+        self._cost_cache.clear()
+        self._pricing_version += 1
+
     @name.setter
     def name(self, value: str) -> None:
         if not value.strip():
             raise InvalidInstrumentError("Название инструмента не может быть пустым")
         self._name = value
-        self._logger.info(f"Изменено название инструмента на: {value}")
+        self._journal('instrument_updated')
+        self._logger.info("Изменено название инструмента на: %s", value)
 
     @condition.setter
     def condition(self, value: str) -> None:
@@ -127,38 +185,132 @@ class MusicalInstrument(ABC, metaclass=InstrumentMeta):
         if value.lower() not in valid_conditions:
             raise InvalidInstrumentError(f"Состояние должно быть одним из: {valid_conditions}")
         self._condition = value.lower()
-        self._logger.info(f"Изменено состояние инструмента на: {value}")
+        self._invalidate_pricing()
+        self._journal('instrument_updated')
+        self._logger.info("Изменено состояние инструмента на: %s", value)
 
     @daily_rate.setter
     def daily_rate(self, value: float) -> None:
         if value <= 0:
             raise InvalidInstrumentError("Стоимость аренды должна быть положительной")
         self._daily_rate = value
-        self._logger.info(f"Изменена стоимость аренды на: {value}")
+        self._invalidate_pricing()
+        self._journal('rate_changed')
+        self._logger.info("Изменена стоимость аренды на: %s", value)
 
     @is_available.setter
     def is_available(self, value: bool) -> None:
         self._is_available = value
-        self._logger.info(f"Изменена доступность инструмента на: {value}")
+        self._journal('instrument_released' if value else 'instrument_rented')
+        self._logger.info("Изменена доступность инструмента на: %s", value)
+
+    def try_reserve(self) -> bool:
+        """Атомарно помечает инструмент как арендованный, если он доступен.
+
+        Проверка и изменение флага выполняются под блокировкой инструмента,
+        поэтому из нескольких потоков инструмент получит только один.
+
+        Returns:
+            True, если инструмент был доступен и теперь арендован.
+        """
+        with self._availability_locks.lock_for(self._instrument_id.int):
+            if not self._is_available:
+                return False
+            self._is_available = False
+        self._journal('instrument_rented')
+        return True
+
+    def release(self) -> None:
+        """Возвращает инструмент в доступные."""
+        with self._availability_locks.lock_for(self._instrument_id.int):
+            self._is_available = True
+        self._journal('instrument_released')
+        self._logger.info("Инструмент %s возвращён", self._name)
 
     def rent_instrument(self) -> None:
-        if not self._is_available:
+        if not self.try_reserve():
             raise ValueError(f"Инструмент {self._name} уже арендован")
-        self._is_available = False
-        self._logger.info(f"Инструмент {self._name} арендован")
+        self._logger.info("Инструмент %s арендован", self._name)
 
     @abstractmethod
     def calculate_rental_cost(self, days: int) -> float:
         pass
 
+    def _price(self, days: int) -> float:
+        """Стоимость аренды по тарифным правилам класса, без кэша и записи в лог.
+
+        Подклассы переопределяют метод и вызывают его из calculate_rental_cost;
+        по умолчанию стоимость берётся из calculate_rental_cost при отключённом
+        логировании объекта.
+        """
+        muted, self._logging_muted = self._logging_muted, True
+        try:
+            return self.calculate_rental_cost(days)
+        finally:
+            self._logging_muted = muted
+
+    def quiet_rental_cost(self, days: int) -> float:
+        """Возвращает стоимость аренды, как calculate_rental_cost, но без записи в лог.
+
+        Используется пакетными операциями, которые пишут одну итоговую запись
+        вместо записи на каждый инструмент. Результат кэшируется вместе с
+        calculate_rental_cost.
+
+        Args:
+            days: Срок аренды в днях.
+
+        Returns:
+            Стоимость аренды.
+        """
+        cache = self._cost_cache
+        try:
+            return cache[days]
+        except KeyError:
+            cost = cache[days] = self._price(days)
+            return cost
+
     @abstractmethod
     def to_dict(self) -> Dict:
         pass
 
+    def _restore_state(self, data: Dict) -> 'MusicalInstrument':
+        """Восстанавливает сохранённые instrument_id и доступность после создания из словаря.
+
+        Args:
+            data: Словарь в формате to_dict().
+
+        Returns:
+            Этот же инструмент.
+        """
+        if 'instrument_id' in data:
+            self._instrument_id = UUID(data['instrument_id'])
+        self._is_available = data.get('is_available', True)
+        return self
+
+    def _refresh_from(self, data: Dict) -> None:
+        """Заменяет состояние инструмента состоянием из словаря того же типа.
+
+        Объект сохраняет идентичность, поэтому ссылающиеся на него аренды
+        видят новое состояние; кэш стоимости сбрасывается. Изменение не
+        журналируется: это загрузка, а не изменение инструмента.
+
+        Args:
+            data: Словарь в формате to_dict() инструмента того же типа.
+        """
+        fresh = type(self).from_dict(data)
+        for cls in type(self).__mro__:
+            if issubclass(cls, MusicalInstrument):
+                for slot in cls.__dict__.get('__slots__', ()):
+                    if slot not in self._RUNTIME_SLOTS:
+                        setattr(self, slot, getattr(fresh, slot))
+        self._invalidate_pricing()
+
     @classmethod
     def from_dict(cls, data: Dict) -> 'MusicalInstrument':
         """Создаёт объект из словаря.
 
+        Сохранённые instrument_id и is_available восстанавливаются.
+
         Args:
             data: Словарь с данными об инструменте.
 
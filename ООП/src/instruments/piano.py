@@ -1,13 +1,17 @@
 from .musical_instrument import MusicalInstrument
-from utils import NotificationMixin
+from .pricing import LONG_RENTAL_DAYS, LONG_RENTAL_DISCOUNT, PIANO_PREMIUM_KEY_COUNT, PIANO_PREMIUM_RATE
+from utils import NotificationMixin, cache_rental_cost
 from typing import Optional, Dict
 from uuid import UUID
-import logging
 
 
 class Piano(MusicalInstrument, NotificationMixin):
     """Класс для представления пианино, наследуется от MusicalInstrument."""
 
+    __slots__ = ('_key_count',)
+
+    _REPORT_TEMPLATE = "Отчет: Пианино {0}, Состояние: {1}, Клавиш: {2}".format  # Шаблон, разобранный один раз
+
     def __init__(self, name: str, condition: str, daily_rate: float, key_count: int):
         """Инициализирует объект пианино.
 
@@ -22,12 +26,11 @@ class Piano(MusicalInstrument, NotificationMixin):
             InvalidInstrumentError: Если параметры недопустимы.
         """
         super().__init__(name, condition, daily_rate)
-        self._logger = logging.getLogger(self.__class__.__name__)
         if key_count < 61 or key_count > 88:
             raise ValueError("Количество клавиш должно быть от 61 до 88")
         self._key_count: int = key_count
-        self.is_available = True  # Добавлено для совместимости с Rentable
-        self._logger.info(f"Создано пианино: {name}")
+        self._is_available = True  # Не через сеттер: создание инструмента не журналируется
+        self._logger.info("Создано пианино: %s", name)
 
     @property
     def key_count(self) -> int:
@@ -38,25 +41,31 @@ class Piano(MusicalInstrument, NotificationMixin):
         if value < 61 or value > 88:
             raise ValueError("Количество клавиш должно быть от 61 до 88")
         self._key_count = value
-        self._logger.info(f"Изменено количество клавиш на: {value}")
+        self._invalidate_pricing()
+        self._journal('instrument_updated')
+        self._logger.info("Изменено количество клавиш на: %s", value)
 
     def rent_instrument(self) -> None:
-        if not self.is_available:
+        if not self.try_reserve():
             raise ValueError(f"Пианино {self.name} уже арендовано")
-        self.is_available = False
-        self._logger.info(f"Пианино {self.name} арендовано")
+        self._logger.info("Пианино %s арендовано", self.name)
 
+    @cache_rental_cost
     def calculate_rental_cost(self, days: int) -> float:
-        base_cost = self.daily_rate * days
-        if self._key_count > 76:
-            base_cost *= 1.2  # Премиум-тариф 20% для пианино с более чем 76 клавишами
-        if days > 7:
-            base_cost *= 0.8  # Скидка 20% за аренду более 7 дней
-        self._logger.info(f"Рассчитана стоимость аренды пианино {self.name} на {days} дней: {base_cost}")
+        base_cost = self._price(days)
+        self._logger.info("Рассчитана стоимость аренды пианино %s на %s дней: %s", self.name, days, base_cost)
+        return base_cost
+
+    def _price(self, days: int) -> float:
+        base_cost = self._daily_rate * days
+        if self._key_count > PIANO_PREMIUM_KEY_COUNT:
+            base_cost *= PIANO_PREMIUM_RATE  # Премиум-тариф 20% для пианино с более чем 76 клавишами
+        if days > LONG_RENTAL_DAYS:
+            base_cost *= LONG_RENTAL_DISCOUNT  # Скидка 20% за аренду более 7 дней
         return base_cost
 
     def generate_report(self) -> str:
-        return f"Отчет: Пианино {self.name}, Состояние: {self.condition}, Клавиш: {self._key_count}"
+        return self._REPORT_TEMPLATE(self._name, self._condition, self._key_count)
 
     def to_dict(self) -> Dict:
         return {
@@ -76,7 +85,7 @@ class Piano(MusicalInstrument, NotificationMixin):
             condition=data['condition'],
             daily_rate=data['daily_rate'],
             key_count=data['key_count']
-        )
+        )._restore_state(data)
 
     def __str__(self) -> str:
         return f"Пианино: {self.name}, Состояние: {self.condition}, Клавиш: {self._key_count}, Доступно: {self.is_available}"
@@ -0,0 +1,80 @@
+from typing import Iterable, Optional, Sequence
+
+# Тарифные правила, общие для calculate_rental_cost и пакетного расчёта
+LONG_RENTAL_DAYS = 7  # Скидка действует при аренде более чем на столько дней
+LONG_RENTAL_DISCOUNT = 0.8  # Скидка 20% за долгую аренду
+PIANO_PREMIUM_KEY_COUNT = 76  # Премиум-тариф для пианино с большим числом клавиш
+PIANO_PREMIUM_RATE = 1.2  # Надбавка 20% по премиум-тарифу
+VIOLIN_BOW_DAILY_FEE = 10  # Плата за смычок в день
+
+_KNOWN_TYPES = ('guitar', 'piano', 'violin')
+
+
+def quote_batch(
+        instrument_types: Sequence[str],
+        daily_rates: Sequence[float],
+        days: Sequence[int],
+        key_counts: Optional[Sequence[int]] = None,
+        bow_included: Optional[Sequence[bool]] = None
+):
+    """Рассчитывает стоимость аренды для массивов инструментов за один векторный проход.
+
+    Все аргументы приводятся к массивам NumPy и транслируются (broadcast) друг
+    с другом, поэтому можно передать, например, столбец инструментов и строку
+    сроков. Результат совпадает с calculate_rental_cost соответствующих классов.
+
+    Args:
+        instrument_types: Типы инструментов ('guitar', 'piano', 'violin').
+        daily_rates: Стоимость аренды за день.
+        days: Сроки аренды в днях.
+        key_counts: Количество клавиш (учитывается только для пианино).
+        bow_included: Наличие смычка (учитывается только для скрипок).
+
+    Returns:
+        Массив NumPy со стоимостями аренды.
+
+    Raises:
+        ValueError: Если встречается неизвестный тип инструмента.
+    """
+    import numpy as np  # Необязательная зависимость, нужна только для пакетного расчёта
+
+    types = np.asarray(instrument_types, dtype=str)
+    names, codes = np.unique(types, return_inverse=True)  # Строки сравниваются только для уникальных типов
+    codes = codes.reshape(types.shape)
+    names = [name.lower() for name in names.tolist()]
+    for name in names:
+        if name not in _KNOWN_TYPES:
+            raise ValueError(f"Неизвестный тип инструмента: {name}")
+    is_piano = np.isin(codes, [code for code, name in enumerate(names) if name == 'piano'])
+    is_violin = np.isin(codes, [code for code, name in enumerate(names) if name == 'violin'])
+    rates = np.asarray(daily_rates, dtype=np.float64)
+    days = np.asarray(days, dtype=np.int64)
+    keys = np.asarray(0 if key_counts is None else key_counts, dtype=np.int64)
+    bows = np.asarray(False if bow_included is None else bow_included, dtype=bool)
+
+    cost = rates * days
+    cost = np.where(is_piano & (keys > PIANO_PREMIUM_KEY_COUNT), cost * PIANO_PREMIUM_RATE, cost)
+    cost = np.where(is_violin & bows, cost + VIOLIN_BOW_DAILY_FEE * days, cost)
+    return np.where(days > LONG_RENTAL_DAYS, cost * LONG_RENTAL_DISCOUNT, cost)
+
+
+def quote_catalog(instruments: Iterable, durations: Sequence[int]):
+    """Рассчитывает стоимость аренды каждого инструмента каталога на каждый срок.
+
+    Args:
+        instruments: Инструменты каталога.
+        durations: Сроки аренды в днях.
+
+    Returns:
+        Массив NumPy формы (число инструментов, число сроков).
+    """
+    import numpy as np
+
+    instruments = list(instruments)
+    return quote_batch(
+        np.array([type(inst).__name__.lower() for inst in instruments])[:, None],
+        np.array([inst.daily_rate for inst in instruments], dtype=np.float64)[:, None],
+        np.asarray(durations, dtype=np.int64)[None, :],
+        np.array([getattr(inst, 'key_count', 0) for inst in instruments], dtype=np.int64)[:, None],
+        np.array([getattr(inst, 'bow_included', False) for inst in instruments], dtype=bool)[:, None],
+    )
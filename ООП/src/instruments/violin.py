@@ -1,13 +1,17 @@
 from .musical_instrument import MusicalInstrument
-from utils import NotificationMixin
+from .pricing import LONG_RENTAL_DAYS, LONG_RENTAL_DISCOUNT, VIOLIN_BOW_DAILY_FEE
+from utils import NotificationMixin, cache_rental_cost
 from typing import Optional, Dict
 from uuid import UUID
-import logging
 
 
 class Violin(MusicalInstrument, NotificationMixin):
     """Класс для представления скрипки, наследуется от MusicalInstrument."""
 
+    __slots__ = ('_bow_included',)
+
+    _REPORT_TEMPLATE = "Отчет: Скрипка {0}, Состояние: {1}, Смычок: {2}".format  # Шаблон, разобранный один раз
+
     def __init__(self, name: str, condition: str, daily_rate: float, bow_included: bool):
         """Инициализирует объект скрипки.
 
@@ -21,10 +25,9 @@ class Violin(MusicalInstrument, NotificationMixin):
             InvalidInstrumentError: Если параметры недопустимы.
         """
         super().__init__(name, condition, daily_rate)
-        self._logger = logging.getLogger(self.__class__.__name__)
         self._bow_included: bool = bow_included
-        self.is_available = True  # Добавлено для совместимости с Rentable
-        self._logger.info(f"Создана скрипка: {name}")
+        self._is_available = True  # Не через сеттер: создание инструмента не журналируется
+        self._logger.info("Создана скрипка: %s", name)
 
     @property
     def bow_included(self) -> bool:
@@ -33,25 +36,31 @@ class Violin(MusicalInstrument, NotificationMixin):
     @bow_included.setter
     def bow_included(self, value: bool) -> None:
         self._bow_included = value
-        self._logger.info(f"Изменено наличие смычка: {value}")
+        self._invalidate_pricing()
+        self._journal('instrument_updated')
+        self._logger.info("Изменено наличие смычка: %s", value)
 
     def rent_instrument(self) -> None:
-        if not self.is_available:
+        if not self.try_reserve():
             raise ValueError(f"Скрипка {self.name} уже арендована")
-        self.is_available = False
-        self._logger.info(f"Скрипка {self.name} арендована")
+        self._logger.info("Скрипка %s арендована", self.name)
 
+    @cache_rental_cost
     def calculate_rental_cost(self, days: int) -> float:
-        base_cost = self.daily_rate * days
+        base_cost = self._price(days)
+        self._logger.info("Рассчитана стоимость аренды скрипки %s на %s дней: %s", self.name, days, base_cost)
+        return base_cost
+
+    def _price(self, days: int) -> float:
+        base_cost = self._daily_rate * days
         if self._bow_included:
-            base_cost += 10 * days  # Дополнительная плата 10 за день за смычок
-        if days > 7:
-            base_cost *= 0.8  # Скидка 20% за аренду более 7 дней
-        self._logger.info(f"Рассчитана стоимость аренды скрипки {self.name} на {days} дней: {base_cost}")
+            base_cost += VIOLIN_BOW_DAILY_FEE * days  # Дополнительная плата 10 за день за смычок
+        if days > LONG_RENTAL_DAYS:
+            base_cost *= LONG_RENTAL_DISCOUNT  # Скидка 20% за аренду более 7 дней
         return base_cost
 
     def generate_report(self) -> str:
-        return f"Отчет: Скрипка {self.name}, Состояние: {self.condition}, Смычок: {'включен' if self._bow_included else 'не включен'}"
+        return self._REPORT_TEMPLATE(self._name, self._condition, 'включен' if self._bow_included else 'не включен')
 
     def to_dict(self) -> Dict:
         return {
@@ -71,7 +80,7 @@ class Violin(MusicalInstrument, NotificationMixin):
             condition=data['condition'],
             daily_rate=data['daily_rate'],
             bow_included=data['bow_included']
-        )
+        )._restore_state(data)
 
     def __str__(self) -> str:
         return f"Скрипка: {self.name}, Состояние: {self.condition}, Смычок: {'включен' if self._bow_included else 'не включен'}, Доступна: {self.is_available}"
@@ -1,6 +1,11 @@
 from .customer import Customer
-from .accessory import Accessory
+from .accessory import Accessory, AccessoryCatalog
 from .rental import Rental
-from .interfaces import Rentable, Reportable, RentalRequestHandler
-from .handler import RentalRequest, RequestType, Operator, Manager, Admin
+from .interfaces import Rentable, Reportable, RentalRequestHandler, AsyncRentalProcess
+from .handler import RentalRequest, RequestType, Operator, Manager, Admin, RequestRouter
 from .process import OnlineRentalProcess, OfflineRentalProcess
+from .async_process import AsyncOnlineRentalProcess, AsyncOfflineRentalProcess
+from .registry import RentalRegistry
+from .availability import AvailabilityIndex
+from .analytics import RentalColumns
+from .reporting import format_report, render_payload, iter_report_chunks, stream_reports, write_reports
@@ -1,10 +1,81 @@
 from uuid import UUID, uuid4
-from typing import Dict
+from typing import Dict, Iterator, Optional
+
+
+class AccessoryCatalog:
+    """Каталог аксессуаров: один общий объект на каждый accessory_id.
+
+    Аксессуары неизменяемы, поэтому аренды могут ссылаться на один и тот же
+    объект каталога вместо собственных копий.
+    """
+
+    def __init__(self):
+        """Инициализирует пустой каталог."""
+        self._by_id: Dict[UUID, 'Accessory'] = {}
+        self._by_text: Dict[str, 'Accessory'] = {}  # Тот же индекс по строковому ID из сериализованных данных
+
+    def add(self, accessory: 'Accessory') -> 'Accessory':
+        """Добавляет аксессуар в каталог.
+
+        Args:
+            accessory: Аксессуар.
+
+        Returns:
+            Аксессуар каталога с тем же ID (уже зарегистрированный или переданный).
+        """
+        existing = self._by_id.get(accessory.accessory_id)
+        if existing is not None:
+            return existing
+        self._by_id[accessory.accessory_id] = accessory
+        self._by_text[str(accessory.accessory_id)] = accessory
+        return accessory
+
+    def intern(self, accessory_id: str, name: str, cost: float) -> 'Accessory':
+        """Возвращает аксессуар каталога с указанным ID, создавая его при первом обращении.
+
+        Если сохранённая запись расходится с аксессуаром каталога по name или
+        cost, аксессуар каталога заменяется новым по этой записи.
+
+        Args:
+            accessory_id: Строковый идентификатор аксессуара.
+            name: Название аксессуара.
+            cost: Стоимость аренды аксессуара за день.
+
+        Returns:
+            Аксессуар каталога.
+        """
+        accessory = self._by_text.get(accessory_id)
+        if accessory is None or accessory.name != name or accessory.cost != cost:
+            accessory = Accessory(name, cost)
+            accessory._accessory_id = UUID(accessory_id)
+            self._by_id[accessory.accessory_id] = accessory
+            self._by_text[accessory_id] = accessory
+        return accessory
+
+    def get(self, accessory_id: UUID) -> Optional['Accessory']:
+        """Возвращает аксессуар по ID или None."""
+        return self._by_id.get(accessory_id)
+
+    def clear(self) -> None:
+        """Очищает каталог."""
+        self._by_id.clear()
+        self._by_text.clear()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, accessory_id: object) -> bool:
+        return accessory_id in self._by_id
+
+    def __iter__(self) -> Iterator['Accessory']:
+        return iter(list(self._by_id.values()))
 
 
 class Accessory:
     """Класс для представления аксессуара к музыкальному инструменту."""
 
+    __slots__ = ('_accessory_id', '_name', '_cost')
+
     def __init__(self, name: str, cost: float):
         """Инициализирует объект аксессуара.
 
@@ -43,11 +114,28 @@ class Accessory:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Accessory':
-        return cls(
-            name=data['name'],
-            cost=data['cost']
-        )
+    def from_dict(cls, data: Dict, catalog: Optional[AccessoryCatalog] = None) -> 'Accessory':
+        """Восстанавливает аксессуар из словаря.
+
+        Если передан каталог, аксессуар с accessory_id берётся из него (или
+        регистрируется в нём), поэтому одна позиция каталога не размножается
+        по арендам одной загрузки.
+
+        Args:
+            data: Словарь в формате to_dict().
+            catalog: Каталог загрузки (опционально).
+
+        Returns:
+            Аксессуар.
+        """
+        accessory_id = data.get('accessory_id')
+        if accessory_id is None:
+            return cls(name=data['name'], cost=data['cost'])
+        if catalog is None:
+            accessory = cls(name=data['name'], cost=data['cost'])
+            accessory._accessory_id = UUID(accessory_id)
+            return accessory
+        return catalog.intern(accessory_id, data['name'], data['cost'])
 
     def __str__(self) -> str:
         return f"Аксессуар: {self._name}, Стоимость: {self._cost}"
\ No newline at end of file
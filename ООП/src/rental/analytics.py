@@ -0,0 +1,185 @@
+from array import array
+from datetime import date
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class RentalColumns:
+    """Колоночное хранилище истории аренд для аналитических отчётов.
+
+    Каждое поле аренды хранится в отдельном компактном массиве; тип
+    инструмента, клиент и инструмент кодируются целыми числами. Агрегаты
+    считаются векторно по столбцам с помощью NumPy (необязательная
+    зависимость, импортируется только при расчёте).
+    """
+
+    def __init__(self):
+        """Инициализирует пустое хранилище."""
+        self.start = array('i')  # Порядковые номера дат начала
+        self.end = array('i')  # Порядковые номера дат окончания
+        self.daily_rate = array('d')
+        self.total_cost = array('d')
+        self.instrument_type = array('H')
+        self.customer = array('I')
+        self.instrument = array('I')
+        self._types: List[str] = []
+        self._customers: List[Hashable] = []
+        self._instruments: List[Hashable] = []
+        self._codes: Dict[Tuple[int, Hashable], int] = {}
+
+    def _code(self, kind: int, values: List[Hashable], value: Hashable) -> int:
+        code = self._codes.get((kind, value))
+        if code is None:
+            code = self._codes[(kind, value)] = len(values)
+            values.append(value)
+        return code
+
+    def append_row(
+            self,
+            instrument_type: str,
+            customer_id: Hashable,
+            instrument_id: Hashable,
+            start_date: date,
+            end_date: date,
+            daily_rate: float,
+            total_cost: float
+    ) -> None:
+        """Добавляет строку с данными одной аренды.
+
+        Args:
+            instrument_type: Тип инструмента (например, 'guitar').
+            customer_id: Идентификатор клиента.
+            instrument_id: Идентификатор инструмента.
+            start_date: Дата начала аренды.
+            end_date: Дата окончания аренды.
+            daily_rate: Стоимость аренды инструмента за день.
+            total_cost: Общая стоимость аренды.
+        """
+        self.instrument_type.append(self._code(0, self._types, instrument_type))
+        self.customer.append(self._code(1, self._customers, customer_id))
+        self.instrument.append(self._code(2, self._instruments, instrument_id))
+        self.start.append(start_date.toordinal())
+        self.end.append(end_date.toordinal())
+        self.daily_rate.append(daily_rate)
+        self.total_cost.append(total_cost)
+
+    def append(self, rental: 'Rental') -> None:
+        """Добавляет аренду.
+
+        Args:
+            rental: Аренда.
+        """
+        instrument = rental.instrument
+        self.append_row(
+            type(instrument).__name__.lower(), rental.customer.customer_id, instrument.instrument_id,
+            rental.start_date, rental.end_date, instrument.daily_rate, rental.total_cost
+        )
+
+    @classmethod
+    def from_rentals(cls, rentals: Iterable['Rental']) -> 'RentalColumns':
+        """Строит хранилище по объектам аренды, например по RentalRegistry.
+
+        Args:
+            rentals: Аренды.
+
+        Returns:
+            Колоночное хранилище.
+        """
+        columns = cls()
+        for rental in rentals:
+            columns.append(rental)
+        return columns
+
+    @classmethod
+    def from_snapshot(cls, snapshot: 'RentalSnapshot') -> 'RentalColumns':
+        """Строит хранилище по бинарному снимку, не создавая объектов аренды.
+
+        Args:
+            snapshot: Открытый снимок.
+
+        Returns:
+            Колоночное хранилище.
+        """
+        from uuid import UUID
+        columns = cls()
+        types = snapshot.instrument_types
+        for position in range(len(snapshot.rentals)):
+            _, customer, instrument, start, end, total_cost, *_ = snapshot.rentals.fields(position)
+            instrument_id, type_code, _, _, daily_rate, *_ = snapshot.instruments.fields(instrument)
+            customer_id = snapshot.customers.fields(customer)[0]
+            columns.instrument_type.append(columns._code(0, columns._types, types[type_code]))
+            columns.customer.append(columns._code(1, columns._customers, UUID(bytes=customer_id)))
+            columns.instrument.append(columns._code(2, columns._instruments, UUID(bytes=instrument_id)))
+            columns.start.append(start)
+            columns.end.append(end)
+            columns.daily_rate.append(daily_rate)
+            columns.total_cost.append(total_cost)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def revenue_by_type_month(self) -> Dict[Tuple[str, str], float]:
+        """Считает выручку по типу инструмента и месяцу начала аренды.
+
+        Returns:
+            Словарь {(тип инструмента, 'ГГГГ-ММ'): выручка}.
+        """
+        import numpy as np
+
+        if not len(self):
+            return {}
+        days = np.frombuffer(self.start, dtype=np.int32).astype(np.int64) - _EPOCH_ORDINAL
+        months = days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+        first_month = int(months.min())
+        month_count = int(months.max()) - first_month + 1
+        groups = np.frombuffer(self.instrument_type, dtype=np.uint16).astype(np.int64) * month_count
+        groups += months - first_month
+        revenue = np.bincount(groups, weights=np.frombuffer(self.total_cost), minlength=len(self._types) * month_count)
+        result = {}
+        for group in np.flatnonzero(np.bincount(groups, minlength=revenue.size)):
+            type_code, month = divmod(int(group), month_count)
+            label = str(np.datetime64(first_month + month, 'M'))
+            result[(self._types[type_code], label)] = float(revenue[group])
+        return result
+
+    def utilization_by_instrument(self, start: date, end: date) -> Dict[Hashable, float]:
+        """Считает долю дней периода [start, end), в которые инструмент был в аренде.
+
+        Args:
+            start: Начало периода.
+            end: Конец периода (не включается).
+
+        Returns:
+            Словарь {идентификатор инструмента: доля дней от 0 до 1}.
+
+        Raises:
+            ValueError: Если период пуст.
+        """
+        import numpy as np
+
+        period = (end - start).days
+        if period <= 0:
+            raise ValueError("Период должен содержать хотя бы один день")
+        starts = np.maximum(np.frombuffer(self.start, dtype=np.int32), start.toordinal())
+        ends = np.minimum(np.frombuffer(self.end, dtype=np.int32), end.toordinal())
+        rented = np.clip(ends - starts, 0, None)
+        days = np.bincount(
+            np.frombuffer(self.instrument, dtype=np.uint32), weights=rented, minlength=len(self._instruments)
+        )
+        return {instrument_id: float(value) / period for instrument_id, value in zip(self._instruments, days)}
+
+    def revenue_by_customer(self) -> Dict[Hashable, float]:
+        """Считает выручку по клиентам.
+
+        Returns:
+            Словарь {идентификатор клиента: выручка}.
+        """
+        import numpy as np
+
+        revenue = np.bincount(
+            np.frombuffer(self.customer, dtype=np.uint32), weights=np.frombuffer(self.total_cost),
+            minlength=len(self._customers)
+        )
+        return dict(zip(self._customers, revenue.tolist()))
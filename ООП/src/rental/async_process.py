@@ -0,0 +1,79 @@
+from typing import Awaitable, Callable, Optional
+from .interfaces import AsyncRentalProcess
+from .rental import Rental
+from .availability import AvailabilityIndex
+from .process import _OfflineSteps, _OnlineSteps
+
+# Асинхронная отправка подтверждения: (адрес получателя, текст сообщения)
+ConfirmationSender = Callable[[str, str], Awaitable[None]]
+
+
+class _AsyncConfirmation:
+    """Отправка подтверждения через асинхронный отправитель или NotificationMixin.notify."""
+
+    def __init__(self, sender: Optional[ConfirmationSender]):
+        self._sender = sender
+
+    async def _send_confirmation(self, rental: Rental, message: str) -> None:
+        if self._sender is None:
+            rental.notify(message)
+        else:
+            await self._sender(rental.notification_recipient, message)
+
+
+class AsyncOnlineRentalProcess(AsyncRentalProcess, _AsyncConfirmation, _OnlineSteps):
+    """Класс для асинхронного процесса аренды инструментов онлайн."""
+
+    def __init__(
+            self,
+            availability: Optional[AvailabilityIndex] = None,
+            sender: Optional[ConfirmationSender] = None
+    ):
+        """Инициализирует процесс онлайн-аренды.
+
+        Args:
+            availability: Индекс бронирований (опционально).
+            sender: Корутина отправки подтверждения (email, SMS); по умолчанию
+                используется rental.notify.
+        """
+        AsyncRentalProcess.__init__(self, availability)
+        _AsyncConfirmation.__init__(self, sender)
+
+    async def check_availability(self, rental: Rental) -> None:
+        self._check_step(rental)
+
+    async def process_rental(self, rental: Rental) -> None:
+        self._process_step(rental)
+
+    async def confirm_rental(self, rental: Rental) -> None:
+        await self._send_confirmation(rental, self._confirmation(rental))
+        self._log_confirmation(rental)
+
+
+class AsyncOfflineRentalProcess(AsyncRentalProcess, _AsyncConfirmation, _OfflineSteps):
+    """Класс для асинхронного процесса аренды инструментов оффлайн."""
+
+    def __init__(
+            self,
+            availability: Optional[AvailabilityIndex] = None,
+            sender: Optional[ConfirmationSender] = None
+    ):
+        """Инициализирует процесс оффлайн-аренды.
+
+        Args:
+            availability: Индекс бронирований (опционально).
+            sender: Корутина отправки подтверждения; по умолчанию используется rental.notify.
+        """
+        AsyncRentalProcess.__init__(self, availability)
+        _AsyncConfirmation.__init__(self, sender)
+
+    async def check_availability(self, rental: Rental) -> None:
+        self._check_step(rental)
+
+    async def process_rental(self, rental: Rental) -> None:
+        self._process_step(rental)
+
+    async def confirm_rental(self, rental: Rental) -> None:
+        await self._send_confirmation(rental, self._confirmation(rental))
+        self._log_confirmation(rental)
+
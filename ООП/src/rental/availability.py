@@ -0,0 +1,243 @@
+import threading
+from bisect import bisect_left
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID, uuid4
+from instruments.musical_instrument import MusicalInstrument
+from utils import BookingConflictError, StripedLock
+
+
+class _Bookings:
+    """Непересекающиеся бронирования одного инструмента, упорядоченные по дате начала.
+
+    Так как периоды не пересекаются, даты окончания упорядочены так же,
+    как даты начала, и проверка свободы периода сводится к двоичному поиску.
+    """
+
+    __slots__ = ('starts', 'ends', 'booking_ids')
+
+    def __init__(self):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        self.booking_ids: List[UUID] = []  # rental_id аренды или выданный book() идентификатор
+
+    def is_free(self, start: int, end: int) -> bool:
+        position = bisect_left(self.starts, end)  # Бронирования [0, position) начинаются до конца периода
+        return position == 0 or self.ends[position - 1] <= start
+
+    def overlapping(self, start: int, end: int) -> List[int]:
+        position = bisect_left(self.starts, end) - 1
+        found = []
+        while position >= 0 and self.ends[position] > start:
+            found.append(position)
+            position -= 1
+        found.reverse()
+        return found
+
+    def insert(self, start: int, end: int, booking_id: UUID) -> None:
+        position = bisect_left(self.starts, start)
+        self.starts.insert(position, start)
+        self.ends.insert(position, end)
+        self.booking_ids.insert(position, booking_id)
+
+    def delete(self, start: int) -> None:
+        position = bisect_left(self.starts, start)
+        del self.starts[position]
+        del self.ends[position]
+        del self.booking_ids[position]
+
+
+class AvailabilityIndex:
+    """Индекс бронирований инструментов по периодам [start_date, end_date).
+
+    Проверка «свободен ли инструмент в периоде» выполняется за O(log k),
+    где k — число бронирований инструмента; выборка свободных инструментов
+    типа — за O(m log k), где m — число инструментов этого типа.
+    Бронирования одного инструмента читаются и изменяются под блокировкой,
+    выбранной по instrument_id, поэтому индекс можно использовать из
+    нескольких потоков: проверка и бронирование периода атомарны.
+    """
+
+    def __init__(self):
+        """Инициализирует пустой индекс."""
+        self._bookings: Dict[UUID, _Bookings] = {}
+        self._by_type: Dict[str, Dict[UUID, MusicalInstrument]] = {}
+        # Идентификатор бронирования -> (instrument_id, начало, инструмент, который бронирование держит недоступным)
+        self._rentals: Dict[UUID, Tuple[UUID, int, Optional[MusicalInstrument]]] = {}
+        self._rentals_lock = threading.Lock()  # Общая для всех инструментов карта _rentals
+        self._locks = StripedLock()  # Блокировки бронирований по instrument_id
+
+    @staticmethod
+    def _period(start: date, end: date) -> Tuple[int, int]:
+        if start > end:
+            raise ValueError("Дата начала бронирования не может быть позже даты окончания")
+        start_day = start.toordinal()
+        return start_day, max(end.toordinal(), start_day + 1)  # Аренда в пределах дня занимает весь день
+
+    def add_instrument(self, instrument: MusicalInstrument) -> None:
+        """Регистрирует инструмент для поиска по типу.
+
+        Args:
+            instrument: Инструмент.
+        """
+        instrument_type = type(instrument).__name__.lower()
+        with self._locks.lock_for(instrument.instrument_id.int):
+            self._by_type.setdefault(instrument_type, {})[instrument.instrument_id] = instrument
+            self._bookings.setdefault(instrument.instrument_id, _Bookings())
+
+    def add_instruments(self, instruments: Iterable[MusicalInstrument]) -> None:
+        for instrument in instruments:
+            self.add_instrument(instrument)
+
+    def is_free(self, instrument_id: UUID, start: date, end: date) -> bool:
+        """Проверяет, свободен ли инструмент в периоде [start, end).
+
+        Args:
+            instrument_id: Идентификатор инструмента.
+            start: Начало периода.
+            end: Конец периода (не включается).
+
+        Returns:
+            True, если у инструмента нет пересекающихся бронирований.
+        """
+        period = self._period(start, end)
+        bookings = self._bookings.get(instrument_id)
+        if bookings is None:
+            return True
+        with self._locks.lock_for(instrument_id.int):
+            return bookings.is_free(*period)
+
+    def conflicts(self, instrument_id: UUID, start: date, end: date) -> List[UUID]:
+        """Возвращает идентификаторы бронирований, пересекающихся с периодом [start, end).
+
+        Args:
+            instrument_id: Идентификатор инструмента.
+            start: Начало периода.
+            end: Конец периода (не включается).
+
+        Returns:
+            Список идентификаторов бронирований (rental_id для бронирований аренд).
+        """
+        period = self._period(start, end)
+        bookings = self._bookings.get(instrument_id)
+        if bookings is None:
+            return []
+        with self._locks.lock_for(instrument_id.int):
+            return [bookings.booking_ids[position] for position in bookings.overlapping(*period)]
+
+    def free_instruments(self, instrument_type: str, start: date, end: date) -> List[MusicalInstrument]:
+        """Возвращает инструменты типа, свободные в периоде [start, end).
+
+        Выборка линейна по числу инструментов типа: каждый проверяется
+        двоичным поиском, то есть O(m log k). Общей для типа интервальной
+        структуры нет, поэтому сублинейной по m выборки индекс не даёт.
+
+        Args:
+            instrument_type: Тип инструмента (например, 'guitar').
+            start: Начало периода.
+            end: Конец периода (не включается).
+
+        Returns:
+            Список свободных инструментов.
+        """
+        period = self._period(start, end)
+        free = []
+        for instrument_id, instrument in list(self._by_type.get(instrument_type.lower(), {}).items()):
+            with self._locks.lock_for(instrument_id.int):
+                if self._bookings[instrument_id].is_free(*period):
+                    free.append(instrument)
+        return free
+
+    def book(self, instrument_id: UUID, start: date, end: date, rental_id: Optional[UUID] = None) -> UUID:
+        """Бронирует инструмент на период [start, end).
+
+        Args:
+            instrument_id: Идентификатор инструмента.
+            start: Начало периода.
+            end: Конец периода (не включается).
+            rental_id: Идентификатор аренды, к которой относится бронирование;
+                без него бронированию выдаётся новый идентификатор.
+
+        Returns:
+            Идентификатор бронирования (rental_id или выданный), по которому
+            бронирование снимается через release().
+
+        Raises:
+            BookingConflictError: Если период пересекается с существующим бронированием.
+        """
+        return self._book(instrument_id, start, end, rental_id, None)
+
+    def _book(
+            self,
+            instrument_id: UUID,
+            start: date,
+            end: date,
+            rental_id: Optional[UUID],
+            held: Optional[MusicalInstrument]
+    ) -> UUID:
+        period = self._period(start, end)
+        booking_id = uuid4() if rental_id is None else rental_id
+        with self._locks.lock_for(instrument_id.int):
+            bookings = self._bookings.setdefault(instrument_id, _Bookings())
+            if not bookings.is_free(*period):
+                raise BookingConflictError(
+                    f"Инструмент {instrument_id} уже забронирован в период {start} - {end}"
+                )
+            with self._rentals_lock:
+                if booking_id in self._rentals:
+                    raise BookingConflictError(f"Аренда #{booking_id} уже забронирована")
+                self._rentals[booking_id] = (instrument_id, period[0], held)
+            bookings.insert(*period, booking_id)
+        return booking_id
+
+    def book_rental(self, rental: 'Rental', holds_instrument: bool = False) -> None:
+        """Бронирует инструмент аренды на её период.
+
+        Args:
+            rental: Аренда.
+            holds_instrument: Инструмент уже помечен недоступным для этой
+                аренды (Rental.reserve); release() вернёт его в доступные.
+
+        Raises:
+            BookingConflictError: Если период пересекается с существующим бронированием.
+        """
+        instrument = rental.instrument
+        self._book(
+            instrument.instrument_id, rental.start_date, rental.end_date, rental.rental_id,
+            instrument if holds_instrument else None
+        )
+
+    def release(self, booking_id: UUID) -> None:
+        """Снимает бронирование аренды или бронирование, выданное book().
+
+        Если бронирование держало инструмент недоступным, инструмент
+        возвращается в доступные.
+
+        Args:
+            booking_id: rental_id аренды или идентификатор, который вернул book().
+
+        Raises:
+            KeyError: Если такого бронирования нет.
+        """
+        with self._rentals_lock:
+            instrument_id, start, held = self._rentals.pop(booking_id)
+        with self._locks.lock_for(instrument_id.int):
+            self._bookings[instrument_id].delete(start)
+        if held is not None:
+            held.release()
+
+    def bookings(self, instrument_id: UUID) -> List[Tuple[date, date, UUID]]:
+        """Возвращает бронирования инструмента в порядке дат.
+
+        Args:
+            instrument_id: Идентификатор инструмента.
+
+        Returns:
+            Список кортежей (начало, конец, идентификатор бронирования).
+        """
+        bookings = self._bookings.get(instrument_id)
+        if bookings is None:
+            return []
+        with self._locks.lock_for(instrument_id.int):
+            entries = list(zip(bookings.starts, bookings.ends, bookings.booking_ids))
+        return [(date.fromordinal(start), date.fromordinal(end), booking_id) for start, end, booking_id in entries]
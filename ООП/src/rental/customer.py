@@ -1,10 +1,14 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from uuid import UUID, uuid4
+from utils.journal import get_journal
+from utils.permissions import permission_mask, register_permission
 
 
 class Customer:
     """Класс для представления клиента, арендующего инструменты."""
 
+    __slots__ = ('_customer_id', '_name', '_email', '_phone', '_permissions', '_permission_mask')
+
     def __init__(self, name: str, email: str, phone: Optional[str] = None, permissions: Optional[List[str]] = None):
         """Инициализирует объект клиента.
 
@@ -18,7 +22,8 @@ class Customer:
         self._name: str = name
         self._email: str = email
         self._phone: Optional[str] = phone
-        self._permissions: List[str] = permissions or []
+        self._permissions: Tuple[str, ...] = tuple(dict.fromkeys(permissions or []))  # Без повторов, в исходном порядке
+        self._permission_mask: int = permission_mask(self._permissions)
 
     @property
     def customer_id(self) -> UUID:
@@ -38,10 +43,43 @@ class Customer:
 
     @property
     def permissions(self) -> List[str]:
-        return self._permissions
+        return list(self._permissions)
+
+    @property
+    def permission_mask(self) -> int:
+        """Битовая маска разрешений клиента (см. utils.permissions)."""
+        return self._permission_mask
 
     def has_permission(self, permission: str) -> bool:
-        return permission in self._permissions
+        return bool(self._permission_mask & register_permission(permission))
+
+    def grant(self, permission: str) -> None:
+        """Выдаёт клиенту разрешение.
+
+        Args:
+            permission: Имя разрешения.
+        """
+        if permission not in self._permissions:
+            self._permissions += (permission,)
+            self._permission_mask |= register_permission(permission)
+            self._journal_permissions()
+
+    def revoke(self, permission: str) -> None:
+        """Отзывает у клиента разрешение.
+
+        Args:
+            permission: Имя разрешения.
+        """
+        if permission in self._permissions:
+            self._permissions = tuple(name for name in self._permissions if name != permission)
+            self._permission_mask &= ~register_permission(permission)
+            self._journal_permissions()
+
+    def _journal_permissions(self) -> None:
+        """Записывает изменение разрешений в журнал, если он назначен (см. utils.set_journal)."""
+        journal = get_journal()
+        if journal is not None:
+            journal.permissions_changed(self)
 
     def to_dict(self) -> Dict:
         return {
@@ -49,18 +87,20 @@ class Customer:
             'name': self._name,
             'email': self._email,
             'phone': self._phone,
-            'permissions': self._permissions
+            'permissions': list(self._permissions)
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'Customer':
-
-        return cls(
+        customer = cls(
             name=data['name'],
             email=data['email'],
             phone=data.get('phone'),
             permissions=data.get('permissions', [])
         )
+        if 'customer_id' in data:
+            customer._customer_id = UUID(data['customer_id'])  # Восстанавливаем customer_id
+        return customer
 
     def __str__(self) -> str:
         return f"Клиент: {self._name}, Email: {self._email}, Телефон: {self._phone or 'не указан'}"
\ No newline at end of file
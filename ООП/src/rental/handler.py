@@ -1,4 +1,6 @@
+from bisect import bisect_left
 from enum import Enum
+from typing import Dict, Iterable, List, Tuple
 from .interfaces import RentalRequestHandler
 
 class RequestType(Enum):
@@ -24,27 +26,152 @@ class RentalRequest:
 class Operator(RentalRequestHandler):
     """Обработчик простых запросов."""
 
-    def handle_request(self, request: RentalRequest) -> str:
-        if request.request_type == RequestType.SIMPLE:
-            return f"Оператор обработал простой запрос: {request.description} (сумма: {request.amount})"
-        elif self._successor:
-            return self._successor.handle_request(request)
+    handled_type = RequestType.SIMPLE
+
+    def process(self, request: RentalRequest) -> str:
+        return f"Оператор обработал простой запрос: {request.description} (сумма: {request.amount})"
+
+    def reject(self, request: RentalRequest) -> str:
         return f"Оператор не может обработать запрос: {request.description}"
 
 class Manager(RentalRequestHandler):
     """Обработчик запросов на скидки."""
 
-    def handle_request(self, request: RentalRequest) -> str:
-        if request.request_type == RequestType.DISCOUNT:
-            return f"Менеджер обработал запрос на скидку: {request.description} (сумма: {request.amount})"
-        elif self._successor:
-            return self._successor.handle_request(request)
+    handled_type = RequestType.DISCOUNT
+
+    def process(self, request: RentalRequest) -> str:
+        return f"Менеджер обработал запрос на скидку: {request.description} (сумма: {request.amount})"
+
+    def reject(self, request: RentalRequest) -> str:
         return f"Менеджер не может обработать запрос: {request.description}"
 
 class Admin(RentalRequestHandler):
-    """Обработчик сложных запросов."""
+    """Обработчик сложных запросов; последний в цепочке, запросы дальше не передаёт."""
+
+    handled_type = RequestType.COMPLEX
+    terminal = True
+
+    def process(self, request: RentalRequest) -> str:
+        return f"Админ обработал сложный запрос: {request.description} (сумма: {request.amount})"
+
+    def reject(self, request: RentalRequest) -> str:
+        return f"Админ не может обработать запрос: {request.description}"
+
+
+class RequestRouter:
+    """Маршрутизатор запросов, скомпилированный из цепочки обработчиков.
+
+    Вместо обхода цепочки для каждого запроса строится таблица «тип запроса →
+    обработчики этого типа в порядке цепочки» с порогами сумм. Запрос
+    отдаётся первому по цепочке обработчику своего типа, чья max_amount не
+    меньше суммы запроса, — как и при обходе цепочки; необработанный запрос
+    отклоняет последний обработчик. Поиск — словарь и двоичный поиск по
+    порогам, поэтому время не зависит от длины цепочки.
+
+    Маршрутизатор опирается на handled_type, max_amount и terminal. Если в
+    цепочке есть обработчик с собственными handle_request или can_handle,
+    таблица не строится и запросы передаются в handle_request цепочки.
+    Если цепочка изменилась, вызовите rebuild().
+    """
+
+    def __init__(self, chain: RentalRequestHandler):
+        """Компилирует маршрутизатор из цепочки.
+
+        Args:
+            chain: Первый обработчик цепочки.
+        """
+        self._chain = chain
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Перестраивает таблицу маршрутов по текущей цепочке и сбрасывает счётчики."""
+        handlers: List[RentalRequestHandler] = []
+        handler = self._chain
+        while handler is not None:
+            handlers.append(handler)
+            handler = None if handler.terminal else handler.successor
+        self._fallback = any(
+            type(handler).handle_request is not RentalRequestHandler.handle_request
+            or type(handler).can_handle is not RentalRequestHandler.can_handle
+            for handler in handlers
+        )
+        routes: Dict[RequestType, Tuple[List[float], List[int]]] = {}
+        for position, handler in enumerate(handlers):
+            if handler.handled_type is None:
+                continue
+            limits, positions = routes.setdefault(handler.handled_type, ([], []))
+            limit = float('inf') if handler.max_amount is None else handler.max_amount
+            # Первый обработчик с limit >= суммы — это первый, у кого максимум порогов
+            # по префиксу цепочки >= суммы; максимумы по префиксу упорядочены, и работает bisect.
+            limits.append(max(limit, limits[-1]) if limits else limit)
+            positions.append(position)
+        self._handlers = handlers
+        self._routes = routes
+        self._tail = handlers[-1]
+        self._counts = [0] * len(handlers)
+        self._rejected = 0
+
+    def _route(self, request: RentalRequest) -> int:
+        """Возвращает позицию обработчика в цепочке или -1, если запрос никто не обработает."""
+        route = self._routes.get(request.request_type)
+        if route is None:
+            return -1
+        limits, positions = route
+        index = bisect_left(limits, request.amount)
+        return positions[index] if index < len(positions) else -1
+
+    def handle(self, request: RentalRequest) -> str:
+        """Обрабатывает запрос так же, как handle_request первого обработчика цепочки.
+
+        Args:
+            request: Запрос на аренду.
+
+        Returns:
+            Результат обработки запроса.
+        """
+        if self._fallback:
+            return self._chain.handle_request(request)
+        position = self._route(request)
+        if position < 0:
+            self._rejected += 1
+            return self._tail.reject(request)
+        self._counts[position] += 1
+        return self._handlers[position].process(request)
+
+    def handle_many(self, requests: Iterable[RentalRequest]) -> List[str]:
+        """Обрабатывает пакет запросов.
+
+        Args:
+            requests: Запросы на аренду.
+
+        Returns:
+            Результаты обработки в порядке запросов.
+        """
+        if self._fallback:
+            return [self._chain.handle_request(request) for request in requests]
+        route, handlers, counts, tail = self._route, self._handlers, self._counts, self._tail
+        results = []
+        for request in requests:
+            position = route(request)
+            if position < 0:
+                self._rejected += 1
+                results.append(tail.reject(request))
+            else:
+                counts[position] += 1
+                results.append(handlers[position].process(request))
+        return results
+
+    def counts(self) -> Dict[RentalRequestHandler, int]:
+        """Возвращает количество обработанных запросов по обработчикам.
+
+        Когда запросы передаются в handle_request цепочки, счётчики не ведутся.
+
+        Returns:
+            Словарь {обработчик: число обработанных запросов}.
+        """
+        return dict(zip(self._handlers, self._counts))
 
-    def handle_request(self, request: RentalRequest) -> str:
-        if request.request_type == RequestType.COMPLEX:
-            return f"Админ обработал сложный запрос: {request.description} (сумма: {request.amount})"
-        return f"Админ не может обработать запрос: {request.description}"
\ No newline at end of file
+    @property
+    def rejected(self) -> int:
+        """Количество запросов, которые не обработал ни один обработчик."""
+        return self._rejected
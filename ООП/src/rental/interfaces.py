@@ -1,28 +1,59 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+from uuid import UUID
 
 class Rentable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def rent_instrument(self) -> None:
         pass
 
 class Reportable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def generate_report(self) -> str:
         pass
 
 class RentalRequestHandler(ABC):
-    """Абстрактный класс для обработки запросов на аренду."""
+    """Абстрактный класс для обработки запросов на аренду.
+
+    Обработчик берёт запрос, если тип запроса равен handled_type и сумма не
+    превышает max_amount; иначе передаёт его следующему в цепочке. Последний
+    обработчик цепочки, как и обработчик с terminal = True, отклоняет
+    необработанный запрос.
+
+    Подкласс задаёт handled_type и реализует process и reject либо, как
+    прежде, переопределяет handle_request целиком.
+    """
 
-    def __init__(self, successor: Optional['RentalRequestHandler'] = None):
+    handled_type: Optional['RequestType'] = None  # Тип запросов, которые обрабатывает класс
+    terminal: bool = False  # Не передаёт запросы следующему обработчику
+
+    def __init__(self, successor: Optional['RentalRequestHandler'] = None, max_amount: Optional[float] = None):
         """Инициализация обработчика с указанием следующего в цепочке.
 
         Args:
             successor: Следующий обработчик в цепочке.
+            max_amount: Максимальная сумма запроса, которую может одобрить
+                обработчик (None — без ограничения).
         """
         self._successor = successor
+        self.max_amount = max_amount
+
+    @property
+    def successor(self) -> Optional['RentalRequestHandler']:
+        return self._successor
+
+    def can_handle(self, request: 'RentalRequest') -> bool:
+        """Проверяет, может ли обработчик сам обработать запрос."""
+        return request.request_type == self.handled_type and (
+            self.max_amount is None or request.amount <= self.max_amount
+        )
 
-    @abstractmethod
     def handle_request(self, request: 'RentalRequest') -> str:
         """Обрабатывает запрос или передаёт следующему обработчику.
 
@@ -31,9 +62,47 @@ class RentalRequestHandler(ABC):
         Returns:
             Результат обработки запроса.
         """
-        pass
+        if self.can_handle(request):
+            return self.process(request)
+        elif self._successor and not self.terminal:
+            return self._successor.handle_request(request)
+        return self.reject(request)
+
+    def process(self, request: 'RentalRequest') -> str:
+        """Обрабатывает запрос, который обработчик может принять."""
+        raise NotImplementedError(f"{type(self).__name__} не реализует process")
+
+    def reject(self, request: 'RentalRequest') -> str:
+        """Возвращает ответ на запрос, который не обработал никто в цепочке."""
+        raise NotImplementedError(f"{type(self).__name__} не реализует reject")
 
-class RentalProcess(ABC):
+class _InstrumentReservation:
+    """Общая для синхронного и асинхронного процессов проверка и закрепление инструмента."""
+
+    def __init__(self, availability: Optional['AvailabilityIndex'] = None):
+        """Инициализация процесса.
+
+        Args:
+            availability: Индекс бронирований; если задан, доступность проверяется
+                по периоду аренды, а не по флагу инструмента.
+        """
+        self._availability = availability
+
+    def _is_instrument_free(self, rental: 'Rental') -> bool:
+        """Проверяет, свободен ли инструмент на период аренды."""
+        if self._availability is None:
+            return rental.instrument.is_available
+        return self._availability.is_free(rental.instrument.instrument_id, rental.start_date, rental.end_date)
+
+    def _reserve_instrument(self, rental: 'Rental') -> None:
+        """Закрепляет инструмент за арендой: флагом или бронированием периода."""
+        if self._availability is None:
+            rental.rent_instrument()
+        else:
+            rental.reserve(self._availability)
+
+
+class RentalProcess(_InstrumentReservation, ABC):
     """Абстрактный класс для процесса аренды инструмента."""
 
     def rent_instrument(self, rental: 'Rental') -> None:
@@ -59,4 +128,91 @@ class RentalProcess(ABC):
     @abstractmethod
     def confirm_rental(self, rental: 'Rental') -> None:
         """Подтверждает аренду."""
-        pass
\ No newline at end of file
+        pass
+
+
+class AsyncRentalProcess(_InstrumentReservation, ABC):
+    """Абстрактный класс для асинхронного процесса аренды инструмента.
+
+    Шаги процесса — корутины, поэтому множество аренд проходит через него
+    одновременно в одном цикле событий. Проверка и оформление выполняются
+    под блокировкой инструмента, а подтверждение (обычно ввод-вывод) — уже
+    без неё, чтобы подтверждения разных аренд перекрывались.
+    """
+
+    def __init__(self, availability: Optional['AvailabilityIndex'] = None):
+        """Инициализация процесса.
+
+        Args:
+            availability: Индекс бронирований; если задан, доступность проверяется
+                по периоду аренды, а не по флагу инструмента.
+        """
+        super().__init__(availability)
+        # Блокировки по идентификатору инструмента с числом аренд, которые её держат или ждут
+        self._locks: Dict[UUID, List] = {}
+
+    @asynccontextmanager
+    async def _instrument_lock(self, instrument_id: UUID) -> AsyncIterator[None]:
+        """Держит блокировку инструмента; блокировка удаляется, когда её больше никто не ждёт."""
+        entry = self._locks.get(instrument_id)
+        if entry is None:
+            entry = self._locks[instrument_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._locks[instrument_id]
+
+    async def rent_instrument(self, rental: 'Rental') -> None:
+        """Шаблонный метод для асинхронного процесса аренды.
+
+        Args:
+            rental: Объект аренды.
+        """
+        async with self._instrument_lock(rental.instrument.instrument_id):
+            await self.check_availability(rental)
+            await self.process_rental(rental)
+        await self.confirm_rental(rental)
+
+    async def rent_many(
+            self,
+            rentals: Iterable['Rental'],
+            concurrency: Optional[int] = None
+    ) -> List[Optional[BaseException]]:
+        """Проводит аренды через процесс одновременно.
+
+        Args:
+            rentals: Аренды.
+            concurrency: Максимальное число аренд в обработке одновременно
+                (None — без ограничения).
+
+        Returns:
+            Для каждой аренды None при успехе или возникшее исключение.
+        """
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def rent(rental: 'Rental') -> None:
+            if semaphore is None:
+                return await self.rent_instrument(rental)
+            async with semaphore:
+                return await self.rent_instrument(rental)
+
+        return await asyncio.gather(*(rent(rental) for rental in rentals), return_exceptions=True)
+
+    @abstractmethod
+    async def check_availability(self, rental: 'Rental') -> None:
+        """Проверяет доступность инструмента."""
+        pass
+
+    @abstractmethod
+    async def process_rental(self, rental: 'Rental') -> None:
+        """Оформляет аренду."""
+        pass
+
+    @abstractmethod
+    async def confirm_rental(self, rental: 'Rental') -> None:
+        """Подтверждает аренду."""
+        pass
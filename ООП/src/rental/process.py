@@ -1,45 +1,95 @@
+from typing import Optional
 from .interfaces import RentalProcess
 from .rental import Rental
-import logging
+from .availability import AvailabilityIndex
+from utils import LoggingMixin
 
 
-class OnlineRentalProcess(RentalProcess):
+class _RentalSteps(LoggingMixin):
+    """Тела шагов аренды канала, общие для синхронного и асинхронного процессов.
+
+    Классы процессов (в том числе из async_process) только вызывают эти
+    методы, поэтому синхронный и асинхронный процессы не расходятся.
+    """
+
+    _channel: str = ''  # Название канала в сообщениях
+
+    def _check_step(self, rental: Rental) -> None:
+        if not self._is_instrument_free(rental):
+            raise ValueError(f"Инструмент {rental.instrument.name} недоступен для аренды")
+        self._logger.info("%s: Проверена доступность инструмента %s", self._channel, rental.instrument.name)
+
+    def _process_step(self, rental: Rental) -> None:
+        self._reserve_instrument(rental)
+        self._logger.info("%s: Оформлена аренда #%s для %s", self._channel, rental.rental_id, rental.customer.name)
+
+    def _confirmation(self, rental: Rental) -> str:
+        """Текст подтверждения аренды."""
+        raise NotImplementedError
+
+    def _log_confirmation(self, rental: Rental) -> None:
+        raise NotImplementedError
+
+
+class _OnlineSteps(_RentalSteps):
+    _channel = "Онлайн"
+
+    def _confirmation(self, rental: Rental) -> str:
+        return f"Онлайн: Ваша аренда #{rental.rental_id} подтверждена для {rental.customer.email}"
+
+    def _log_confirmation(self, rental: Rental) -> None:
+        self._logger.info("Онлайн: Отправлено подтверждение аренды #%s на %s", rental.rental_id, rental.customer.email)
+
+
+class _OfflineSteps(_RentalSteps):
+    _channel = "Оффлайн"
+
+    def _confirmation(self, rental: Rental) -> str:
+        return f"Оффлайн: Аренда #{rental.rental_id} подтверждена для {rental.customer.name} в офисе"
+
+    def _log_confirmation(self, rental: Rental) -> None:
+        self._logger.info("Оффлайн: Выдано подтверждение аренды #%s для %s", rental.rental_id, rental.customer.name)
+
+
+class OnlineRentalProcess(RentalProcess, _OnlineSteps):
     """Класс для управления процессом аренды инструментов онлайн."""
 
-    def __init__(self):
-        """Инициализирует процесс онлайн-аренды."""
-        self._logger = logging.getLogger(self.__class__.__name__)
+    def __init__(self, availability: Optional[AvailabilityIndex] = None):
+        """Инициализирует процесс онлайн-аренды.
+
+        Args:
+            availability: Индекс бронирований (опционально).
+        """
+        super().__init__(availability)
 
     def check_availability(self, rental: Rental) -> None:
-        if not rental.instrument.is_available:
-            raise ValueError(f"Инструмент {rental.instrument.name} недоступен для аренды")
-        self._logger.info(f"Онлайн: Проверена доступность инструмента {rental.instrument.name}")
+        self._check_step(rental)
 
     def process_rental(self, rental: Rental) -> None:
-        rental.rent_instrument()
-        self._logger.info(f"Онлайн: Оформлена аренда #{rental.rental_id} для {rental.customer.name}")
+        self._process_step(rental)
 
     def confirm_rental(self, rental: Rental) -> None:
-        rental.notify(f"Онлайн: Ваша аренда #{rental.rental_id} подтверждена для {rental.customer.email}")
-        self._logger.info(f"Онлайн: Отправлено подтверждение аренды #{rental.rental_id} на {rental.customer.email}")
+        rental.notify(self._confirmation(rental))
+        self._log_confirmation(rental)
 
 
-class OfflineRentalProcess(RentalProcess):
+class OfflineRentalProcess(RentalProcess, _OfflineSteps):
     """Класс для управления процессом аренды инструментов оффлайн."""
 
-    def __init__(self):
-        """Инициализирует процесс оффлайн-аренды."""
-        self._logger = logging.getLogger(self.__class__.__name__)
+    def __init__(self, availability: Optional[AvailabilityIndex] = None):
+        """Инициализирует процесс оффлайн-аренды.
+
+        Args:
+            availability: Индекс бронирований (опционально).
+        """
+        super().__init__(availability)
 
     def check_availability(self, rental: Rental) -> None:
-        if not rental.instrument.is_available:
-            raise ValueError(f"Инструмент {rental.instrument.name} недоступен для аренды")
-        self._logger.info(f"Оффлайн: Проверена доступность инструмента {rental.instrument.name}")
+        self._check_step(rental)
 
     def process_rental(self, rental: Rental) -> None:
-        rental.rent_instrument()
-        self._logger.info(f"Оффлайн: Оформлена аренда #{rental.rental_id} для {rental.customer.name}")
+        self._process_step(rental)
 
     def confirm_rental(self, rental: Rental) -> None:
-        rental.notify(f"Оффлайн: Аренда #{rental.rental_id} подтверждена для {rental.customer.name} в офисе")
-        self._logger.info(f"Оффлайн: Выдано подтверждение аренды #{rental.rental_id} для {rental.customer.name}")
\ No newline at end of file
+        rental.notify(self._confirmation(rental))
+        self._log_confirmation(rental)
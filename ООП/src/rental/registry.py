@@ -0,0 +1,188 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+from utils import RentalNotFoundError
+
+
+class RentalRegistry:
+    """Реестр аренд с индексами по идентификатору, клиенту, инструменту и дате начала.
+
+    Поиск по идентификатору, клиенту и инструменту выполняется за O(1),
+    выборка по диапазону дат начала — за O(log n + k). Внутренние словари
+    индексируются по UUID.int: хеш целого числа считается в C, а не в
+    UUID.__hash__. Все операции выполняются под блокировкой реестра, поэтому
+    его можно использовать из нескольких потоков.
+    """
+
+    def __init__(self):
+        """Инициализирует пустой реестр."""
+        self._by_id: Dict[int, 'Rental'] = {}
+        self._by_customer: Dict[int, Dict[int, 'Rental']] = {}
+        self._by_instrument: Dict[int, Dict[int, 'Rental']] = {}
+        self._by_start: List[Tuple[int, int]] = []  # Отсортированные ключи (дата начала, rental_id.int)
+        self._keys: Dict[int, Tuple[int, int, Tuple[int, int]]] = {}  # Ключи, под которыми аренда проиндексирована
+        self._lock = threading.Lock()
+
+    def add(self, rental: 'Rental') -> None:
+        """Регистрирует аренду во всех индексах.
+
+        Повторная регистрация аренды с тем же идентификатором заменяет прежнюю запись.
+
+        Args:
+            rental: Объект аренды.
+        """
+        with self._lock:
+            self._discard(rental.rental_id.int)
+            insort(self._by_start, self._index(rental))
+
+    def add_many(self, rentals: Iterable['Rental']) -> None:
+        """Регистрирует пакет аренд, пересортировывая индекс дат один раз.
+
+        Args:
+            rentals: Объекты аренды.
+        """
+        # Повторы внутри пакета схлопываются: остаётся последняя аренда с данным ID
+        rentals = {rental.rental_id.int: rental for rental in rentals}
+        with self._lock:
+            by_id = self._by_id
+            # Заменяемые аренды удаляются до дозаписи ключей, пока индекс дат ещё отсортирован
+            for key in rentals.keys() & by_id.keys():
+                self._discard(key)
+            start_keys = self._by_start
+            for rental in rentals.values():
+                start_keys.append(self._index(rental))
+            start_keys.sort()
+
+    def _index(self, rental: 'Rental') -> Tuple[int, int]:
+        """Добавляет аренду в хеш-индексы и возвращает её ключ для индекса дат."""
+        rental_id = rental.rental_id.int
+        customer_id = rental.customer.customer_id.int
+        instrument_id = rental.instrument.instrument_id.int
+        start_key = (rental.start_date.toordinal(), rental_id)
+        self._by_id[rental_id] = rental
+        self._by_customer.setdefault(customer_id, {})[rental_id] = rental
+        self._by_instrument.setdefault(instrument_id, {})[rental_id] = rental
+        self._keys[rental_id] = (customer_id, instrument_id, start_key)
+        return start_key
+
+    def remove(self, rental_id: UUID) -> 'Rental':
+        """Удаляет аренду из всех индексов.
+
+        Args:
+            rental_id: Идентификатор аренды.
+
+        Returns:
+            Удалённый объект аренды.
+
+        Raises:
+            RentalNotFoundError: Если аренда не найдена.
+        """
+        with self._lock:
+            rental = self._discard(rental_id.int)
+        if rental is None:
+            raise RentalNotFoundError(f"Аренда с ID {rental_id} не найдена")
+        return rental
+
+    def _discard(self, key: int) -> Optional['Rental']:
+        rental = self._by_id.pop(key, None)
+        if rental is None:
+            return None
+        customer_id, instrument_id, start_key = self._keys.pop(key)
+        self._drop(self._by_customer, customer_id, key)
+        self._drop(self._by_instrument, instrument_id, key)
+        position = bisect_left(self._by_start, start_key)
+        del self._by_start[position]
+        return rental
+
+    def discard(self, rental_id: UUID) -> None:
+        """Удаляет аренду из реестра, если она там есть.
+
+        Args:
+            rental_id: Идентификатор аренды.
+        """
+        with self._lock:
+            self._discard(rental_id.int)
+
+    @staticmethod
+    def _drop(index: Dict[int, Dict[int, 'Rental']], key: int, rental_id: int) -> None:
+        bucket = index[key]
+        del bucket[rental_id]
+        if not bucket:
+            del index[key]
+
+    def get(self, rental_id: UUID) -> 'Rental':
+        """Возвращает аренду по идентификатору.
+
+        Args:
+            rental_id: Идентификатор аренды.
+
+        Returns:
+            Объект аренды.
+
+        Raises:
+            RentalNotFoundError: Если аренда не найдена.
+        """
+        try:
+            return self._by_id[rental_id.int]  # Одиночное чтение словаря атомарно, блокировка не нужна
+        except (KeyError, AttributeError):
+            raise RentalNotFoundError(f"Аренда с ID {rental_id} не найдена") from None
+
+    def by_customer(self, customer_id: UUID) -> List['Rental']:
+        """Возвращает аренды клиента в порядке регистрации.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            Список аренд.
+        """
+        with self._lock:
+            return list(self._by_customer.get(customer_id.int, {}).values())
+
+    def by_instrument(self, instrument_id: UUID) -> List['Rental']:
+        """Возвращает аренды инструмента в порядке регистрации.
+
+        Args:
+            instrument_id: Идентификатор инструмента.
+
+        Returns:
+            Список аренд.
+        """
+        with self._lock:
+            return list(self._by_instrument.get(instrument_id.int, {}).values())
+
+    def by_start_date(self, start: date, end: date) -> List['Rental']:
+        """Возвращает аренды, начинающиеся в диапазоне дат включительно.
+
+        Args:
+            start: Начало диапазона.
+            end: Конец диапазона.
+
+        Returns:
+            Список аренд, упорядоченный по дате начала.
+        """
+        with self._lock:
+            low = bisect_left(self._by_start, (start.toordinal(),))
+            high = bisect_right(self._by_start, (end.toordinal() + 1,))
+            return [self._by_id[key[1]] for key in self._by_start[low:high]]
+
+    def clear(self) -> None:
+        """Очищает реестр."""
+        with self._lock:
+            self._by_id.clear()
+            self._by_customer.clear()
+            self._by_instrument.clear()
+            self._by_start.clear()
+            self._keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, rental_id: object) -> bool:
+        return isinstance(rental_id, UUID) and rental_id.int in self._by_id
+
+    def __iter__(self) -> Iterator['Rental']:
+        with self._lock:
+            return iter(list(self._by_id.values()))
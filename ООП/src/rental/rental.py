@@ -1,18 +1,58 @@
+import os
 from uuid import UUID, uuid4
 from datetime import datetime, date
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable, TextIO, Tuple, Union
 from .customer import Customer
-from .accessory import Accessory
+from .accessory import Accessory, AccessoryCatalog
 from instruments.musical_instrument import MusicalInstrument
 from .interfaces import Rentable, Reportable
-from utils import NotificationMixin, check_permissions, RentalNotFoundError
-import logging
-
-
-class Rental(Rentable, Reportable, NotificationMixin):
+from .registry import RentalRegistry
+from .reporting import ReportPayload, format_report, write_reports
+from utils import (
+    NotificationMixin, LoggingMixin, check_permissions, BookingConflictError, RentalNotFoundError, get_journal
+)
+
+
+def _resolve_reference(data: Dict, kind: str, identity_map: Dict[str, object], factory) -> object:
+    """Возвращает клиента или инструмент записи аренды через карту идентичности.
+
+    Нормализованная запись ссылается на объект полем '<kind>_id'; запись в
+    прежнем формате содержит вложенный словарь '<kind>', который
+    восстанавливается один раз на идентификатор.
+    """
+    key = kind + '_id'
+    reference = data.get(key)
+    if reference is not None:
+        try:
+            return identity_map[reference]
+        except KeyError:
+            raise ValueError(f"Аренда {data.get('rental_id')} ссылается на неизвестный {key}: {reference}") from None
+    embedded = data[kind]
+    reference = embedded.get(key)
+    obj = identity_map.get(reference) if reference is not None else None
+    if obj is None:
+        obj = factory(embedded)
+        if reference is not None:
+            identity_map[reference] = obj
+    return obj
+
+
+def _uuid4_batch(count: int) -> List[UUID]:
+    """Генерирует пакет случайных UUID версии 4 одним обращением к os.urandom."""
+    data = os.urandom(16 * count)
+    return [UUID(bytes=data[offset:offset + 16], version=4) for offset in range(0, 16 * count, 16)]
+
+
+class Rental(Rentable, Reportable, NotificationMixin, LoggingMixin):
     """Класс для управления арендой музыкальных инструментов."""
 
-    _rentals: List['Rental'] = []  # Реестр всех аренд
+    __slots__ = (
+        '_rental_id', '_customer', '_instrument', '_start_date', '_end_date', '_accessories',
+        '_accessories_cost', '_accessories_version', '_total_key', '_total_cost', '_report_cache',
+        '_logging_muted'
+    )
+
+    _registry: RentalRegistry = RentalRegistry()  # Реестр всех аренд
 
     def __init__(
             self,
@@ -32,22 +72,142 @@ class Rental(Rentable, Reportable, NotificationMixin):
         Raises:
             ValueError: Если дата начала позже даты окончания.
         """
-        self._logger = logging.getLogger(self.__class__.__name__)
         if start_date > end_date:
             raise ValueError("Дата начала аренды не может быть позже даты окончания")
-        self._rental_id: UUID = uuid4()
+        self._setup(customer, instrument, start_date, end_date, uuid4())
+        self.calculate_total()
+        self._registry.add(self)  # Добавляем аренду в реестр
+        journal = get_journal()
+        if journal is not None:
+            journal.rental_created(self)
+        self._logger.info("Создана аренда #%s для %s", self._rental_id, customer.name)
+        self.notify(
+            f"Ваш инструмент {instrument.name} готов к выдаче для {customer.email}"
+        )
+
+    def _setup(
+            self,
+            customer: Customer,
+            instrument: MusicalInstrument,
+            start_date: date,
+            end_date: date,
+            rental_id: UUID
+    ) -> None:
+        """Заполняет поля аренды без побочных эффектов (расчёта, реестра, логов и уведомлений)."""
+        self._logging_muted: bool = False
+        self._rental_id: UUID = rental_id
         self._customer: Customer = customer
         self._instrument: MusicalInstrument = instrument
         self._start_date: date = start_date
         self._end_date: date = end_date
-        self._accessories: List[Accessory] = []
+        self._accessories: Dict[UUID, Tuple[Accessory, int]] = {}  # accessory_id -> (аксессуар, количество)
+        self._accessories_cost: float = 0.0  # Стоимость всех аксессуаров за день
+        self._accessories_version: int = 0
+        self._total_key: Optional[tuple] = None  # Параметры, по которым рассчитана _total_cost
         self._total_cost: float = 0.0
-        self.calculate_total()
-        self._rentals.append(self)  # Добавляем аренду в реестр
-        self._logger.info(f"Создана аренда #{self._rental_id} для {customer.name}")
-        self.notify(
-            f"Ваш инструмент {instrument.name} готов к выдаче для {customer.email}"
-        )
+        self._report_cache: Optional[Tuple[tuple, str]] = None  # (версия аренды, текст отчёта)
+
+    def _calculate_total_quietly(self) -> None:
+        """Рассчитывает стоимость без записи в лог аренды и инструмента."""
+        self._total_key = (self._instrument.pricing_version, self._accessories_version)
+        self._total_cost = self._compute_total(quiet=True)
+
+    @classmethod
+    def _register_batch(cls, rentals: List['Rental'], action: str) -> None:
+        """Регистрирует пакет аренд и пишет одну итоговую запись в лог."""
+        cls._registry.add_many(rentals)
+        cls._logger.info("%s аренд пакетом: %s", action, len(rentals))
+
+    @classmethod
+    def bulk_create(
+            cls,
+            records: Iterable[Tuple[Customer, MusicalInstrument, date, date]],
+            notify: bool = True
+    ) -> List['Rental']:
+        """Создаёт пакет аренд без побочных эффектов для каждой записи.
+
+        Все записи проверяются до создания первой аренды; идентификаторы
+        генерируются одним вызовом os.urandom, аренды регистрируются в реестре
+        разом, а вместо лога и уведомления на каждую аренду отправляется
+        одна итоговая запись.
+
+        Args:
+            records: Кортежи (клиент, инструмент, дата начала, дата окончания).
+            notify: Отправить итоговое уведомление о созданных арендах.
+
+        Returns:
+            Список созданных аренд в порядке записей.
+
+        Raises:
+            ValueError: Если у какой-либо записи дата начала позже даты окончания.
+        """
+        records = list(records)
+        for position, (_, _, start_date, end_date) in enumerate(records):
+            if start_date > end_date:
+                raise ValueError(f"Запись {position}: дата начала аренды не может быть позже даты окончания")
+        rentals = []
+        for (customer, instrument, start_date, end_date), rental_id in zip(records, _uuid4_batch(len(records))):
+            rental = cls.__new__(cls)
+            rental._setup(customer, instrument, start_date, end_date, rental_id)
+            rental._calculate_total_quietly()
+            rentals.append(rental)
+        cls._register_batch(rentals, "Создано")
+        journal = get_journal()
+        if journal is not None:
+            journal.rentals_created(rentals)
+        if notify and rentals:
+            rentals[-1].notify(f"Оформлено аренд: {len(rentals)}")
+        return rentals
+
+    @classmethod
+    def bulk_from_dict(
+            cls,
+            records: Iterable[Dict],
+            customers: Optional[Dict[str, Customer]] = None,
+            instruments: Optional[Dict[str, MusicalInstrument]] = None,
+            accessories: Optional[AccessoryCatalog] = None
+    ) -> List['Rental']:
+        """Восстанавливает пакет аренд из словарей без уведомлений и логов на каждую запись.
+
+        Клиенты и инструменты разрешаются через карты идентичности, поэтому
+        аренды одного клиента (инструмента) ссылаются на один объект.
+
+        Args:
+            records: Словари в формате to_record() или to_dict().
+            customers: Карта идентичности {customer_id: клиент}; дополняется
+                клиентами, восстановленными из вложенных словарей.
+            instruments: Карта идентичности {instrument_id: инструмент}.
+            accessories: Каталог аксессуаров загрузки; по умолчанию новый
+                для каждого вызова.
+
+        Returns:
+            Список аренд в порядке записей.
+
+        Raises:
+            ValueError: Если у какой-либо записи дата начала позже даты окончания
+                или запись ссылается на отсутствующего клиента или инструмент.
+        """
+        customers = {} if customers is None else customers
+        instruments = {} if instruments is None else instruments
+        accessories = AccessoryCatalog() if accessories is None else accessories
+        rentals = []
+        for position, data in enumerate(records):
+            start_date = date.fromisoformat(data['start_date'])
+            end_date = date.fromisoformat(data['end_date'])
+            if start_date > end_date:
+                raise ValueError(f"Запись {position}: дата начала аренды не может быть позже даты окончания")
+            rental = cls.__new__(cls)
+            rental._setup(
+                _resolve_reference(data, 'customer', customers, Customer.from_dict),
+                _resolve_reference(data, 'instrument', instruments, MusicalInstrument.from_dict),
+                start_date, end_date, UUID(data['rental_id'])
+            )
+            for acc_data in data.get('accessories', []):
+                rental._put_accessory(Accessory.from_dict(acc_data, accessories))
+            rental._calculate_total_quietly()
+            rentals.append(rental)
+        cls._register_batch(rentals, "Загружено")
+        return rentals
 
     @property
     def rental_id(self) -> UUID:
@@ -67,6 +227,11 @@ class Rental(Rentable, Reportable, NotificationMixin):
         """
         return self._customer
 
+    @property
+    def notification_recipient(self) -> str:
+        """Уведомления об аренде доставляются на email клиента."""
+        return self._customer.email
+
     @property
     def instrument(self) -> MusicalInstrument:
         """Возвращает арендованный инструмент.
@@ -107,25 +272,55 @@ class Rental(Rentable, Reportable, NotificationMixin):
     def accessories(self) -> List[Accessory]:
         """Возвращает список аксессуаров, включённых в аренду.
 
+        Аксессуар, добавленный несколько раз, повторяется в списке.
+
         Returns:
             Список аксессуаров.
         """
-        return self._accessories
+        return [accessory for accessory, quantity in self._accessories.values() for _ in range(quantity)]
+
+    def accessory_quantity(self, accessory_id: UUID) -> int:
+        """Возвращает количество единиц аксессуара в аренде.
+
+        Args:
+            accessory_id: Идентификатор аксессуара.
+
+        Returns:
+            Количество (0, если аксессуара нет).
+        """
+        entry = self._accessories.get(accessory_id)
+        return 0 if entry is None else entry[1]
+
+    def _put_accessory(self, accessory: Accessory, quantity: int = 1) -> None:
+        """Добавляет единицы аксессуара и обновляет дневную стоимость аксессуаров."""
+        entry = self._accessories.get(accessory.accessory_id)
+        self._accessories[accessory.accessory_id] = (accessory, quantity if entry is None else entry[1] + quantity)
+        self._accessories_cost += accessory.cost * quantity
+        self._accessories_version += 1
 
     @check_permissions("can_modify_rental")
-    def add_accessory(self, accessory: Accessory) -> None:
+    def add_accessory(self, accessory: Accessory, quantity: int = 1) -> None:
         """Добавляет аксессуар к аренде.
 
         Args:
             accessory: Аксессуар для добавления.
+            quantity: Количество единиц.
+
+        Raises:
+            ValueError: Если количество не положительно.
         """
-        self._accessories.append(accessory)
+        if quantity <= 0:
+            raise ValueError("Количество аксессуаров должно быть положительным")
+        self._put_accessory(accessory, quantity)
         self.calculate_total()
-        self._logger.info(f"Добавлен аксессуар {accessory.name} к аренде #{self._rental_id}")
+        journal = get_journal()
+        if journal is not None:
+            journal.accessory_added(self, accessory, quantity)
+        self._logger.info("Добавлен аксессуар %s к аренде #%s", accessory.name, self._rental_id)
 
     @check_permissions("can_modify_rental")
     def remove_accessory(self, accessory_id: UUID) -> None:
-        """Удаляет аксессуар из аренды.
+        """Удаляет одну единицу аксессуара из аренды.
 
         Args:
             accessory_id: Идентификатор аксессуара.
@@ -133,30 +328,80 @@ class Rental(Rentable, Reportable, NotificationMixin):
         Raises:
             ValueError: Если аксессуар не найден.
         """
-        for accessory in self._accessories:
-            if accessory.accessory_id == accessory_id:
-                self._accessories.remove(accessory)
-                self.calculate_total()
-                self._logger.info(f"Удален аксессуар {accessory.name} из аренды #{self._rental_id}")
-                return
-        raise ValueError("Аксессуар не найден")
+        entry = self._accessories.get(accessory_id)
+        if entry is None:
+            raise ValueError("Аксессуар не найден")
+        accessory, quantity = entry
+        if quantity > 1:
+            self._accessories[accessory_id] = (accessory, quantity - 1)
+            self._accessories_cost -= accessory.cost
+        else:
+            del self._accessories[accessory_id]
+            # Пустой набор сбрасывает сумму, чтобы не копить ошибку округления
+            self._accessories_cost = self._accessories_cost - accessory.cost if self._accessories else 0.0
+        self._accessories_version += 1
+        self.calculate_total()
+        journal = get_journal()
+        if journal is not None:
+            journal.accessory_removed(self, accessory_id)
+        self._logger.info("Удален аксессуар %s из аренды #%s", accessory.name, self._rental_id)
 
     def calculate_total(self) -> None:
-        """Рассчитывает общую стоимость аренды, включая инструмент и аксессуары."""
+        """Рассчитывает общую стоимость аренды, включая инструмент и аксессуары.
+
+        Пересчёт пропускается, если с прошлого расчёта не менялись ни тарифные
+        параметры инструмента, ни набор аксессуаров.
+        """
+        key = (self._instrument.pricing_version, self._accessories_version)
+        if key == self._total_key:
+            return
+        self._total_key = key
+        self._total_cost = self._compute_total()
+        if self._end_date > self._start_date:  # Как и прежде, аренда без дней не пишется в лог
+            self._logger.info("Рассчитана стоимость аренды #%s: %s", self._rental_id, self._total_cost)
+
+    def _compute_total(self, quiet: bool = False) -> float:
         days = (self._end_date - self._start_date).days
         if days <= 0:
-            self._total_cost = 0.0
-            return
-        instrument_cost = self._instrument.calculate_rental_cost(days)
-        accessories_cost = sum(accessory.cost * days for accessory in self._accessories)
-        self._total_cost = instrument_cost + accessories_cost
-        self._logger.info(f"Рассчитана стоимость аренды #{self._rental_id}: {self._total_cost}")
+            return 0.0
+        if quiet:
+            instrument_cost = self._instrument.quiet_rental_cost(days)
+        else:
+            instrument_cost = self._instrument.calculate_rental_cost(days)
+        return instrument_cost + self._accessories_cost * days
 
     @check_permissions("can_rent")
     def rent_instrument(self) -> None:
         """Арендует инструмент, устанавливая его как недоступный."""
         self._instrument.rent_instrument()
-        self._logger.info(f"Инструмент {self._instrument.name} арендован для {self._customer.name}")
+        self._logger.info("Инструмент %s арендован для %s", self._instrument.name, self._customer.name)
+
+    @check_permissions("can_rent")
+    def reserve(self, availability: 'AvailabilityIndex') -> None:
+        """Бронирует инструмент на период аренды.
+
+        Если период уже начался, инструмент также помечается как недоступный.
+
+        Args:
+            availability: Индекс бронирований.
+
+        Raises:
+            BookingConflictError: Если период пересекается с другим бронированием
+                или уже начавшийся период, а инструмент арендован.
+        """
+        current = self._start_date <= date.today() < self._end_date
+        if current and not self._instrument.try_reserve():
+            raise BookingConflictError(f"Инструмент {self._instrument.name} уже арендован")
+        try:
+            availability.book_rental(self, holds_instrument=current)
+        except BookingConflictError:
+            if current:
+                self._instrument.release()
+            raise
+        self._logger.info(
+            "Инструмент %s забронирован для %s на период %s - %s",
+            self._instrument.name, self._customer.name, self._start_date, self._end_date
+        )
 
     def generate_report(self) -> str:
         """Генерирует отчёт об аренде.
@@ -164,18 +409,71 @@ class Rental(Rentable, Reportable, NotificationMixin):
         Returns:
             Строковый отчёт об аренде.
         """
-        accessories_str = ", ".join(str(acc) for acc in self._accessories) or "нет аксессуаров"
-        report = (
-            f"Отчет по аренде #{self._rental_id}:\n"
-            f"Клиент: {self._customer.name}\n"
-            f"Инструмент: {self._instrument.name}\n"
-            f"Период: {self._start_date} - {self._end_date}\n"
-            f"Аксессуары: {accessories_str}\n"
-            f"Общая стоимость: {self._total_cost:.2f}"
+        cached = self._report_cache
+        report = self.render_report()
+        if self._report_cache is not cached:  # Пишем в лог только действительно перерисованный отчёт
+            self._logger.info("Сгенерирован отчет для аренды #%s", self._rental_id)
+        return report
+
+    def render_report(self) -> str:
+        """Возвращает отчёт об аренде без записи в лог, перерисовывая его только после изменений.
+
+        Отчёт кэшируется в аренде вместе с версией, от которой он зависит:
+        стоимостью, версией набора аксессуаров и названием инструмента
+        (клиент и даты аренды не меняются).
+
+        Returns:
+            Строковый отчёт об аренде.
+        """
+        key = (self._total_cost, self._accessories_version, self._instrument.name)
+        cached = self._report_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        accessories = []
+        for accessory, quantity in self._accessories.values():
+            accessories += [str(accessory)] * quantity
+        report = format_report(
+            str(self._rental_id), self._customer.name, key[2], self._start_date.isoformat(),
+            self._end_date.isoformat(), accessories, self._total_cost
         )
-        self._logger.info(f"Сгенерирован отчет для аренды #{self._rental_id}")
+        self._report_cache = (key, report)
         return report
 
+    def report_payload(self) -> ReportPayload:
+        """Возвращает компактные данные для отчёта, пригодные для передачи в другой процесс.
+
+        Returns:
+            Кортеж для render_payload.
+        """
+        return (
+            self._rental_id.int, self._customer.name, self._instrument.name,
+            self._start_date.toordinal(), self._end_date.toordinal(),
+            tuple(map(str, self.accessories)), self._total_cost
+        )
+
+    @classmethod
+    def write_reports(
+            cls,
+            rentals: Iterable['Rental'],
+            target: Union[str, TextIO],
+            workers: Optional[int] = None,
+            chunk_size: int = 2000
+    ) -> int:
+        """Генерирует отчёты по пакету аренд и записывает их в файл или приёмник по порядку.
+
+        Args:
+            rentals: Аренды, например Rental.find_rentals_by_start_date(...).
+            target: Путь к файлу или текстовый приёмник (открытый файл, io.StringIO).
+            workers: Количество процессов для записи в файл (по умолчанию — число ядер).
+            chunk_size: Количество аренд в пакете, передаваемом процессу.
+
+        Returns:
+            Количество записанных отчётов.
+        """
+        count = write_reports(rentals, target, workers, chunk_size)
+        cls._logger.info("Сгенерировано отчетов: %s в %s", count, getattr(target, 'name', target))
+        return count
+
     @classmethod
     def find_rental_by_id(cls, rental_id: UUID) -> 'Rental':
         """Находит аренду по её идентификатору.
@@ -189,10 +487,61 @@ class Rental(Rentable, Reportable, NotificationMixin):
         Raises:
             RentalNotFoundError: Если аренда не найдена.
         """
-        for rental in cls._rentals:
-            if rental.rental_id == rental_id:
-                return rental
-        raise RentalNotFoundError(f"Аренда с ID {rental_id} не найдена")
+        return cls._registry.get(rental_id)
+
+    @classmethod
+    def find_rentals_by_customer(cls, customer_id: UUID) -> List['Rental']:
+        """Находит все аренды клиента.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            Список аренд клиента.
+        """
+        return cls._registry.by_customer(customer_id)
+
+    @classmethod
+    def find_rentals_by_instrument(cls, instrument_id: UUID) -> List['Rental']:
+        """Находит все аренды инструмента.
+
+        Args:
+            instrument_id: Идентификатор инструмента.
+
+        Returns:
+            Список аренд инструмента.
+        """
+        return cls._registry.by_instrument(instrument_id)
+
+    @classmethod
+    def find_rentals_by_start_date(cls, start: date, end: date) -> List['Rental']:
+        """Находит аренды, начинающиеся в диапазоне дат включительно.
+
+        Args:
+            start: Начало диапазона.
+            end: Конец диапазона.
+
+        Returns:
+            Список аренд, упорядоченный по дате начала.
+        """
+        return cls._registry.by_start_date(start, end)
+
+    @classmethod
+    def close_rental(cls, rental_id: UUID) -> 'Rental':
+        """Закрывает аренду, удаляя её из реестра.
+
+        Args:
+            rental_id: Идентификатор аренды.
+
+        Returns:
+            Закрытая аренда.
+
+        Raises:
+            RentalNotFoundError: Если аренда не найдена.
+        """
+        rental = cls._registry.remove(rental_id)
+        rental._logger.info("Закрыта аренда #%s", rental_id)
+        return rental
 
     def to_dict(self) -> Dict:
         """Преобразует объект аренды в словарь.
@@ -206,31 +555,64 @@ class Rental(Rentable, Reportable, NotificationMixin):
             'instrument': self._instrument.to_dict(),
             'start_date': self._start_date.isoformat(),
             'end_date': self._end_date.isoformat(),
-            'accessories': [acc.to_dict() for acc in self._accessories],
+            'accessories': [acc.to_dict() for acc in self.accessories],
+            'total_cost': self._total_cost
+        }
+
+    def to_record(self) -> Dict:
+        """Преобразует аренду в нормализованную запись со ссылками на клиента и инструмент.
+
+        Returns:
+            Словарь, в котором вместо вложенных клиента и инструмента — их идентификаторы.
+        """
+        return {
+            'rental_id': str(self._rental_id),
+            'customer_id': str(self._customer.customer_id),
+            'instrument_id': str(self._instrument.instrument_id),
+            'start_date': self._start_date.isoformat(),
+            'end_date': self._end_date.isoformat(),
+            'accessories': [acc.to_dict() for acc in self.accessories],
             'total_cost': self._total_cost
         }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Rental':
+    def from_dict(
+            cls,
+            data: Dict,
+            customer: Optional[Customer] = None,
+            instrument: Optional[MusicalInstrument] = None,
+            accessories: Optional[AccessoryCatalog] = None
+    ) -> 'Rental':
         """Создаёт объект аренды из словаря.
 
         Args:
-            data: Словарь с данными об аренде.
+            data: Словарь в формате to_dict() или to_record().
+            customer: Уже восстановленный клиент (опционально, иначе создаётся из data).
+            instrument: Уже восстановленный инструмент (опционально, иначе создаётся из data).
+            accessories: Каталог аксессуаров загрузки (опционально).
 
         Returns:
             Экземпляр аренды.
+
+        Raises:
+            ValueError: Если запись в формате to_record(), а клиент или инструмент не переданы.
         """
-        customer = Customer.from_dict(data['customer'])
-        instrument = MusicalInstrument.from_dict(data['instrument'])
+        if customer is None:
+            customer = _resolve_reference(data, 'customer', {}, Customer.from_dict)
+        if instrument is None:
+            instrument = _resolve_reference(data, 'instrument', {}, MusicalInstrument.from_dict)
         start_date = date.fromisoformat(data['start_date'])
         end_date = date.fromisoformat(data['end_date'])
-        rental = cls(customer, instrument, start_date, end_date)
-        rental._rental_id = UUID(data['rental_id'])  # Восстанавливаем rental_id
+        if start_date > end_date:
+            raise ValueError("Дата начала аренды не может быть позже даты окончания")
+        # Восстановление — не создание аренды: без уведомления клиента и записи в журнал
+        rental = cls.__new__(cls)
+        rental._setup(customer, instrument, start_date, end_date, UUID(data['rental_id']))
         for acc_data in data.get('accessories', []):
-            accessory = Accessory.from_dict(acc_data)
-            rental._accessories.append(accessory)
-        rental._total_cost = data['total_cost']
+            rental._put_accessory(Accessory.from_dict(acc_data, accessories))
         rental.calculate_total()  # Пересчитываем для корректности
+        cls._registry.add(rental)
+        rental._logger.info("Восстановлена аренда #%s для %s", rental._rental_id, customer.name)
         return rental
 
     def __str__(self) -> str:
@@ -0,0 +1,185 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+from uuid import UUID
+
+# Данные, достаточные для отчёта: (rental_id.int, клиент, инструмент, порядковые номера дат
+# начала и конца, аксессуары, стоимость). Форматирование идентификатора и дат
+# выполняется уже в рабочем процессе.
+ReportPayload = Tuple[int, str, str, int, int, Sequence[str], float]
+
+REPORT_SEPARATOR = "\n\n"  # Разделитель отчётов в файле
+
+# Шаблон отчёта, разобранный один раз: связанный метод str.format
+_REPORT_TEMPLATE = (
+    "Отчет по аренде #{0}:\n"
+    "Клиент: {1}\n"
+    "Инструмент: {2}\n"
+    "Период: {3} - {4}\n"
+    "Аксессуары: {5}\n"
+    "Общая стоимость: {6:.2f}"
+).format
+
+
+def format_report(
+        rental_id: str,
+        customer_name: str,
+        instrument_name: str,
+        start_date: str,
+        end_date: str,
+        accessories: Sequence[str],
+        total_cost: float
+) -> str:
+    """Формирует текст отчёта об аренде; используется и Rental.generate_report, и пакетным рендерингом.
+
+    Args:
+        rental_id: Идентификатор аренды.
+        customer_name: Имя клиента.
+        instrument_name: Название инструмента.
+        start_date: Дата начала аренды.
+        end_date: Дата окончания аренды.
+        accessories: Строковые представления аксессуаров.
+        total_cost: Общая стоимость аренды.
+
+    Returns:
+        Строковый отчёт об аренде.
+    """
+    return _REPORT_TEMPLATE(
+        rental_id, customer_name, instrument_name, start_date, end_date,
+        ", ".join(accessories) or "нет аксессуаров", total_cost
+    )
+
+
+def render_payload(payload: ReportPayload) -> str:
+    """Формирует отчёт по данным Rental.report_payload().
+
+    Args:
+        payload: Компактные данные аренды.
+
+    Returns:
+        Строковый отчёт об аренде.
+    """
+    rental_id, customer_name, instrument_name, start, end, accessories, total_cost = payload
+    return format_report(
+        str(UUID(int=rental_id)), customer_name, instrument_name,
+        date.fromordinal(start).isoformat(), date.fromordinal(end).isoformat(), accessories, total_cost
+    )
+
+
+def _render_chunk(payloads: List[ReportPayload]) -> str:
+    """Рендерит пакет отчётов в одну строку (выполняется в рабочем процессе)."""
+    return REPORT_SEPARATOR.join(map(render_payload, payloads)) + REPORT_SEPARATOR
+
+
+def _payload_chunks(rentals: Iterable['Rental'], chunk_size: int) -> Iterator[List[ReportPayload]]:
+    iterator = iter(rentals)
+    while True:
+        chunk = [rental.report_payload() for rental in islice(iterator, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_report_chunks(
+        rentals: Iterable['Rental'],
+        workers: Optional[int] = None,
+        chunk_size: int = 2000
+) -> Iterator[str]:
+    """Рендерит отчёты пакетами в пуле процессов и выдаёт их в порядке аренд.
+
+    В рабочие процессы передаются компактные кортежи report_payload(), а не
+    живые объекты. Одновременно в работе держится не больше 2 * workers
+    пакетов, поэтому память не растёт с размером выборки.
+
+    Args:
+        rentals: Аренды.
+        workers: Количество процессов (по умолчанию — число ядер); при 1
+            отчёты рендерятся в текущем процессе.
+        chunk_size: Количество аренд в пакете.
+
+    Yields:
+        Текст пакета отчётов, каждый отчёт завершается REPORT_SEPARATOR.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _payload_chunks(rentals, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            yield _render_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_render_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def stream_reports(rentals: Iterable['Rental'], sink: TextIO, separator: str = REPORT_SEPARATOR) -> int:
+    """Пишет отчёты по арендам в приёмник по одному, не собирая их в общую строку.
+
+    Отчёты берутся из кэша аренд (Rental.render_report), поэтому повторная
+    выгрузка неизменившихся аренд не перерисовывает их.
+
+    Args:
+        rentals: Аренды.
+        sink: Текстовый приёмник: буферизованный файл, io.StringIO и т.п.
+        separator: Строка, записываемая после каждого отчёта.
+
+    Returns:
+        Количество записанных отчётов.
+    """
+    write = sink.write
+    count = 0
+    for rental in rentals:
+        write(rental.render_report())
+        write(separator)
+        count += 1
+    return count
+
+
+def write_reports(
+        rentals: Iterable['Rental'],
+        target: Union[str, TextIO],
+        workers: Optional[int] = None,
+        chunk_size: int = 2000,
+        buffer_size: int = 1 << 20
+) -> int:
+    """Записывает отчёты по арендам в файл или приёмник в порядке аренд.
+
+    В приёмник и при workers == 1 отчёты пишутся через stream_reports в
+    текущем процессе с использованием кэша аренд; иначе рендерятся пакетами
+    в пуле процессов.
+
+    Args:
+        rentals: Аренды.
+        target: Путь к файлу или текстовый приёмник с методом write.
+        workers: Количество процессов (по умолчанию — число ядер).
+        chunk_size: Количество аренд в пакете.
+        buffer_size: Размер буфера файла в байтах.
+
+    Returns:
+        Количество записанных отчётов.
+    """
+    if hasattr(target, 'write'):
+        return stream_reports(rentals, target)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        with open(target, 'w', encoding='utf-8', buffering=buffer_size) as f:
+            return stream_reports(rentals, f)
+    count = 0
+
+    def counted(items: Iterable['Rental']) -> Iterator['Rental']:
+        nonlocal count
+        for item in items:
+            count += 1
+            yield item
+
+    with open(target, 'w', encoding='utf-8', buffering=buffer_size) as f:
+        for text in iter_report_chunks(counted(rentals), workers, chunk_size):
+            f.write(text)
+    return count
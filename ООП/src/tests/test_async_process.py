@@ -0,0 +1,62 @@
+import asyncio
+import unittest
+from datetime import date, timedelta
+
+from instruments import Guitar, Piano
+from rental import AsyncOnlineRentalProcess, AvailabilityIndex, Customer, OnlineRentalProcess, Rental
+from utils import BookingConflictError
+
+
+class AsyncRentalProcessTest(unittest.TestCase):
+    """Асинхронный процесс аренды ведёт себя как синхронный и не копит блокировки."""
+
+    def setUp(self):
+        self.customer = Customer("Иван", "ivan@example.com", "+70000000000", ["can_rent"])
+        self.guitar = Guitar("Fender", "new", 100.0, 6)
+        self.piano = Piano("Yamaha", "new", 200.0, 88)
+        self.start = date.today() + timedelta(days=5)
+
+    def _rentals(self):
+        return [
+            Rental(self.customer, self.guitar, self.start, self.start + timedelta(days=2)),
+            Rental(self.customer, self.guitar, self.start + timedelta(days=1), self.start + timedelta(days=3)),
+            Rental(self.customer, self.piano, self.start, self.start + timedelta(days=2)),
+        ]
+
+    def test_matches_sync_process_and_drops_locks(self):
+        sent = []
+
+        async def sender(recipient, message):
+            await asyncio.sleep(0)
+            sent.append(message)
+
+        index = AvailabilityIndex()
+        index.add_instruments([self.guitar, self.piano])
+        process = AsyncOnlineRentalProcess(index, sender)
+        rentals = self._rentals()
+        results = asyncio.run(process.rent_many(rentals))
+
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsNone(results[2])
+        self.assertEqual(process._locks, {})
+        self.assertEqual(sent, [
+            f"Онлайн: Ваша аренда #{rentals[0].rental_id} подтверждена для {self.customer.email}",
+            f"Онлайн: Ваша аренда #{rentals[2].rental_id} подтверждена для {self.customer.email}",
+        ])
+
+        sync_index = AvailabilityIndex()
+        sync_index.add_instruments([self.guitar, self.piano])
+        sync_process = OnlineRentalProcess(sync_index)
+        sync_results = []
+        for rental in self._rentals():
+            try:
+                sync_process.rent_instrument(rental)
+                sync_results.append(None)
+            except (ValueError, BookingConflictError) as error:
+                sync_results.append(error)
+        self.assertEqual([type(result) for result in results], [type(result) for result in sync_results])
+
+
+if __name__ == '__main__':
+    unittest.main()
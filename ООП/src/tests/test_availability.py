@@ -0,0 +1,93 @@
+import threading
+import unittest
+from datetime import date, timedelta
+
+from instruments import Guitar, Piano
+from rental import AvailabilityIndex, Customer, Rental
+from utils import BookingConflictError
+
+
+class AvailabilityIndexTest(unittest.TestCase):
+    """Поиск конфликтов и свободных инструментов по периодам [start, end)."""
+
+    def setUp(self):
+        self.index = AvailabilityIndex()
+        self.first = Guitar("Fender", "new", 100.0, 6)
+        self.second = Guitar("Gibson", "used", 80.0, 6)
+        self.piano = Piano("Yamaha", "new", 200.0, 88)
+        self.index.add_instruments([self.first, self.second, self.piano])
+        self.customer = Customer("Иван", "ivan@example.com", "+70000000000", ["can_rent"])
+
+    def test_conflicts_and_free_instruments(self):
+        anonymous = self.index.book(self.first.instrument_id, date(2026, 1, 10), date(2026, 1, 20))
+        rental = Rental(self.customer, self.first, date(2026, 1, 25), date(2026, 1, 28))
+        self.index.book_rental(rental)
+
+        self.assertTrue(self.index.is_free(self.first.instrument_id, date(2026, 1, 1), date(2026, 1, 10)))
+        self.assertTrue(self.index.is_free(self.first.instrument_id, date(2026, 1, 20), date(2026, 1, 25)))
+        self.assertFalse(self.index.is_free(self.first.instrument_id, date(2026, 1, 19), date(2026, 1, 21)))
+        self.assertEqual(self.index.conflicts(self.first.instrument_id, date(2026, 1, 15), date(2026, 1, 26)),
+                         [anonymous, rental.rental_id])
+        self.assertEqual(self.index.conflicts(self.first.instrument_id, date(2026, 1, 20), date(2026, 1, 25)), [])
+
+        self.assertEqual(self.index.free_instruments('guitar', date(2026, 1, 12), date(2026, 1, 14)), [self.second])
+        self.assertEqual(self.index.free_instruments('Guitar', date(2026, 2, 1), date(2026, 2, 2)),
+                         [self.first, self.second])
+        self.assertEqual(self.index.free_instruments('piano', date(2026, 1, 12), date(2026, 1, 14)), [self.piano])
+
+        with self.assertRaises(BookingConflictError):
+            self.index.book(self.first.instrument_id, date(2026, 1, 18), date(2026, 1, 22))
+        self.index.release(rental.rental_id)
+        self.assertTrue(self.index.is_free(self.first.instrument_id, date(2026, 1, 25), date(2026, 1, 28)))
+        self.index.release(anonymous)
+        self.assertTrue(self.index.is_free(self.first.instrument_id, date(2026, 1, 1), date(2026, 2, 1)))
+        self.assertEqual(self.index.bookings(self.first.instrument_id), [])
+
+    def test_release_restores_availability_of_current_booking(self):
+        today = date.today()
+        rental = Rental(self.customer, self.first, today, today + timedelta(days=3))
+        rental.reserve(self.index)
+        self.assertFalse(self.first.is_available)
+        later = Rental(self.customer, self.first, today + timedelta(days=1), today + timedelta(days=2))
+        with self.assertRaises(BookingConflictError):
+            later.reserve(self.index)
+        self.assertFalse(self.first.is_available)
+
+        self.index.release(rental.rental_id)
+        self.assertTrue(self.first.is_available)
+        with self.assertRaises(KeyError):
+            self.index.release(rental.rental_id)
+
+    def test_future_booking_keeps_instrument_available(self):
+        start = date.today() + timedelta(days=10)
+        rental = Rental(self.customer, self.second, start, start + timedelta(days=2))
+        rental.reserve(self.index)
+        self.assertTrue(self.second.is_available)
+        self.second.rent_instrument()
+        self.index.release(rental.rental_id)
+        self.assertFalse(self.second.is_available)  # Чужая текущая аренда не снимается
+
+    def test_concurrent_release_frees_once(self):
+        rental = Rental(self.customer, self.piano, date(2026, 5, 1), date(2026, 5, 3))
+        self.index.book_rental(rental)
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def release():
+            barrier.wait()
+            try:
+                self.index.release(rental.rental_id)
+            except KeyError:
+                errors.append(rental.rental_id)
+
+        threads = [threading.Thread(target=release) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 7)
+        self.assertEqual(self.index.bookings(self.piano.instrument_id), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
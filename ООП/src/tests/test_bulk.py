@@ -0,0 +1,53 @@
+import unittest
+from datetime import date, timedelta
+
+from instruments import Guitar, Piano, Violin
+from rental import Customer, Rental
+
+
+class BulkRentalsTest(unittest.TestCase):
+    """Пакетное создание и загрузка аренд пишут в лог одну итоговую запись."""
+
+    def setUp(self):
+        self.customer = Customer("Иван", "ivan@example.com", "+70000000000", ["can_rent"])
+        factories = (
+            lambda n: Guitar(f"Гитара {n}", 'new', 100.0 + n, 6),
+            lambda n: Piano(f"Пианино {n}", 'used', 200.0 + n, 88),
+            lambda n: Violin(f"Скрипка {n}", 'refurbished', 150.0 + n, n % 2 == 0),
+        )
+        self.instruments = [factories[n % 3](n) for n in range(300)]
+        start = date(2026, 1, 1)
+        self.records = [
+            (self.customer, instrument, start, start + timedelta(days=1 + n % 10))
+            for n, instrument in enumerate(self.instruments)
+        ]
+
+    def test_bulk_create_logs_one_summary(self):
+        with self.assertLogs(level='INFO') as logs:
+            rentals = Rental.bulk_create(self.records, notify=False)
+        self.assertEqual(len(logs.records), 1, logs.output)
+        for rental, (_, instrument, start, end) in zip(rentals, self.records):
+            self.assertEqual(rental.total_cost, instrument.calculate_rental_cost((end - start).days))
+
+    def test_bulk_from_dict_logs_one_summary(self):
+        records = [rental.to_record() for rental in Rental.bulk_create(self.records, notify=False)]
+        customers = {str(self.customer.customer_id): self.customer}
+        instruments = {str(instrument.instrument_id): instrument for instrument in self.instruments}
+        for instrument in self.instruments:
+            instrument.daily_rate += 1  # Сбрасывает кэш: стоимость пересчитывается при загрузке
+        with self.assertLogs(level='INFO') as logs:
+            Rental.bulk_from_dict(records, customers, instruments)
+        self.assertEqual(len(logs.records), 1, logs.output)
+
+    def test_quiet_cost_matches_and_shares_cache(self):
+        piano = self.instruments[1]
+        self.assertEqual(piano.quiet_rental_cost(9), piano.calculate_rental_cost(9))
+        piano.key_count = 61
+        with self.assertLogs(level='INFO') as logs:
+            piano.calculate_rental_cost(9)
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(piano.quiet_rental_cost(9), 0.8 * 9 * piano.daily_rate)
+
+
+if __name__ == '__main__':
+    unittest.main()
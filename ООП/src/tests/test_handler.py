@@ -0,0 +1,83 @@
+import itertools
+import unittest
+
+from rental import Admin, Manager, Operator, RentalRequest, RentalRequestHandler, RequestRouter, RequestType
+
+
+class LegacyHandler(RentalRequestHandler):
+    """Обработчик в прежнем стиле: переопределяет только handle_request."""
+
+    def handle_request(self, request: RentalRequest) -> str:
+        if request.amount < 10:
+            return f"Мелкий запрос: {request.description}"
+        elif self._successor:
+            return self._successor.handle_request(request)
+        return f"Никто не обработал: {request.description}"
+
+
+class RequestRouterTest(unittest.TestCase):
+    """RequestRouter отвечает так же, как обход цепочки handle_request."""
+
+    AMOUNTS = (0, 50, 99.99, 100, 100.01, 500, 1000, 5000, 10 ** 6)
+
+    def _requests(self):
+        return [
+            RentalRequest(request_type, amount, f"{request_type.value} {amount}")
+            for request_type, amount in itertools.product(RequestType, self.AMOUNTS)
+        ]
+
+    def _chains(self):
+        yield Operator(Manager(Admin()))
+        yield Operator(Manager(Admin(max_amount=1000), max_amount=500), max_amount=100)
+        # Повторяющиеся типы с убывающими и растущими порогами
+        yield Operator(Manager(Operator(Admin(Manager(max_amount=100), max_amount=5000), max_amount=1000),
+                               max_amount=500), max_amount=100)
+        yield Admin(Operator(Admin(max_amount=10), max_amount=50), max_amount=1000)
+        yield Manager(max_amount=100)
+        yield Operator(Admin(Manager(Operator())))  # Admin завершает цепочку
+        yield Operator(LegacyHandler(Manager(Admin())))
+
+    def test_handle_matches_chain(self):
+        for chain in self._chains():
+            router = RequestRouter(chain)
+            for request in self._requests():
+                self.assertEqual(router.handle(request), chain.handle_request(request))
+
+    def test_handle_many_matches_chain(self):
+        for chain in self._chains():
+            requests = self._requests()
+            self.assertEqual(
+                RequestRouter(chain).handle_many(requests),
+                [chain.handle_request(request) for request in requests]
+            )
+
+    def test_counts_and_rejections(self):
+        manager = Manager(max_amount=500)
+        chain = Operator(manager, max_amount=100)
+        router = RequestRouter(chain)
+        router.handle_many([
+            RentalRequest(RequestType.SIMPLE, 10, "a"),
+            RentalRequest(RequestType.DISCOUNT, 200, "b"),
+            RentalRequest(RequestType.DISCOUNT, 900, "c"),
+            RentalRequest(RequestType.COMPLEX, 1, "d"),
+        ])
+        self.assertEqual(router.counts(), {chain: 1, manager: 1})
+        self.assertEqual(router.rejected, 2)
+
+    def test_admin_does_not_forward(self):
+        chain = Admin(Operator(Manager()))
+        for request_type in (RequestType.SIMPLE, RequestType.DISCOUNT):
+            request = RentalRequest(request_type, 10, "запрос")
+            self.assertEqual(chain.handle_request(request), "Админ не может обработать запрос: запрос")
+            self.assertEqual(RequestRouter(chain).handle(request), "Админ не может обработать запрос: запрос")
+
+    def test_legacy_handler_is_instantiable(self):
+        chain = LegacyHandler(Operator())
+        router = RequestRouter(chain)
+        self.assertEqual(router.handle(RentalRequest(RequestType.COMPLEX, 5, "x")), "Мелкий запрос: x")
+        self.assertEqual(router.handle(RentalRequest(RequestType.SIMPLE, 50, "y")),
+                         "Оператор обработал простой запрос: y (сумма: 50)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from instruments import Guitar, MusicalInstrument, Piano, Violin
+from rental import Accessory, Customer, Rental
+from utils import RentalJournal, set_journal
+
+
+class RentalJournalTest(unittest.TestCase):
+    """Восстановление состояния из снимка и журнала совпадает с живым состоянием."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.snapshot = os.path.join(self._directory.name, 'rentals.json')
+        self.journal = self._open()
+        self.customer = Customer("Иван", "ivan@example.com", "+70000000000", ["can_rent", "can_modify_rental"])
+
+    def tearDown(self):
+        set_journal(None)
+        self.journal.close()
+        self._directory.cleanup()
+
+    def _open(self) -> RentalJournal:
+        journal = RentalJournal(self.snapshot, sync_every=1, compact_every=0)
+        journal.recover()
+        set_journal(journal)
+        return journal
+
+    def _recover(self):
+        """Закрывает журнал и восстанавливает состояние новым журналом."""
+        set_journal(None)
+        self.journal.close()
+        self.journal = RentalJournal(self.snapshot, compact_every=0)
+        return self.journal.recover()
+
+    def _mutate(self):
+        guitar = Guitar("Fender", "new", 100.0, 6)
+        piano = Piano("Yamaha", "used", 200.0, 88)
+        violin = Violin("Stradivari", "refurbished", 150.0, True)
+        rentals = [
+            Rental(self.customer, guitar, date(2026, 1, 1), date(2026, 1, 10)),
+            Rental(self.customer, piano, date(2026, 2, 1), date(2026, 2, 5)),
+            Rental(self.customer, violin, date(2026, 3, 1), date(2026, 3, 3)),
+        ]
+        strap = Accessory("Ремень", 10.0)
+        rentals[0].add_accessory(strap, 2)
+        rentals[0].remove_accessory(strap.accessory_id)
+        rentals[1].add_accessory(Accessory("Банкетка", 25.0))
+        guitar.rent_instrument()
+        guitar.daily_rate = 120.0
+        piano.condition = 'refurbished'
+        violin.name = "Amati"
+        # Последними — поля подклассов, чтобы их не перекрыло событие другого сеттера
+        guitar.number_of_strings = 12
+        piano.key_count = 61
+        violin.bow_included = False
+        for rental in rentals:
+            rental.calculate_total()
+        return rentals
+
+    def _assert_matches(self, live, inventory, recovered):
+        self.assertEqual(len(inventory), len(live))
+        recovered = {rental.rental_id: rental for rental in recovered}
+        for rental in live:
+            restored = recovered[rental.rental_id]
+            self.assertEqual(restored.to_record(), rental.to_record())
+            self.assertEqual(restored.instrument.to_dict(), rental.instrument.to_dict())
+            self.assertIs(inventory.get(rental.instrument.instrument_id), restored.instrument)
+
+    def test_recover_matches_live_state(self):
+        live = self._mutate()
+        inventory, recovered = self._recover()
+        self._assert_matches(live, inventory, recovered)
+
+    def test_recover_after_compaction(self):
+        live = self._mutate()
+        self.journal.compact(wait=True)
+        self.assertEqual(self.journal.compactions, 1)
+        self.assertTrue(os.path.exists(self.snapshot))
+        live[2].instrument.daily_rate = 175.0
+        live[2].calculate_total()
+        inventory, recovered = self._recover()
+        self._assert_matches(live, inventory, recovered)
+
+    def test_loading_instruments_is_not_journaled(self):
+        data = Guitar("Gibson", "new", 90.0, 6).to_dict()
+        before = self.journal.appended
+        MusicalInstrument.from_dict(data)
+        self.assertEqual(self.journal.appended, before)
+        inventory, rentals = self._recover()
+        self.assertEqual(len(inventory), 0)
+        self.assertEqual(rentals, [])
+
+    def test_torn_tail_is_discarded(self):
+        live = self._mutate()
+        self.journal.sync()
+        with open(self.journal.journal_filename, 'a', encoding='utf-8') as f:
+            f.write('{"seq": 999, "event": "instrument_upd')
+        inventory, recovered = self._recover()
+        self._assert_matches(live, inventory, recovered)
+
+    def test_fsync_is_batched(self):
+        journal = RentalJournal(
+            os.path.join(self._directory.name, 'batched.json'), sync_every=3, sync_interval=60, compact_every=0
+        )
+        journal.recover()
+        try:
+            journal.append('instrument_updated', {'instrument': Guitar("Ibanez", "new", 80.0, 7).to_dict()})
+            journal.append('instrument_updated', {'instrument': Guitar("Ibanez", "new", 85.0, 7).to_dict()})
+            self.assertEqual(journal.syncs, 0)
+            journal.append('instrument_updated', {'instrument': Guitar("Ibanez", "new", 90.0, 7).to_dict()})
+            self.assertEqual(journal.syncs, 1)
+            journal.append('instrument_updated', {'instrument': Guitar("Ibanez", "new", 95.0, 7).to_dict()})
+            journal.sync()
+            self.assertEqual(journal.syncs, 2)
+        finally:
+            journal.close()
+
+    def test_failed_compaction_backs_off_and_is_reported(self):
+        set_journal(None)
+        self.journal.close()
+        self.journal = RentalJournal(self.snapshot, sync_every=1, compact_every=3)
+        self.journal.recover()
+        set_journal(self.journal)
+        os.mkdir(self.snapshot)  # Снимок нельзя прочитать: свёртка завершится ошибкой
+        rental = Rental(self.customer, Guitar("Fender", "new", 100.0, 6), date(2026, 1, 1), date(2026, 1, 4))
+        rental.instrument.daily_rate = 110.0
+        rental.instrument.daily_rate = 120.0  # Третье событие запускает свёртку
+        self.journal._compactor.join()
+        self.assertIsInstance(self.journal.compaction_error, OSError)
+        failed = self.journal._compactor
+        rental.instrument.daily_rate = 130.0
+        rental.instrument.daily_rate = 140.0
+        self.assertIs(self.journal._compactor, failed)  # Запись не перезапускает свёртку
+        with self.assertRaises(OSError):
+            self.journal.compact(wait=True)
+
+        os.rmdir(self.snapshot)
+        self.journal.compact(wait=True)
+        self.assertIsNone(self.journal.compaction_error)
+        self.assertEqual(self.journal.compactions, 1)
+        rental.calculate_total()
+        inventory, recovered = self._recover()
+        self._assert_matches([rental], inventory, recovered)
+
+
+if __name__ == '__main__':
+    unittest.main()
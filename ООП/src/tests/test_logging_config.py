@@ -0,0 +1,84 @@
+import logging
+import os
+import tempfile
+import threading
+import unittest
+
+from utils import logging_config, setup_logging, shutdown_logging
+
+
+class _SlowHandler(logging.Handler):
+    """Обработчик, который ждёт разрешения перед каждой записью."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.allowed = threading.Event()
+        self.records = []
+
+    def emit(self, record):
+        self.entered.set()
+        self.allowed.wait()
+        self.records.append(record)
+
+
+class ShutdownLoggingTest(unittest.TestCase):
+    """Остановка асинхронного логирования при заполненной очереди."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.chdir(self._directory.name)
+        self._root_handlers = logging.getLogger().handlers[:]
+        self._root_level = logging.getLogger().level
+        setup_logging(async_handlers=True, queue_size=2, drop_policy='drop_new')
+        for handler in logging_config._listener.handlers:
+            handler.close()
+        self.handler = _SlowHandler()
+        logging_config._listener.handlers = (self.handler,)
+        self.logger = logging.getLogger('shutdown-test')
+
+    def tearDown(self):
+        self.handler.allowed.set()
+        shutdown_logging()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        for handler in self._root_handlers:
+            root.addHandler(handler)
+        root.setLevel(self._root_level)
+        os.chdir(self._cwd)
+        self._directory.cleanup()
+
+    def _fill_queue(self):
+        self.logger.info("первая запись")
+        self.assertTrue(self.handler.entered.wait(5))  # Фоновый поток занят первой записью
+        for number in range(10):
+            self.logger.info("запись %s", number)
+        self.assertTrue(logging_config._listener.queue.full())
+
+    def test_shutdown_with_full_queue_drains_it(self):
+        self._fill_queue()
+        threading.Timer(0.1, self.handler.allowed.set).start()
+        shutdown_logging()
+        self.assertIsNone(logging_config._listener)
+        self.assertEqual(len(self.handler.records), 3)  # Первая запись и две из очереди
+
+    def test_shutdown_with_stuck_listener_does_not_raise(self):
+        listener = logging_config._listener
+        listener.stop_timeout = 0.05
+        self._fill_queue()
+        shutdown_logging()
+        self.assertIsNone(logging_config._listener)
+        self.handler.allowed.set()
+
+    def test_shutdown_with_room_but_stuck_handler_does_not_hang(self):
+        logging_config._listener.stop_timeout = 0.05
+        self.logger.info("первая запись")
+        self.assertTrue(self.handler.entered.wait(5))
+        shutdown_logging()
+        self.assertIsNone(logging_config._listener)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import threading
+import unittest
+
+from utils import FakeTransport, NotificationDispatcher
+
+
+class NotificationDispatcherTest(unittest.TestCase):
+    """Пакетная доставка, повторяющиеся сообщения и закрытие диспетчера."""
+
+    def test_batches_messages_per_recipient(self):
+        transport = FakeTransport()
+        with NotificationDispatcher(transport, flush_interval=0.5) as dispatcher:
+            for position in range(3):
+                dispatcher.submit("anna@example.com", f"Сообщение {position}")
+            dispatcher.submit("oleg@example.com", "Привет")
+            self.assertTrue(dispatcher.flush(timeout=5))
+        self.assertEqual(sorted(transport.sent), [
+            ("anna@example.com", ["Сообщение 0", "Сообщение 1", "Сообщение 2"]),
+            ("oleg@example.com", ["Привет"]),
+        ])
+        self.assertEqual(dispatcher.delivered, 4)
+        self.assertEqual(dispatcher.batches, 2)
+
+    def test_delivers_identical_messages_every_time(self):
+        transport = FakeTransport()
+        with NotificationDispatcher(transport, flush_interval=0.5) as dispatcher:
+            for _ in range(3):
+                dispatcher.submit("anna@example.com", "Аренда подтверждена")
+            self.assertTrue(dispatcher.flush(timeout=5))
+        self.assertEqual(transport.messages_for("anna@example.com"), ["Аренда подтверждена"] * 3)
+        self.assertEqual(dispatcher.delivered, 3)
+
+    def test_close_delivers_accepted_and_rejects_new(self):
+        transport = FakeTransport(delay=0.01)
+        dispatcher = NotificationDispatcher(transport, max_queue_size=4, batch_size=2, flush_interval=0.01)
+        accepted = []
+        rejected = []
+        barrier = threading.Barrier(5)
+
+        def submit(position):
+            barrier.wait()
+            for message in range(20):
+                try:
+                    dispatcher.submit(f"client{position}@example.com", f"{message}")
+                    accepted.append(1)
+                except RuntimeError:
+                    rejected.append(1)
+
+        threads = [threading.Thread(target=submit, args=(position,)) for position in range(4)]
+        for thread in threads:
+            thread.start()
+        barrier.wait()
+        dispatcher.close(timeout=10)
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(dispatcher.flush(timeout=5))
+        self.assertEqual(dispatcher.delivered, len(accepted))
+        self.assertEqual(len(accepted) + len(rejected), 80)
+        with self.assertRaises(RuntimeError):
+            dispatcher.submit("anna@example.com", "Поздно")
+
+
+if __name__ == '__main__':
+    unittest.main()
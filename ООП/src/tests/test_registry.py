@@ -0,0 +1,66 @@
+import unittest
+from datetime import date
+from uuid import uuid4
+
+from instruments import Guitar, Violin
+from rental import Customer, Rental, RentalRegistry
+from utils import RentalNotFoundError
+
+
+class RentalRegistryTest(unittest.TestCase):
+    """Поиск аренд по идентификатору, клиенту, инструменту и дате начала."""
+
+    def setUp(self):
+        self.registry = RentalRegistry()
+        self.alice = Customer("Алиса", "alice@example.com", "+70000000001", ["can_rent"])
+        self.bob = Customer("Боб", "bob@example.com", "+70000000002", ["can_rent"])
+        self.guitar = Guitar("Fender", "new", 100.0, 6)
+        self.violin = Violin("Amati", "used", 150.0, True)
+        self.rentals = [
+            Rental(self.alice, self.guitar, date(2026, 1, 1), date(2026, 1, 5)),
+            Rental(self.alice, self.violin, date(2026, 1, 10), date(2026, 1, 12)),
+            Rental(self.bob, self.guitar, date(2026, 1, 10), date(2026, 1, 15)),
+            Rental(self.bob, self.violin, date(2026, 2, 1), date(2026, 2, 3)),
+        ]
+        self.registry.add(self.rentals[0])
+        self.registry.add_many(self.rentals[1:])
+
+    def test_lookups(self):
+        first, second, third, fourth = self.rentals
+        self.assertEqual(len(self.registry), 4)
+        self.assertIs(self.registry.get(third.rental_id), third)
+        self.assertIn(third.rental_id, self.registry)
+        self.assertEqual(self.registry.by_customer(self.alice.customer_id), [first, second])
+        self.assertEqual(self.registry.by_instrument(self.guitar.instrument_id), [first, third])
+        self.assertEqual(self.registry.by_customer(uuid4()), [])
+        self.assertEqual(
+            {rental.rental_id for rental in self.registry.by_start_date(date(2026, 1, 10), date(2026, 1, 31))},
+            {second.rental_id, third.rental_id}
+        )
+        self.assertEqual(self.registry.by_start_date(date(2026, 1, 1), date(2026, 12, 31))[0], first)
+        self.assertEqual(self.registry.by_start_date(date(2026, 2, 1), date(2026, 2, 1)), [fourth])
+
+    def test_missing_rental(self):
+        with self.assertRaises(RentalNotFoundError):
+            self.registry.get(uuid4())
+        with self.assertRaises(RentalNotFoundError):
+            self.registry.remove(uuid4())
+
+    def test_remove_and_replace(self):
+        first, second, third, _ = self.rentals
+        self.assertIs(self.registry.remove(second.rental_id), second)
+        self.assertNotIn(second.rental_id, self.registry)
+        self.assertEqual(self.registry.by_customer(self.alice.customer_id), [first])
+        self.assertEqual(self.registry.by_start_date(date(2026, 1, 10), date(2026, 1, 10)), [third])
+
+        self.registry.add_many([first, first])
+        self.registry.add(third)
+        self.assertEqual(len(self.registry), 3)
+        self.assertEqual(self.registry.by_instrument(self.guitar.instrument_id), [first, third])
+        self.registry.discard(uuid4())
+        self.registry.clear()
+        self.assertEqual(list(self.registry), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
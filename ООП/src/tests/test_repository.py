@@ -0,0 +1,44 @@
+import unittest
+from datetime import date
+
+from instruments import Guitar, Piano
+from rental import Accessory, Customer, Rental
+from utils import SQLiteRepository
+
+
+class SQLiteRepositoryTest(unittest.TestCase):
+    """Аренды, сохранённые в SQLite, читаются обратно без потерь."""
+
+    def setUp(self):
+        self.repository = SQLiteRepository()
+        self.customer = Customer("Иван", "ivan@example.com", "+70000000000", ["can_rent", "can_modify_rental"])
+        self.guitar = Guitar("Fender", "new", 100.0, 6)
+        self.piano = Piano("Yamaha", "used", 200.0, 76)
+        self.strap = Accessory("Ремень", 10.0)
+        self.rentals = [
+            Rental(self.customer, self.guitar, date(2026, 1, 1), date(2026, 1, 10)),
+            Rental(self.customer, self.piano, date(2026, 2, 1), date(2026, 2, 5)),
+        ]
+        self.rentals[0].add_accessory(self.strap, 2)
+        self.rentals[1].add_accessory(self.strap)
+        self.rentals[1].add_accessory(Accessory("Банкетка", 25.0))
+        self.repository.save_rentals(self.rentals)
+
+    def tearDown(self):
+        self.repository.close()
+
+    def test_rental_round_trip_with_accessories(self):
+        for rental in self.rentals:
+            restored = self.repository.get_rental(rental.rental_id)
+            self.assertEqual(restored.to_dict(), rental.to_dict())
+            self.assertEqual(restored.total_cost, rental.total_cost)
+
+    def test_iter_rentals_shares_accessories(self):
+        restored = list(self.repository.iter_rentals())
+        self.assertEqual([rental.to_dict() for rental in restored], [rental.to_dict() for rental in self.rentals])
+        self.assertIs(restored[0].accessories[0], restored[1].accessories[0])
+        self.assertEqual(restored[0].accessory_quantity(self.strap.accessory_id), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from instruments import Guitar
+from rental import Customer, Rental
+from utils import append_instrument, append_rental, iter_instruments, iter_rentals, load_from_jsonl, save_to_jsonl
+
+
+class JsonLinesTest(unittest.TestCase):
+    """Дозапись в файл JSON Lines и чтение его обратно."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self._directory.name, 'rentals.jsonl')
+        self.customer = Customer("Иван", "ivan@example.com", "+70000000000", ["can_rent"])
+        self.guitar = Guitar("Fender", "new", 100.0, 6)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _lines(self) -> int:
+        with open(self.filename, encoding='utf-8') as f:
+            return sum(1 for line in f if line.strip())
+
+    def test_append_rental_writes_one_line(self):
+        first = Rental(self.customer, self.guitar, date(2026, 1, 1), date(2026, 1, 3))
+        save_to_jsonl([self.guitar], [first], self.filename)
+        self.assertEqual(self._lines(), 3)  # Инструмент, клиент, аренда
+        appended = [
+            Rental(self.customer, self.guitar, date(2026, 2, day), date(2026, 2, day + 2)) for day in (1, 5, 9)
+        ]
+        for rental in appended:
+            append_rental(rental, self.filename)
+        self.assertEqual(self._lines(), 6)
+
+        self.assertEqual([inst.instrument_id for inst in iter_instruments(self.filename)], [self.guitar.instrument_id])
+        instruments, rentals = load_from_jsonl(self.filename)
+        self.assertEqual(len(instruments), 1)
+        self.assertEqual([rental.rental_id for rental in rentals],
+                         [rental.rental_id for rental in [first] + appended])
+        self.assertTrue(all(rental.instrument is instruments[0] for rental in rentals))
+        self.assertEqual(len({id(rental.customer) for rental in iter_rentals(self.filename)}), 1)
+
+    def test_append_rental_for_new_customer_and_instrument(self):
+        save_to_jsonl([self.guitar], [], self.filename)
+        other = Guitar("Gibson", "used", 80.0, 7)
+        newcomer = Customer("Пётр", "petr@example.com", "+70000000001", ["can_rent"])
+        rental = Rental(newcomer, other, date(2026, 3, 1), date(2026, 3, 4))
+        append_rental(rental, self.filename)
+        instruments, rentals = load_from_jsonl(self.filename)
+        self.assertEqual({inst.instrument_id for inst in instruments}, {self.guitar.instrument_id, other.instrument_id})
+        self.assertEqual(rentals[0].to_dict(), rental.to_dict())
+        self.assertEqual([r.rental_id for r in iter_rentals(self.filename)], [rental.rental_id])
+
+    def test_last_appended_instrument_state_wins(self):
+        self.guitar.daily_rate = 10.0
+        append_instrument(self.guitar, self.filename)
+        rental = Rental(self.customer, self.guitar, date(2026, 4, 1), date(2026, 4, 3))
+        append_rental(rental, self.filename)
+        self.guitar.daily_rate = 99.0
+        self.guitar.number_of_strings = 12
+        append_instrument(self.guitar, self.filename)
+
+        instruments, rentals = load_from_jsonl(self.filename)
+        self.assertEqual(len(instruments), 1)
+        self.assertEqual(instruments[0].to_dict(), self.guitar.to_dict())
+        self.assertIs(rentals[0].instrument, instruments[0])
+        self.assertEqual(rentals[0].total_cost, 198.0)
+        self.assertEqual([inst.daily_rate for inst in list(iter_instruments(self.filename))], [99.0])
+        streamed = list(iter_rentals(self.filename))
+        self.assertEqual(streamed[0].instrument.daily_rate, 99.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
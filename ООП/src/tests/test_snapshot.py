@@ -0,0 +1,47 @@
+import gc
+import os
+import tempfile
+import unittest
+import warnings
+from datetime import date
+
+from instruments import Guitar
+from rental import Customer, Rental
+from utils import RentalSnapshot, write_snapshot
+
+
+class RentalSnapshotOpenTest(unittest.TestCase):
+    """Открытие снимка: понятная ошибка и закрытый файл для пустого или обрезанного файла."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self._directory.name, 'rentals.snap')
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _assert_rejected(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', ResourceWarning)
+            with self.assertRaises(ValueError):
+                RentalSnapshot(self.filename)
+            gc.collect()
+        self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [])
+
+    def test_empty_file(self):
+        open(self.filename, 'wb').close()
+        self._assert_rejected()
+
+    def test_truncated_file(self):
+        guitar = Guitar("Fender", "new", 100.0, 6)
+        customer = Customer("Иван", "ivan@example.com", "+70000000000", ["can_rent"])
+        write_snapshot([guitar], [Rental(customer, guitar, date(2026, 1, 1), date(2026, 1, 3))], self.filename)
+        with RentalSnapshot(self.filename) as snapshot:
+            self.assertEqual(len(snapshot.rentals), 1)
+        with open(self.filename, 'r+b') as file:
+            file.truncate(8)
+        self._assert_rejected()
+
+
+if __name__ == '__main__':
+    unittest.main()
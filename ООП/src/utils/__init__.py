@@ -1,6 +1,20 @@
-from .mixins import NotificationMixin
+from .mixins import NotificationMixin, LoggingMixin
 from .factory import InstrumentFactory
-from .exceptions import PermissionDeniedError, InvalidInstrumentError, RentalNotFoundError
-from .decorators import check_permissions
-from .serialization import save_to_json, load_from_json
-from .logging_config import setup_logging
\ No newline at end of file
+from .exceptions import (
+    PermissionDeniedError, InvalidInstrumentError, RentalNotFoundError, BookingConflictError, NotificationDeliveryError
+)
+from .decorators import check_permissions, cache_rental_cost
+from .permissions import register_permission, permission_mask, permission_names, permission_scope
+from .serialization import (
+    save_to_json, load_from_json, load_inventory, save_to_jsonl, load_from_jsonl,
+    iter_instruments, iter_rentals, append_instrument, append_rental, JsonLinesWriter
+)
+from .journal import RentalJournal, set_journal, get_journal
+from .snapshot import RentalSnapshot, write_snapshot, convert_json_to_snapshot
+from .repository import SQLiteRepository
+from .locks import StripedLock
+from .logging_config import setup_logging, shutdown_logging, ClassLogger, BoundedQueueHandler
+from .notifications import (
+    NotificationTransport, PrintTransport, FakeTransport, NotificationDispatcher,
+    set_notification_dispatcher, get_notification_dispatcher
+)
@@ -1,22 +1,54 @@
 from functools import wraps
 from .exceptions import PermissionDeniedError
+from .permissions import register_permission, _scope_mask
 
 def check_permissions(required_permission: str):
     """Декоратор для проверки прав доступа пользователя.
 
+    Бит разрешения определяется один раз при декорировании; при вызове
+    проверяется одна битовая операция над маской разрешений клиента
+    (self.customer.permission_mask) или, внутри permission_scope, над маской
+    субъекта запроса.
+
     Args:
         required_permission: Требуемое разрешение для выполнения действия.
     Raises:
         PermissionDeniedError: Если у пользователя нет необходимого разрешения.
     """
+    bit = register_permission(required_permission)
+
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            # Предполагается, что объект имеет атрибут customer с permissions
-            if not hasattr(self, 'customer') or required_permission not in self.customer.permissions:
+            mask = _scope_mask.get()
+            if mask is None:
+                try:
+                    mask = self._customer._permission_mask  # Прямое чтение слотов, без вызова свойств
+                except AttributeError:
+                    # Иначе предполагается, что объект имеет атрибут customer с permission_mask
+                    customer = getattr(self, 'customer', None)
+                    mask = 0 if customer is None else customer.permission_mask
+            if not mask & bit:
                 raise PermissionDeniedError(
                     f"У пользователя нет разрешения '{required_permission}' для выполнения действия '{func.__name__}'"
                 )
             return func(self, *args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+def cache_rental_cost(func):
+    """Декоратор для кэширования стоимости аренды инструмента по сроку.
+
+    Кэш хранится в атрибуте _cost_cache объекта и сбрасывается самим
+    инструментом при изменении параметров, влияющих на цену.
+    """
+    @wraps(func)
+    def wrapper(self, days: int) -> float:
+        cache = self._cost_cache
+        try:
+            return cache[days]
+        except KeyError:
+            cost = cache[days] = func(self, days)
+            return cost
+    return wrapper
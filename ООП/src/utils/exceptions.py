@@ -8,4 +8,12 @@ class InvalidInstrumentError(Exception):
 
 class RentalNotFoundError(Exception):
     """Исключение, возникающее при отсутствии аренды."""
-    pass
\ No newline at end of file
+    pass
+
+class BookingConflictError(Exception):
+    """Исключение, возникающее при пересечении бронирований инструмента."""
+    pass
+
+class NotificationDeliveryError(Exception):
+    """Исключение, возникающее при ошибке доставки уведомления."""
+    pass
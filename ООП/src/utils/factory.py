@@ -1,8 +1,28 @@
+from typing import Iterable, List, Mapping, Sequence, Union
+
+
 class InstrumentFactory:
-    """Фабрика для создания музыкальных инструментов."""
+    """Фабрика для создания музыкальных инструментов.
+
+    Классы берутся из реестра InstrumentMeta; модуль instruments импортируется
+    один раз, при первом обращении к фабрике.
+    """
+
+    _meta = None  # InstrumentMeta после первого обращения
+
+    @classmethod
+    def _get_class(cls, instrument_type: str):
+        meta = cls._meta
+        if meta is None:
+            from instruments import InstrumentMeta  # Отложенный импорт: instruments зависит от utils
+            meta = cls._meta = InstrumentMeta
+        instrument_class = meta.get_class(instrument_type)
+        if not instrument_class:
+            raise ValueError(f"Неизвестный тип инструмента: {instrument_type}")
+        return instrument_class
 
-    @staticmethod
-    def create_instrument(instrument_type: str, *args, **kwargs):
+    @classmethod
+    def create_instrument(cls, instrument_type: str, *args, **kwargs):
         """Создаёт экземпляр инструмента по типу.
 
         Args:
@@ -13,15 +33,19 @@ class InstrumentFactory:
         Raises:
             ValueError: Если тип инструмента неизвестен.
         """
-        from instruments import Guitar, Piano, Violin  # Отложенный импорт
+        return cls._get_class(instrument_type)(*args, **kwargs)
 
-        instrument_classes = {
-            "guitar": Guitar,
-            "piano": Piano,
-            "violin": Violin
-        }
+    @classmethod
+    def create_many(cls, instrument_type: str, rows: Iterable[Union[Sequence, Mapping]]) -> List:
+        """Создаёт пакет инструментов одного типа.
 
-        instrument_class = instrument_classes.get(instrument_type.lower())
-        if not instrument_class:
-            raise ValueError(f"Неизвестный тип инструмента: {instrument_type}")
-        return instrument_class(*args, **kwargs)
\ No newline at end of file
+        Args:
+            instrument_type: Тип инструмента.
+            rows: Кортежи позиционных или словари именованных аргументов конструктора.
+        Returns:
+            Список инструментов в порядке строк.
+        Raises:
+            ValueError: Если тип инструмента неизвестен.
+        """
+        instrument_class = cls._get_class(instrument_type)
+        return [instrument_class(**row) if isinstance(row, Mapping) else instrument_class(*row) for row in rows]
@@ -0,0 +1,430 @@
+import json
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from .logging_config import ClassLogger
+
+# События журнала и их данные:
+#   rental_created      {'rental': Rental.to_record(), 'customer': ..., 'instrument': ...}
+#   accessory_added     {'rental_id', 'accessory': Accessory.to_dict(), 'quantity', 'total_cost'}
+#   accessory_removed   {'rental_id', 'accessory_id', 'total_cost'}
+#   instrument_rented, instrument_released, rate_changed, instrument_updated
+#                       {'instrument': MusicalInstrument.to_dict()}
+#   permissions_changed {'customer': Customer.to_dict()}
+# Событие с инструментом или клиентом несёт его полное состояние, поэтому
+# применение события не зависит от того, попал ли объект в снимок раньше.
+
+
+def _ensure_dir(filename: str) -> None:
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def _fsync_directory(filename: str) -> None:
+    """Сбрасывает на диск запись каталога после переименования файла (где это поддерживается)."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(filename)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _read_events(filename: str) -> Tuple[List[Dict], int]:
+    """Читает события файла журнала.
+
+    Недописанная при сбое последняя строка отбрасывается.
+
+    Returns:
+        Кортеж (события, длина целой части файла в байтах).
+    """
+    events, size = [], 0
+    if not os.path.exists(filename):
+        return events, size
+    with open(filename, 'rb') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                break
+            size += len(line)
+    return events, size
+
+
+class _DocumentState:
+    """Данные в формате save_to_json, к которым применяются события журнала.
+
+    Свёртка журнала работает со словарями, а не с объектами предметной
+    области, поэтому не затрагивает реестр аренд и каталоги текущего процесса.
+    """
+
+    def __init__(self, data: Dict):
+        self.seq: int = data.get('journal_seq', 0)  # Номер последнего учтённого события
+        self.instruments: Dict[str, Dict] = {item['instrument_id']: item for item in data.get('instruments', [])}
+        self.customers: Dict[str, Dict] = {item['customer_id']: item for item in data.get('customers', [])}
+        self.rentals: Dict[str, Dict] = {}
+        for record in data.get('rentals', []):
+            if 'customer' in record:  # Прежний формат с вложенными клиентом и инструментом
+                record = dict(record)
+                customer, instrument = record.pop('customer'), record.pop('instrument')
+                record['customer_id'] = self.customers.setdefault(customer['customer_id'], customer)['customer_id']
+                record['instrument_id'] = self.instruments.setdefault(
+                    instrument['instrument_id'], instrument)['instrument_id']
+            self.rentals[record['rental_id']] = record
+
+    @classmethod
+    def load(cls, filename: str) -> '_DocumentState':
+        if not os.path.exists(filename):
+            return cls({})
+        with open(filename, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def apply(self, event: Dict) -> None:
+        """Применяет событие; события, уже учтённые в снимке, пропускаются."""
+        if event['seq'] <= self.seq:
+            return
+        self.seq = event['seq']
+        kind, data = event['event'], event['data']
+        if kind == 'rental_created':
+            self.customers[data['customer']['customer_id']] = data['customer']
+            self.instruments[data['instrument']['instrument_id']] = data['instrument']
+            self.rentals[data['rental']['rental_id']] = data['rental']
+        elif kind in ('accessory_added', 'accessory_removed'):
+            record = self.rentals.get(data['rental_id'])
+            if record is None:
+                return
+            accessories = record['accessories']
+            if kind == 'accessory_added':
+                accessories.extend([data['accessory']] * data['quantity'])
+            else:
+                for position, accessory in enumerate(accessories):
+                    if accessory['accessory_id'] == data['accessory_id']:
+                        del accessories[position]
+                        break
+            record['total_cost'] = data['total_cost']
+        elif 'instrument' in data:
+            self.instruments[data['instrument']['instrument_id']] = data['instrument']
+        elif 'customer' in data:
+            self.customers[data['customer']['customer_id']] = data['customer']
+
+    def document(self) -> Dict:
+        return {
+            'journal_seq': self.seq,
+            'instruments': list(self.instruments.values()),
+            'customers': list(self.customers.values()),
+            'rentals': list(self.rentals.values()),
+        }
+
+    def write(self, filename: str) -> None:
+        """Атомарно заменяет файл снимка: запись во временный файл, fsync и os.replace."""
+        _ensure_dir(filename)
+        temporary = filename + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(self.document(), f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, filename)
+        _fsync_directory(filename)
+
+
+class RentalJournal:
+    """Журнал упреждающей записи (write-ahead log) изменений аренд поверх снимка.
+
+    Снимок — JSON-файл в формате save_to_json с дополнительным полем
+    journal_seq; журнал — файл JSON Lines, куда дописываются события.
+    Стоимость сохранения одной операции пропорциональна размеру изменения,
+    а не всего набора данных.
+
+    Дописанные события сбрасываются на диск (fsync) пакетами: после
+    sync_every событий или не реже чем раз в sync_interval секунд. При сбое
+    могут потеряться только события последнего несброшенного пакета;
+    sync() сбрасывает их немедленно.
+
+    При запуске recover() загружает снимок и применяет поверх него журнал.
+    Свёртка (compact) переименовывает текущий файл журнала, открывает новый
+    и в фоновом потоке применяет старый файл к снимку, после чего удаляет
+    его. События, уже учтённые в снимке, при повторном применении
+    пропускаются по номеру, поэтому сбой на любом шаге свёртки не приводит
+    к потере или двойному применению событий. Поэтому снимок, к которому
+    ведётся журнал, обновляет только свёртка, а не save_to_json.
+
+    Объекты предметной области пишут события в журнал, назначенный через
+    set_journal().
+    """
+
+    _logger = ClassLogger()
+    _logging_muted = False
+
+    def __init__(
+            self,
+            snapshot_filename: str,
+            journal_filename: Optional[str] = None,
+            sync_every: int = 100,
+            sync_interval: float = 0.05,
+            compact_every: int = 10000
+    ):
+        """Инициализирует журнал. Запись событий возможна после recover().
+
+        Args:
+            snapshot_filename: Путь к JSON-снимку.
+            journal_filename: Путь к файлу журнала (по умолчанию рядом со
+                снимком с расширением .journal).
+            sync_every: Количество событий, после которого журнал сбрасывается на диск.
+            sync_interval: Максимальное время в секундах, которое событие ждёт сброса.
+            compact_every: Количество событий, после которого автоматически
+                запускается свёртка; 0 — только вручную.
+        """
+        self.snapshot_filename = snapshot_filename
+        self.journal_filename = journal_filename or os.path.splitext(snapshot_filename)[0] + '.journal'
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.compact_every = compact_every
+        self.appended = 0  # Записано событий
+        self.syncs = 0  # Выполнено сбросов на диск
+        self.compactions = 0  # Завершено свёрток
+        self._compacting_filename = self.journal_filename + '.compacting'
+        self._lock = threading.Lock()
+        self._file = None
+        self._seq = 0
+        self._unsynced = 0
+        self._since_compaction = 0
+        self._compactor: Optional[threading.Thread] = None
+        self.compaction_error: Optional[Exception] = None  # Ошибка последней свёртки, None после успешной
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+
+    def recover(self) -> Tuple['InstrumentInventory', List]:
+        """Восстанавливает состояние из снимка и журнала и открывает журнал для записи.
+
+        Если предыдущая свёртка не завершилась, она выполняется сразу.
+
+        Returns:
+            Кортеж (инвентарь инструментов, аренды).
+
+        Raises:
+            RuntimeError: Если журнал уже открыт.
+        """
+        from .serialization import restore_document
+        with self._lock:
+            if self._file is not None:
+                raise RuntimeError("Журнал уже открыт")
+            state = _DocumentState.load(self.snapshot_filename)
+            pending_fold = os.path.exists(self._compacting_filename)
+            if pending_fold:
+                for event in _read_events(self._compacting_filename)[0]:
+                    state.apply(event)
+            events, size = _read_events(self.journal_filename)
+            for event in events:
+                state.apply(event)
+            if os.path.exists(self.journal_filename) and os.path.getsize(self.journal_filename) != size:
+                os.truncate(self.journal_filename, size)  # Отрезаем недописанную при сбое строку
+                self._logger.warning("Отброшен недописанный хвост журнала %s", self.journal_filename)
+            if pending_fold:
+                state.write(self.snapshot_filename)
+                os.remove(self._compacting_filename)
+                self.compactions += 1
+            self._seq = state.seq
+            self._since_compaction = len(events)
+            _ensure_dir(self.journal_filename)
+            self._file = open(self.journal_filename, 'a', encoding='utf-8', newline='\n')
+            self._stop.clear()
+            self._flusher = threading.Thread(target=self._run_flusher, name='journal-flusher', daemon=True)
+            self._flusher.start()
+        self._logger.info("Восстановлено состояние по снимку и %s событиям журнала", len(events))
+        return restore_document(state.document())
+
+    def append(self, event: str, data: Dict) -> int:
+        """Дописывает событие в журнал.
+
+        Args:
+            event: Тип события.
+            data: Данные события.
+
+        Returns:
+            Номер события.
+
+        Raises:
+            RuntimeError: Если журнал не открыт вызовом recover().
+        """
+        return self.append_many([(event, data)])
+
+    def append_many(self, events: Iterable[Tuple[str, Dict]]) -> int:
+        """Дописывает пакет событий под одной блокировкой.
+
+        Args:
+            events: Пары (тип события, данные).
+
+        Returns:
+            Номер последнего записанного события.
+
+        Raises:
+            RuntimeError: Если журнал не открыт вызовом recover().
+        """
+        payloads = [(event, json.dumps(data, ensure_ascii=False, separators=(',', ':'))) for event, data in events]
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError("Журнал не открыт: сначала вызовите recover()")
+            for event, payload in payloads:
+                self._seq += 1
+                self._file.write(f'{{"seq":{self._seq},"event":"{event}","data":{payload}}}\n')
+            self._unsynced += len(payloads)
+            self._since_compaction += len(payloads)
+            self.appended += len(payloads)
+            if self._unsynced >= self.sync_every:
+                self._sync_locked()
+            if self.compact_every and self._since_compaction >= self.compact_every:
+                self._start_compaction_locked()
+            return self._seq
+
+    def rental_created(self, rental: 'Rental') -> None:
+        self.rentals_created([rental])
+
+    def rentals_created(self, rentals: Iterable['Rental']) -> None:
+        self.append_many(('rental_created', {
+            'rental': rental.to_record(),
+            'customer': rental.customer.to_dict(),
+            'instrument': rental.instrument.to_dict(),
+        }) for rental in rentals)
+
+    def accessory_added(self, rental: 'Rental', accessory: 'Accessory', quantity: int) -> None:
+        self.append('accessory_added', {
+            'rental_id': str(rental.rental_id), 'accessory': accessory.to_dict(),
+            'quantity': quantity, 'total_cost': rental.total_cost,
+        })
+
+    def accessory_removed(self, rental: 'Rental', accessory_id: 'UUID') -> None:
+        self.append('accessory_removed', {
+            'rental_id': str(rental.rental_id), 'accessory_id': str(accessory_id), 'total_cost': rental.total_cost,
+        })
+
+    def instrument_changed(self, event: str, instrument: 'MusicalInstrument') -> None:
+        self.append(event, {'instrument': instrument.to_dict()})
+
+    def permissions_changed(self, customer: 'Customer') -> None:
+        self.append('permissions_changed', {'customer': customer.to_dict()})
+
+    def sync(self) -> None:
+        """Немедленно сбрасывает записанные события на диск."""
+        with self._lock:
+            self._sync_locked()
+
+    def _sync_locked(self) -> None:
+        if self._unsynced and self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+            self.syncs += 1
+
+    def _run_flusher(self) -> None:
+        while not self._stop.wait(self.sync_interval):
+            self.sync()
+
+    def compact(self, wait: bool = False) -> None:
+        """Запускает свёртку журнала в снимок в фоновом потоке.
+
+        Если свёртка уже выполняется, новая не запускается. Ошибка свёртки
+        сохраняется в compaction_error; файл свёртки остаётся на диске, и
+        следующая свёртка повторяет его.
+
+        Args:
+            wait: Дождаться завершения свёртки.
+
+        Raises:
+            RuntimeError: Если журнал не открыт вызовом recover().
+            OSError, ValueError: Если wait и свёртка завершилась ошибкой.
+        """
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError("Журнал не открыт: сначала вызовите recover()")
+            self._start_compaction_locked()
+            compactor = self._compactor
+        if wait:
+            compactor.join()
+            if self.compaction_error is not None:
+                raise self.compaction_error
+
+    def _start_compaction_locked(self) -> None:
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        if not os.path.exists(self._compacting_filename):  # Иначе повторяем не завершившуюся свёртку
+            self._sync_locked()
+            self._file.close()
+            os.replace(self.journal_filename, self._compacting_filename)
+            self._file = open(self.journal_filename, 'a', encoding='utf-8', newline='\n')
+        # Сбрасываем и при повторе: после неудачной свёртки следующая автоматическая
+        # попытка будет не раньше чем через compact_every событий, а не на каждой записи
+        self._since_compaction = 0
+        self._compactor = threading.Thread(target=self._fold, name='journal-compaction', daemon=True)
+        self._compactor.start()
+
+    def _fold(self) -> None:
+        try:
+            state = _DocumentState.load(self.snapshot_filename)
+            for event in _read_events(self._compacting_filename)[0]:
+                state.apply(event)
+            state.write(self.snapshot_filename)
+            os.remove(self._compacting_filename)
+        except (OSError, ValueError) as e:
+            self.compaction_error = e
+            self._logger.error("Не удалось свернуть журнал в снимок %s: %s", self.snapshot_filename, e)
+            return
+        self.compaction_error = None
+        self.compactions += 1
+        self._logger.info("Журнал свёрнут в снимок %s (событий до №%s)", self.snapshot_filename, state.seq)
+
+    def close(self, compact: bool = False) -> None:
+        """Сбрасывает журнал на диск и закрывает его.
+
+        Args:
+            compact: Перед закрытием свернуть журнал в снимок.
+
+        Raises:
+            OSError, ValueError: Если compact и свёртка завершилась ошибкой;
+                журнал при этом всё равно закрывается.
+        """
+        if self._file is None:
+            return
+        try:
+            if compact:
+                self.compact(wait=True)
+            elif self._compactor is not None:
+                self._compactor.join()
+        finally:
+            self._stop.set()
+            self._flusher.join()
+            with self._lock:
+                self._sync_locked()
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> 'RentalJournal':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+_journal: Optional[RentalJournal] = None  # Журнал, в который пишут изменения объекты предметной области
+
+
+def set_journal(journal: Optional[RentalJournal]) -> Optional[RentalJournal]:
+    """Назначает журнал, в который записываются изменения аренд, инструментов и клиентов.
+
+    Args:
+        journal: Открытый журнал или None, чтобы отключить журналирование.
+
+    Returns:
+        Предыдущий журнал.
+    """
+    global _journal
+    previous, _journal = _journal, journal
+    return previous
+
+
+def get_journal() -> Optional[RentalJournal]:
+    """Возвращает текущий журнал или None."""
+    return _journal
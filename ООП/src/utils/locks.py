@@ -0,0 +1,39 @@
+import threading
+from typing import Hashable, List
+
+
+class StripedLock:
+    """Набор блокировок, распределённых по ключам (lock striping).
+
+    Вместо одной глобальной блокировки или отдельной блокировки на каждый
+    объект ключ отображается на одну из stripes блокировок по хешу: операции
+    с разными ключами почти всегда идут параллельно, а память не растёт с
+    числом объектов.
+    """
+
+    def __init__(self, stripes: int = 64):
+        """Инициализирует набор блокировок.
+
+        Args:
+            stripes: Количество блокировок.
+
+        Raises:
+            ValueError: Если количество блокировок не положительно.
+        """
+        if stripes <= 0:
+            raise ValueError("Количество блокировок должно быть положительным")
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(stripes)]
+
+    def lock_for(self, key: Hashable) -> threading.Lock:
+        """Возвращает блокировку, отвечающую за ключ.
+
+        Args:
+            key: Ключ, например UUID.int инструмента.
+
+        Returns:
+            Блокировка, которую можно использовать в with.
+        """
+        return self._locks[hash(key) % len(self._locks)]
+
+    def __len__(self) -> int:
+        return len(self._locks)
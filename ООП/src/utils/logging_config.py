@@ -1,15 +1,177 @@
+import atexit
 import logging
 import os
+import queue
+import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from typing import Dict, Optional
 
-def setup_logging():
-    """Настраивает систему логирования для записи в файл и вывода в консоль."""
+# Логгер, который всегда отключён: возвращается для объектов с выключенным логированием
+MUTED_LOGGER = logging.Logger('muted')
+MUTED_LOGGER.disabled = True
+
+
+class ClassLogger:
+    """Дескриптор, возвращающий один логгер на класс вместо logging.getLogger в каждом __init__.
+
+    Для объекта с выключенным логированием (_logging_muted) возвращается
+    MUTED_LOGGER, вызовы которого завершаются сразу.
+    """
+
+    def __init__(self):
+        self._loggers: Dict[type, logging.Logger] = {}
+
+    def __get__(self, obj, owner) -> logging.Logger:
+        if obj is not None and obj._logging_muted:
+            return MUTED_LOGGER
+        try:
+            return self._loggers[owner]
+        except KeyError:
+            logger = self._loggers[owner] = logging.getLogger(owner.__name__)
+            return logger
+
+
+class BoundedQueueHandler(QueueHandler):
+    """Обработчик, складывающий записи в ограниченную очередь с политикой переполнения.
+
+    Политики: 'block' — ждать места в очереди, 'drop_new' — отбросить новую
+    запись, 'drop_oldest' — вытеснить самую старую запись из очереди.
+    """
+
+    POLICIES = ('block', 'drop_new', 'drop_oldest')
+
+    def __init__(self, log_queue: queue.Queue, drop_policy: str = 'drop_new'):
+        """Инициализирует обработчик.
+
+        Args:
+            log_queue: Очередь записей.
+            drop_policy: Политика при переполнении очереди.
+
+        Raises:
+            ValueError: Если политика неизвестна.
+        """
+        if drop_policy not in self.POLICIES:
+            raise ValueError(f"Политика переполнения должна быть одной из: {self.POLICIES}")
+        super().__init__(log_queue)
+        self.drop_policy = drop_policy
+        self.dropped = 0  # Количество отброшенных записей
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.drop_policy == 'block':
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        self.dropped += 1
+        if self.drop_policy == 'drop_oldest':
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                pass
+
+
+class _DrainingQueueListener(QueueListener):
+    """QueueListener, который при остановке ждёт места в заполненной очереди.
+
+    Стандартный stop() кладёт маркер остановки через put_nowait и падает с
+    queue.Full, если очередь ограничена и заполнена, а завершения потока
+    ждёт без ограничения по времени.
+    """
+
+    stop_timeout = 5.0  # Сколько секунд ждать места в очереди и завершения потока
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel, timeout=self.stop_timeout)
+
+    def stop(self) -> None:
+        """Останавливает фоновый поток, дописав накопленные записи.
+
+        Raises:
+            queue.Full: Если поток не освободил место для маркера остановки.
+            TimeoutError: Если поток не завершился за stop_timeout.
+        """
+        self.enqueue_sentinel()
+        thread, self._thread = self._thread, None
+        thread.join(self.stop_timeout)
+        if thread.is_alive():
+            raise TimeoutError("Фоновый поток логирования не завершился")
+
+
+_listener: Optional[QueueListener] = None  # Фоновый обработчик очереди логов
+
+
+def shutdown_logging() -> None:
+    """Останавливает фоновую запись логов, дописав накопленные в очереди записи.
+
+    Не выбрасывает исключений из-за заполненной очереди: если фоновый поток
+    не дописал очередь за stop_timeout, оставшиеся записи отбрасываются.
+    """
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+                root.removeHandler(handler)
+        try:
+            listener.stop()
+        except (queue.Full, TimeoutError):
+            # Фоновый поток (демон) завис на обработчике; его обработчики не закрываем
+            print("Не удалось дописать очередь логов при остановке", file=sys.stderr)
+            return
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _create_file_handler(rotation: Optional[str], max_bytes: int, backup_count: int, when: str) -> logging.Handler:
+    """Создаёт файловый обработчик с ротацией по размеру, по времени или без неё."""
+    if rotation is None:
+        # Формируем имя файла логов с текущей датой
+        log_filename = f"logs/rental_service_{datetime.now().strftime('%Y%m%d')}.log"
+        return logging.FileHandler(log_filename, encoding='utf-8')
+    if rotation == 'size':
+        return RotatingFileHandler(
+            "logs/rental_service.log", maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8'
+        )
+    if rotation == 'time':
+        return TimedRotatingFileHandler(
+            "logs/rental_service.log", when=when, backupCount=backup_count, encoding='utf-8'
+        )
+    raise ValueError("Ротация должна быть None, 'size' или 'time'")
+
+
+def setup_logging(
+        async_handlers: bool = False,
+        rotation: Optional[str] = None,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        when: str = 'midnight',
+        queue_size: int = 10000,
+        drop_policy: str = 'drop_new'
+):
+    """Настраивает систему логирования для записи в файл и вывода в консоль.
+
+    Args:
+        async_handlers: Передавать записи через очередь фоновому потоку,
+            чтобы запись на диск и в консоль не блокировала вызывающий код.
+        rotation: Ротация файла логов: None, 'size' (по размеру) или 'time' (по времени).
+        max_bytes: Максимальный размер файла при ротации по размеру.
+        backup_count: Количество хранимых архивных файлов при ротации.
+        when: Интервал ротации по времени (как в TimedRotatingFileHandler).
+        queue_size: Размер очереди записей при асинхронной записи.
+        drop_policy: Политика переполнения очереди ('block', 'drop_new', 'drop_oldest').
+
+    Returns:
+        Корневой логгер.
+    """
     # Создаём папку logs, если она не существует
     os.makedirs("logs", exist_ok=True)
 
-    # Формируем имя файла логов с текущей датой
-    log_filename = f"logs/rental_service_{datetime.now().strftime('%Y%m%d')}.log"
-
     # Настраиваем форматтер
     formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -20,11 +182,12 @@ def setup_logging():
     logger.setLevel(logging.INFO)
 
     # Удаляем существующие обработчики, чтобы избежать дублирования
+    shutdown_logging()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
 
     # Обработчик для файла
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+    file_handler = _create_file_handler(rotation, max_bytes, backup_count, when)
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
 
@@ -33,8 +196,22 @@ def setup_logging():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
 
+    if async_handlers:
+        # Вызывающий поток только кладёт запись в очередь, запись выполняет QueueListener
+        global _listener
+        queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), drop_policy)
+        _listener = _DrainingQueueListener(
+            queue_handler.queue, file_handler, console_handler, respect_handler_level=True
+        )
+        _listener.start()
+        logger.addHandler(queue_handler)
+        return logger
+
     # Добавляем обработчики к логгеру
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
 
-    return logger
\ No newline at end of file
+    return logger
+
+
+atexit.register(shutdown_logging)
@@ -1,10 +1,48 @@
+from .logging_config import ClassLogger
+from .notifications import get_notification_dispatcher
+
+
 class NotificationMixin:
     """Миксин для отправки уведомлений клиентам."""
 
+    __slots__ = ()
+
     def notify(self, message: str) -> None:
         """Отправляет уведомление с указанным сообщением.
 
+        Если назначен диспетчер (set_notification_dispatcher), сообщение
+        ставится в его очередь и доставляется в фоне; иначе печатается сразу.
+
         Args:
             message: Текст уведомления.
         """
-        print(f"Уведомление: {message}")
\ No newline at end of file
+        dispatcher = get_notification_dispatcher()
+        if dispatcher is None:
+            print(f"Уведомление: {message}")
+        else:
+            dispatcher.submit(self.notification_recipient, message)
+
+    @property
+    def notification_recipient(self) -> str:
+        """Адрес, на который доставляются уведомления объекта."""
+        return ''
+
+
+class LoggingMixin:
+    """Миксин, дающий классу общий логгер и возможность отключить логирование объекта.
+
+    Классы со __slots__ должны объявить слот _logging_muted и заполнить его в __init__.
+    """
+
+    __slots__ = ()
+
+    _logger = ClassLogger()
+    _logging_muted: bool = False
+
+    @property
+    def logging_enabled(self) -> bool:
+        return not self._logging_muted
+
+    @logging_enabled.setter
+    def logging_enabled(self, value: bool) -> None:
+        self._logging_muted = not value
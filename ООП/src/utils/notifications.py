@@ -0,0 +1,276 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+from .exceptions import NotificationDeliveryError
+from .logging_config import ClassLogger
+
+
+class NotificationTransport(ABC):
+    """Способ доставки уведомлений (печать, email, SMS и т.п.)."""
+
+    @abstractmethod
+    def send(self, recipient: str, messages: List[str]) -> None:
+        """Доставляет получателю пакет сообщений.
+
+        Args:
+            recipient: Адрес получателя.
+            messages: Сообщения в порядке отправки.
+
+        Raises:
+            Exception: Если доставка не удалась; диспетчер повторит попытку.
+        """
+        pass
+
+
+class PrintTransport(NotificationTransport):
+    """Транспорт, печатающий уведомления в стандартный вывод."""
+
+    def send(self, recipient: str, messages: List[str]) -> None:
+        for message in messages:
+            print(f"Уведомление: {message}")
+
+
+class FakeTransport(NotificationTransport):
+    """Транспорт для тестов: запоминает доставленные пакеты и может имитировать сбои."""
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        """Инициализирует транспорт.
+
+        Args:
+            failures: Сколько первых вызовов send завершатся ошибкой.
+            delay: Имитируемое время доставки одного пакета в секундах.
+        """
+        self.sent: List[Tuple[str, List[str]]] = []
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def send(self, recipient: str, messages: List[str]) -> None:
+        if self.delay:
+            time.sleep(self.delay)
+        with self._lock:
+            self.calls += 1
+            if self.failures > 0:
+                self.failures -= 1
+                raise NotificationDeliveryError(f"Не удалось доставить уведомление для {recipient}")
+            self.sent.append((recipient, list(messages)))
+
+    def messages_for(self, recipient: str) -> List[str]:
+        """Возвращает все доставленные получателю сообщения."""
+        with self._lock:
+            return [message for sent_to, messages in self.sent if sent_to == recipient for message in messages]
+
+
+_STOP = object()  # Маркер остановки рабочего потока
+
+
+class NotificationDispatcher:
+    """Асинхронная доставка уведомлений через ограниченную очередь и рабочий поток.
+
+    submit() только кладёт сообщение в очередь, поэтому время доставки не
+    входит в задержку вызывающего кода. Рабочий поток собирает пакет
+    сообщений (до batch_size штук или за flush_interval секунд), группирует
+    их по получателю и отправляет каждому получателю одним вызовом транспорта
+    с повторами при ошибках. Одинаковые сообщения одному получателю
+    доставляются столько раз, сколько были отправлены.
+    """
+
+    POLICIES = ('block', 'drop_new')
+
+    _logger = ClassLogger()
+    _logging_muted = False
+
+    def __init__(
+            self,
+            transport: NotificationTransport,
+            max_queue_size: int = 10000,
+            batch_size: int = 100,
+            flush_interval: float = 0.05,
+            max_retries: int = 3,
+            retry_delay: float = 0.1,
+            overflow: str = 'block'
+    ):
+        """Инициализирует диспетчер и запускает рабочий поток.
+
+        Args:
+            transport: Транспорт доставки.
+            max_queue_size: Ёмкость очереди сообщений.
+            batch_size: Максимальное количество сообщений в пакете.
+            flush_interval: Сколько секунд собирать пакет после первого сообщения.
+            max_retries: Количество повторных попыток доставки пакета получателю.
+            retry_delay: Задержка перед первым повтором; каждая следующая удваивается.
+            overflow: Поведение при заполненной очереди: 'block' — ждать места,
+                'drop_new' — отбросить сообщение.
+
+        Raises:
+            ValueError: Если политика переполнения неизвестна.
+        """
+        if overflow not in self.POLICIES:
+            raise ValueError(f"Политика переполнения должна быть одной из: {self.POLICIES}")
+        self.transport = transport
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.overflow = overflow
+        self.delivered = 0  # Доставлено сообщений
+        self.batches = 0  # Вызовов транспорта с успешно доставленным пакетом
+        self.failed = 0  # Сообщений, не доставленных после всех попыток
+        self.dropped = 0  # Сообщений, отброшенных при переполнении очереди
+        self._queue: queue.Queue = queue.Queue(max_queue_size)
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._closed = False
+        self._submitting = 0  # submit(), принятые до закрытия и ещё кладущие сообщение в очередь
+        self._worker = threading.Thread(target=self._run, name='notification-dispatcher', daemon=True)
+        self._worker.start()
+
+    def submit(self, recipient: str, message: str) -> bool:
+        """Ставит уведомление в очередь доставки.
+
+        Args:
+            recipient: Адрес получателя.
+            message: Текст уведомления.
+
+        Returns:
+            True, если сообщение принято; False, если отброшено из-за переполнения.
+
+        Raises:
+            RuntimeError: Если диспетчер закрыт.
+        """
+        with self._idle:
+            if self._closed:
+                raise RuntimeError("Диспетчер уведомлений закрыт")
+            self._pending += 1
+            self._submitting += 1
+        try:
+            if self.overflow == 'block':
+                self._queue.put((recipient, message))
+            else:
+                self._queue.put_nowait((recipient, message))
+        except queue.Full:
+            self.dropped += 1
+            self._done(1)
+            return False
+        finally:
+            with self._idle:
+                self._submitting -= 1
+                if self._submitting == 0:
+                    self._idle.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Ждёт доставки всех принятых сообщений.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах.
+
+        Returns:
+            True, если очередь опустела до истечения времени ожидания.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Доставляет оставшиеся сообщения и останавливает рабочий поток.
+
+        После закрытия submit() отклоняет новые сообщения, а сообщения,
+        принятые до закрытия, попадают в очередь раньше маркера остановки,
+        поэтому flush() не ждёт сообщений, которые уже некому доставить.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах.
+        """
+        with self._idle:
+            if self._closed:
+                return
+            self._closed = True
+            # Рабочий поток ещё разбирает очередь, поэтому ожидание конечно и при политике 'block'
+            self._idle.wait_for(lambda: self._submitting == 0)
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+    def __enter__(self) -> 'NotificationDispatcher':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _done(self, count: int) -> None:
+        with self._idle:
+            self._pending -= count
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while item is not _STOP and len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+            stop = batch[-1] is _STOP
+            if stop:
+                batch.pop()
+            try:
+                self._deliver(batch)
+            finally:
+                self._done(len(batch))
+            if stop:
+                return
+
+    def _deliver(self, batch: List[Tuple[str, str]]) -> None:
+        by_recipient: Dict[str, List[str]] = {}
+        for recipient, message in batch:
+            by_recipient.setdefault(recipient, []).append(message)
+        for recipient, messages in by_recipient.items():
+            if self._send(recipient, messages):
+                self.delivered += len(messages)
+                self.batches += 1
+            else:
+                self.failed += len(messages)
+
+    def _send(self, recipient: str, messages: List[str]) -> bool:
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.transport.send(recipient, messages)
+                return True
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._logger.error("Не удалось доставить %s уведомлений для %s: %s", len(messages), recipient, e)
+                    return False
+                self._logger.warning("Ошибка доставки уведомлений для %s, повтор %s: %s", recipient, attempt + 1, e)
+                time.sleep(self.retry_delay * 2 ** attempt)
+        return False
+
+
+_dispatcher: Optional[NotificationDispatcher] = None  # Диспетчер, используемый NotificationMixin
+
+
+def set_notification_dispatcher(dispatcher: Optional[NotificationDispatcher]) -> Optional[NotificationDispatcher]:
+    """Назначает диспетчер для NotificationMixin.notify.
+
+    Args:
+        dispatcher: Диспетчер или None, чтобы вернуться к синхронной печати.
+
+    Returns:
+        Предыдущий диспетчер.
+    """
+    global _dispatcher
+    previous, _dispatcher = _dispatcher, dispatcher
+    return previous
+
+
+def get_notification_dispatcher() -> Optional[NotificationDispatcher]:
+    """Возвращает текущий диспетчер уведомлений или None."""
+    return _dispatcher
@@ -0,0 +1,102 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional
+from .exceptions import PermissionDeniedError
+
+# Словарь разрешений: имя -> бит. Маска разрешений клиента — сумма битов.
+_bits: Dict[str, int] = {}
+_names: List[str] = []
+_lock = threading.Lock()
+
+# Маска разрешений субъекта текущего запроса (см. permission_scope)
+_scope_mask: ContextVar[Optional[int]] = ContextVar('permission_scope_mask', default=None)
+
+
+def register_permission(name: str) -> int:
+    """Регистрирует разрешение в словаре и возвращает его бит.
+
+    Повторная регистрация возвращает уже выданный бит.
+
+    Args:
+        name: Имя разрешения, например 'can_rent'.
+
+    Returns:
+        Бит разрешения.
+    """
+    bit = _bits.get(name)
+    if bit is not None:
+        return bit
+    with _lock:
+        bit = _bits.get(name)
+        if bit is None:
+            bit = _bits[name] = 1 << len(_names)
+            _names.append(name)
+        return bit
+
+
+def permission_mask(names: Iterable[str]) -> int:
+    """Возвращает маску для набора разрешений, регистрируя новые имена.
+
+    Args:
+        names: Имена разрешений.
+
+    Returns:
+        Битовая маска.
+    """
+    mask = 0
+    for name in names:
+        mask |= register_permission(name)
+    return mask
+
+
+def permission_names(mask: int) -> List[str]:
+    """Возвращает имена разрешений, входящих в маску, в порядке регистрации.
+
+    Args:
+        mask: Битовая маска.
+
+    Returns:
+        Список имён разрешений.
+    """
+    return [name for position, name in enumerate(_names) if mask >> position & 1]
+
+
+def current_scope_mask() -> Optional[int]:
+    """Возвращает маску разрешений текущей области запроса или None вне области."""
+    return _scope_mask.get()
+
+
+@contextmanager
+def permission_scope(customer: 'Customer', *required: str) -> Iterator[int]:
+    """Задаёт субъекта запроса: его разрешения вычисляются один раз на всю область.
+
+    Внутри области методы, помеченные check_permissions, проверяют маску
+    субъекта из контекстной переменной и не обращаются к self.customer.
+    Переданные required проверяются сразу при входе в область. Области
+    можно вкладывать; в asyncio каждая задача видит свою область.
+
+    Args:
+        customer: Клиент, от имени которого выполняется запрос.
+        *required: Разрешения, обязательные для всего запроса.
+
+    Yields:
+        Маска разрешений субъекта.
+
+    Raises:
+        PermissionDeniedError: Если у клиента нет одного из required.
+    """
+    mask = customer.permission_mask
+    for name in required:
+        if not mask & register_permission(name):
+            raise PermissionDeniedError(f"У пользователя нет разрешения '{name}'")
+    token = _scope_mask.set(mask)
+    try:
+        yield mask
+    finally:
+        _scope_mask.reset(token)
+
+
+# Разрешения, используемые в системе аренды
+CAN_RENT = register_permission('can_rent')
+CAN_MODIFY_RENTAL = register_permission('can_modify_rental')
@@ -0,0 +1,356 @@
+import json
+import sqlite3
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional
+from uuid import UUID
+from .exceptions import InvalidInstrumentError, RentalNotFoundError
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS instruments (
+    instrument_id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    condition TEXT NOT NULL,
+    daily_rate REAL NOT NULL,
+    is_available INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_instruments_type ON instruments (type, is_available);
+
+CREATE TABLE IF NOT EXISTS customers (
+    customer_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_customers_email ON customers (email);
+
+CREATE TABLE IF NOT EXISTS rentals (
+    rental_id TEXT PRIMARY KEY,
+    customer_id TEXT NOT NULL REFERENCES customers (customer_id),
+    instrument_id TEXT NOT NULL REFERENCES instruments (instrument_id),
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    total_cost REAL NOT NULL,
+    accessories TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rentals_customer ON rentals (customer_id, start_date);
+CREATE INDEX IF NOT EXISTS idx_rentals_instrument ON rentals (instrument_id, start_date, end_date);
+CREATE INDEX IF NOT EXISTS idx_rentals_start ON rentals (start_date);
+CREATE INDEX IF NOT EXISTS idx_rentals_end ON rentals (end_date);
+"""
+
+_RENTAL_SELECT = """
+SELECT r.rental_id, r.start_date, r.end_date, r.total_cost, r.accessories,
+       r.customer_id, c.data, r.instrument_id, i.data
+FROM rentals r
+JOIN customers c ON c.customer_id = r.customer_id
+JOIN instruments i ON i.instrument_id = r.instrument_id
+"""
+
+# Пересечение полуинтервалов [start_date, end_date) с [?, ?)
+_OVERLAPS = "r.start_date < ? AND r.end_date > ?"
+
+
+def _dumps(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+class SQLiteRepository:
+    """Хранилище инструментов, клиентов и аренд в базе SQLite.
+
+    Записи хранятся в формате to_dict()/from_dict(); запись выполняется
+    пакетами через executemany в одной транзакции.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        """Открывает (или создаёт) базу данных.
+
+        Args:
+            path: Путь к файлу базы данных; ':memory:' — база в памяти.
+        """
+        self._connection = sqlite3.connect(path)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> 'SQLiteRepository':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    # --- Запись ---
+
+    @staticmethod
+    def _instrument_row(data: Dict) -> tuple:
+        return (data['instrument_id'], data['type'], data['name'], data['condition'],
+                data['daily_rate'], int(data['is_available']), _dumps(data))
+
+    @staticmethod
+    def _customer_row(data: Dict) -> tuple:
+        return data['customer_id'], data['name'], data['email'], _dumps(data)
+
+    def _write(self, instruments: Iterable[Dict], customers: Iterable[Dict], rentals: Iterable[Dict]) -> None:
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO instruments VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [self._instrument_row(data) for data in instruments]
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO customers VALUES (?, ?, ?, ?)",
+                [self._customer_row(data) for data in customers]
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO rentals VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(data['rental_id'], data['customer']['customer_id'], data['instrument']['instrument_id'],
+                  data['start_date'], data['end_date'], data['total_cost'], _dumps(data['accessories']))
+                 for data in rentals]
+            )
+
+    def save_instruments(self, instruments: Iterable) -> None:
+        """Сохраняет инструменты одной транзакцией.
+
+        Args:
+            instruments: Инструменты.
+        """
+        self._write([inst.to_dict() for inst in instruments], [], [])
+
+    def save_customers(self, customers: Iterable) -> None:
+        """Сохраняет клиентов одной транзакцией.
+
+        Args:
+            customers: Клиенты.
+        """
+        self._write([], [customer.to_dict() for customer in customers], [])
+
+    def save_rentals(self, rentals: Iterable) -> None:
+        """Сохраняет аренды вместе с их клиентами и инструментами одной транзакцией.
+
+        Args:
+            rentals: Аренды.
+        """
+        self.save_all([], rentals)
+
+    def save_all(self, instruments: Iterable, rentals: Iterable) -> None:
+        """Сохраняет инструменты и аренды (с клиентами) одной транзакцией.
+
+        Args:
+            instruments: Инструменты.
+            rentals: Аренды.
+        """
+        instrument_rows: Dict[str, Dict] = {}
+        customer_rows: Dict[str, Dict] = {}
+        rental_rows = []
+        for inst in instruments:
+            data = inst.to_dict()
+            instrument_rows[data['instrument_id']] = data
+        for rental in rentals:
+            data = rental.to_dict()
+            instrument_rows.setdefault(data['instrument']['instrument_id'], data['instrument'])
+            customer_rows.setdefault(data['customer']['customer_id'], data['customer'])
+            rental_rows.append(data)
+        self._write(instrument_rows.values(), customer_rows.values(), rental_rows)
+
+    def delete_rental(self, rental_id: UUID) -> None:
+        """Удаляет аренду.
+
+        Args:
+            rental_id: Идентификатор аренды.
+
+        Raises:
+            RentalNotFoundError: Если аренда не найдена.
+        """
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM rentals WHERE rental_id = ?", (str(rental_id),))
+        if cursor.rowcount == 0:
+            raise RentalNotFoundError(f"Аренда с ID {rental_id} не найдена")
+
+    # --- Чтение ---
+
+    def get_instrument(self, instrument_id: UUID):
+        """Возвращает инструмент по идентификатору.
+
+        Args:
+            instrument_id: Идентификатор инструмента.
+
+        Returns:
+            Экземпляр инструмента.
+
+        Raises:
+            InvalidInstrumentError: Если инструмент не найден.
+        """
+        from instruments.musical_instrument import MusicalInstrument
+        row = self._connection.execute(
+            "SELECT data FROM instruments WHERE instrument_id = ?", (str(instrument_id),)
+        ).fetchone()
+        if row is None:
+            raise InvalidInstrumentError(f"Инструмент с ID {instrument_id} не найден")
+        return MusicalInstrument.from_dict(json.loads(row[0]))
+
+    def get_customer(self, customer_id: UUID):
+        """Возвращает клиента по идентификатору или None, если клиент не найден.
+
+        Args:
+            customer_id: Идентификатор клиента.
+        """
+        from rental import Customer
+        row = self._connection.execute(
+            "SELECT data FROM customers WHERE customer_id = ?", (str(customer_id),)
+        ).fetchone()
+        return None if row is None else Customer.from_dict(json.loads(row[0]))
+
+    def iter_instruments(self, instrument_type: Optional[str] = None) -> Iterator:
+        """Лениво перебирает инструменты, при необходимости только заданного типа.
+
+        Args:
+            instrument_type: Тип инструмента (например, 'guitar').
+
+        Yields:
+            Экземпляры инструментов.
+        """
+        from instruments.musical_instrument import MusicalInstrument
+        if instrument_type is None:
+            cursor = self._connection.execute("SELECT data FROM instruments")
+        else:
+            cursor = self._connection.execute(
+                "SELECT data FROM instruments WHERE type = ?", (instrument_type.lower(),)
+            )
+        for (data,) in cursor:
+            yield MusicalInstrument.from_dict(json.loads(data))
+
+    def _rentals(self, where: str = '', params: tuple = ()) -> Iterator:
+        """Восстанавливает аренды по запросу, разделяя одних клиентов и инструменты между ними."""
+        from instruments.musical_instrument import MusicalInstrument
+        from rental import AccessoryCatalog, Customer, Rental
+        customers: Dict[str, object] = {}
+        instruments: Dict[str, object] = {}
+        accessories = AccessoryCatalog()
+        cursor = self._connection.execute(f"{_RENTAL_SELECT} {where}", params)
+        for (rental_id, start_date, end_date, total_cost, accessories_json,
+             customer_id, customer_data, instrument_id, instrument_data) in cursor:
+            customer = customers.get(customer_id)
+            if customer is None:
+                customer = customers[customer_id] = Customer.from_dict(json.loads(customer_data))
+            instrument = instruments.get(instrument_id)
+            if instrument is None:
+                instrument = instruments[instrument_id] = MusicalInstrument.from_dict(json.loads(instrument_data))
+            data = {
+                'rental_id': rental_id,
+                'start_date': start_date,
+                'end_date': end_date,
+                'accessories': json.loads(accessories_json),
+                'total_cost': total_cost,
+            }
+            yield Rental.from_dict(data, customer=customer, instrument=instrument, accessories=accessories)
+
+    def get_rental(self, rental_id: UUID):
+        """Возвращает аренду по идентификатору.
+
+        Args:
+            rental_id: Идентификатор аренды.
+
+        Returns:
+            Объект аренды.
+
+        Raises:
+            RentalNotFoundError: Если аренда не найдена.
+        """
+        for rental in self._rentals("WHERE r.rental_id = ?", (str(rental_id),)):
+            return rental
+        raise RentalNotFoundError(f"Аренда с ID {rental_id} не найдена")
+
+    def iter_rentals(self) -> Iterator:
+        """Лениво перебирает все аренды в порядке дат начала."""
+        return self._rentals("ORDER BY r.start_date")
+
+    def rentals_for_customer(self, customer_id: UUID) -> List:
+        """Возвращает историю аренд клиента.
+
+        Args:
+            customer_id: Идентификатор клиента.
+
+        Returns:
+            Список аренд в порядке дат начала.
+        """
+        return list(self._rentals("WHERE r.customer_id = ? ORDER BY r.start_date", (str(customer_id),)))
+
+    def rentals_for_instrument(self, instrument_id: UUID) -> List:
+        """Возвращает историю аренд инструмента.
+
+        Args:
+            instrument_id: Идентификатор инструмента.
+
+        Returns:
+            Список аренд в порядке дат начала.
+        """
+        return list(self._rentals("WHERE r.instrument_id = ? ORDER BY r.start_date", (str(instrument_id),)))
+
+    def rentals_between(self, start: date, end: date) -> List:
+        """Возвращает аренды, пересекающиеся с периодом [start, end).
+
+        Args:
+            start: Начало периода.
+            end: Конец периода (не включается).
+
+        Returns:
+            Список аренд в порядке дат начала.
+        """
+        return list(self._rentals(
+            f"WHERE {_OVERLAPS} ORDER BY r.start_date", (end.isoformat(), start.isoformat())
+        ))
+
+    def is_instrument_free(self, instrument_id: UUID, start: date, end: date) -> bool:
+        """Проверяет, что у инструмента нет аренд, пересекающихся с периодом [start, end).
+
+        Args:
+            instrument_id: Идентификатор инструмента.
+            start: Начало периода.
+            end: Конец периода (не включается).
+        """
+        row = self._connection.execute(
+            f"SELECT 1 FROM rentals r WHERE r.instrument_id = ? AND {_OVERLAPS} LIMIT 1",
+            (str(instrument_id), end.isoformat(), start.isoformat())
+        ).fetchone()
+        return row is None
+
+    def available_instruments(
+            self,
+            instrument_type: Optional[str] = None,
+            start: Optional[date] = None,
+            end: Optional[date] = None
+    ) -> List:
+        """Возвращает доступные инструменты.
+
+        Без периода учитывается только флаг доступности; с периодом —
+        отсутствие аренд, пересекающихся с [start, end).
+
+        Args:
+            instrument_type: Тип инструмента (опционально).
+            start: Начало периода (опционально).
+            end: Конец периода (опционально).
+
+        Returns:
+            Список инструментов.
+        """
+        from instruments.musical_instrument import MusicalInstrument
+        conditions, params = [], []
+        if instrument_type is not None:
+            conditions.append("i.type = ?")
+            params.append(instrument_type.lower())
+        if start is None or end is None:
+            conditions.append("i.is_available = 1")
+        else:
+            conditions.append(
+                f"NOT EXISTS (SELECT 1 FROM rentals r WHERE r.instrument_id = i.instrument_id AND {_OVERLAPS})"
+            )
+            params.extend([end.isoformat(), start.isoformat()])
+        rows = self._connection.execute(
+            f"SELECT i.data FROM instruments i WHERE {' AND '.join(conditions)}", params
+        )
+        return [MusicalInstrument.from_dict(json.loads(data)) for (data,) in rows]
+
+    def count_rentals(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM rentals").fetchone()[0]
@@ -1,27 +1,324 @@
 import json
 import os
-from typing import List, Dict
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Tuple, TextIO
 
 
-def save_to_json(instruments: List, rentals: List, filename: str) -> None:
-    from instruments.musical_instrument import MusicalInstrument
-    from rental import Rental
-    data = {
-        'instruments': [inst.to_dict() for inst in instruments],
-        'rentals': [rental.to_dict() for rental in rentals]
-    }
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
+def _ensure_dir(filename: str) -> None:
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def _write_json_array(f: TextIO, key: str, items: Iterable, serialize: Optional[Callable] = None) -> None:
+    """Записывает массив объектов поэлементно, не собирая его целиком в памяти."""
+    f.write(f'  "{key}": [')
+    separator = '\n'
+    for item in items:
+        text = json.dumps(item.to_dict() if serialize is None else serialize(item), ensure_ascii=False, indent=2)
+        f.write(separator + '    ' + text.replace('\n', '\n    '))
+        separator = ',\n'
+    f.write('\n  ]' if separator != '\n' else ']')
+
+
+def _referenced(instruments: Iterable, rentals: List) -> Tuple[List, List]:
+    """Возвращает инструменты (переданные и упомянутые в арендах) и клиентов аренд без повторов."""
+    instruments_by_id = {instrument.instrument_id: instrument for instrument in instruments}
+    customers_by_id = {}
+    for rental in rentals:
+        instruments_by_id.setdefault(rental.instrument.instrument_id, rental.instrument)
+        customers_by_id.setdefault(rental.customer.customer_id, rental.customer)
+    return list(instruments_by_id.values()), list(customers_by_id.values())
+
+
+def save_to_json(instruments: Iterable, rentals: Iterable, filename: str) -> None:
+    """Сохраняет инструменты, клиентов и аренды в JSON-файл.
+
+    Клиенты и инструменты записываются по одному разу в свои разделы, а
+    аренды ссылаются на них по customer_id и instrument_id (Rental.to_record).
+    В раздел instruments попадают и инструменты, которые встречаются только в арендах.
+
+    Args:
+        instruments: Инструменты.
+        rentals: Аренды.
+        filename: Путь к файлу.
+    """
+    rentals = list(rentals)
+    instruments, customers = _referenced(instruments, rentals)
+    _ensure_dir(filename)
     with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write('{\n')
+        _write_json_array(f, 'instruments', instruments)
+        f.write(',\n')
+        _write_json_array(f, 'customers', customers)
+        f.write(',\n')
+        _write_json_array(f, 'rentals', rentals, lambda rental: rental.to_record())
+        f.write('\n}')
+
+
+def expand_rental_records(data: Dict) -> Iterator[Dict]:
+    """Возвращает записи аренд файла save_to_json во вложенном формате Rental.to_dict().
+
+    Файлы прежнего формата, где клиент и инструмент вложены в аренду,
+    возвращаются без изменений.
+
+    Args:
+        data: Содержимое JSON-файла.
+
+    Yields:
+        Словари аренд.
+    """
+    customers = {customer['customer_id']: customer for customer in data.get('customers', [])}
+    instruments = {instrument['instrument_id']: instrument for instrument in data.get('instruments', [])}
+    for record in data.get('rentals', []):
+        if 'customer_id' in record:
+            record = dict(record)
+            record['customer'] = customers[record.pop('customer_id')]
+            record['instrument'] = instruments[record.pop('instrument_id')]
+        yield record
 
 
 def load_from_json(filename: str) -> tuple[List, List]:
-    from instruments.musical_instrument import MusicalInstrument
-    from rental import Rental
+    """Загружает инструменты и аренды из JSON-файла.
+
+    Клиенты и инструменты восстанавливаются по одному разу (с сохранёнными
+    идентификаторами) и разделяются всеми ссылающимися на них арендами.
+    Поддерживается и прежний формат с вложенными в аренды клиентами и
+    инструментами. Для поиска инструментов по ID используйте load_inventory.
+
+    Args:
+        filename: Путь к файлу.
+
+    Returns:
+        Кортеж (инструменты, аренды).
+    """
+    inventory, rentals = load_inventory(filename)
+    return list(inventory), rentals
+
+
+def load_inventory(filename: str) -> Tuple['InstrumentInventory', List]:
+    """Загружает JSON-файл save_to_json в инвентарь инструментов и список аренд.
+
+    Args:
+        filename: Путь к файлу.
+
+    Returns:
+        Кортеж (инвентарь инструментов, аренды).
+    """
     if not os.path.exists(filename):
-        return [], []
+        return restore_document({})
     with open(filename, 'r', encoding='utf-8') as f:
         data = json.load(f)
-    instruments = [MusicalInstrument.from_dict(inst) for inst in data.get('instruments', [])]
-    rentals = [Rental.from_dict(rental) for rental in data.get('rentals', [])]
-    return instruments, rentals
\ No newline at end of file
+    return restore_document(data)
+
+
+def restore_document(data: Dict) -> Tuple['InstrumentInventory', List]:
+    """Восстанавливает объекты из содержимого JSON-файла save_to_json.
+
+    Args:
+        data: Разобранный JSON-документ.
+
+    Returns:
+        Кортеж (инвентарь инструментов, аренды).
+    """
+    from instruments import InstrumentInventory
+    from rental import Customer, Rental
+    inventory = InstrumentInventory()
+    for inst in data.get('instruments', []):
+        inventory.intern(inst)
+    customers = {customer['customer_id']: Customer.from_dict(customer) for customer in data.get('customers', [])}
+    records = data.get('rentals', [])
+    for record in records:
+        if 'instrument' in record:  # Прежний формат: инструмент вложен в аренду
+            inventory.intern(record['instrument'])
+    rentals = Rental.bulk_from_dict(records, customers, inventory.identity_map())
+    return inventory, rentals
+
+
+class JsonLinesWriter:
+    """Дозаписывает объекты в файл формата JSON Lines, по одной записи на строку.
+
+    Каждая строка имеет вид {"kind": "instrument" | "customer" | "rental", "data": {...}}.
+    Аренды записываются через Rental.to_record(); клиент и инструмент аренды
+    записываются перед ней, если этот writer их ещё не записывал.
+    """
+
+    def __init__(self, filename: str, mode: str = 'a'):
+        """Открывает файл для записи.
+
+        Args:
+            filename: Путь к файлу.
+            mode: Режим открытия: 'a' — дозапись, 'w' — перезапись.
+        """
+        _ensure_dir(filename)
+        self._file = open(filename, mode, encoding='utf-8')
+        self._written = set()  # (тип, ID) уже записанных клиентов и инструментов
+
+    def write(self, kind: str, data: Dict) -> None:
+        """Записывает одну запись.
+
+        Args:
+            kind: Тип записи.
+            data: Данные записи.
+        """
+        self._file.write(json.dumps({'kind': kind, 'data': data}, ensure_ascii=False, separators=(',', ':')))
+        self._file.write('\n')
+
+    def write_instrument(self, instrument) -> None:
+        self._written.add(('instrument', instrument.instrument_id))
+        self.write('instrument', instrument.to_dict())
+
+    def write_customer(self, customer) -> None:
+        self._written.add(('customer', customer.customer_id))
+        self.write('customer', customer.to_dict())
+
+    def write_rental(self, rental) -> None:
+        if ('customer', rental.customer.customer_id) not in self._written:
+            self.write_customer(rental.customer)
+        if ('instrument', rental.instrument.instrument_id) not in self._written:
+            self.write_instrument(rental.instrument)
+        self.write('rental', rental.to_record())
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'JsonLinesWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def save_to_jsonl(instruments: Iterable, rentals: Iterable, filename: str) -> None:
+    """Сохраняет инструменты и аренды в файл JSON Lines, перезаписывая его.
+
+    Args:
+        instruments: Инструменты.
+        rentals: Аренды.
+        filename: Путь к файлу.
+    """
+    with JsonLinesWriter(filename, mode='w') as writer:
+        for instrument in instruments:
+            writer.write_instrument(instrument)
+        for rental in rentals:
+            writer.write_rental(rental)
+
+
+def append_rental(rental, filename: str) -> None:
+    """Дописывает одну аренду в конец файла JSON Lines одной строкой.
+
+    Новый writer не знает, какие клиенты и инструменты уже есть в файле,
+    поэтому аренда пишется в формате to_dict() со вложенными клиентом и
+    инструментом; при чтении они разрешаются по ID через карты
+    идентичности, как записи прежнего формата.
+
+    Args:
+        rental: Аренда.
+        filename: Путь к файлу.
+    """
+    with JsonLinesWriter(filename) as writer:
+        writer.write('rental', rental.to_dict())
+
+
+def append_instrument(instrument, filename: str) -> None:
+    """Дописывает один инструмент в конец файла JSON Lines.
+
+    Args:
+        instrument: Инструмент.
+        filename: Путь к файлу.
+    """
+    with JsonLinesWriter(filename) as writer:
+        writer.write_instrument(instrument)
+
+
+def iter_records(filename: str) -> Iterator[Tuple[str, Dict]]:
+    """Построчно читает записи файла JSON Lines.
+
+    Args:
+        filename: Путь к файлу.
+
+    Yields:
+        Пары (тип записи, данные).
+    """
+    if not os.path.exists(filename):
+        return
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record['kind'], record['data']
+
+
+def iter_instruments(filename: str) -> Iterator:
+    """Лениво восстанавливает инструменты из файла JSON Lines.
+
+    Args:
+        filename: Путь к файлу.
+
+    Yields:
+        Экземпляры инструментов.
+    """
+    from instruments import InstrumentInventory
+    inventory = InstrumentInventory()
+    for kind, data in iter_records(filename):
+        if kind == 'instrument':
+            # Инструмент, записанный несколько раз, возвращается один раз;
+            # более поздние записи обновляют уже возвращённый объект
+            known = data['instrument_id'] in inventory
+            instrument = inventory.update(data)
+            if not known:
+                yield instrument
+
+
+def iter_rentals(filename: str) -> Iterator:
+    """Лениво восстанавливает аренды из файла JSON Lines.
+
+    Клиенты и инструменты, на которые ссылаются аренды, восстанавливаются
+    по одному разу.
+
+    Args:
+        filename: Путь к файлу.
+
+    Yields:
+        Экземпляры аренд.
+    """
+    from instruments import InstrumentInventory
+    from rental import AccessoryCatalog, Customer, Rental
+    customers, instruments, inventory, accessories = {}, {}, InstrumentInventory(), AccessoryCatalog()
+    for kind, data in iter_records(filename):
+        if kind == 'customer':
+            if data['customer_id'] not in customers:
+                customers[data['customer_id']] = Customer.from_dict(data)
+        elif kind == 'instrument':
+            instruments[data['instrument_id']] = inventory.update(data)
+        elif kind == 'rental':
+            if 'instrument' in data:  # Аренда, дописанная append_rental, со вложенным инструментом
+                instruments[data['instrument']['instrument_id']] = inventory.update(data['instrument'])
+            yield Rental.bulk_from_dict([data], customers, instruments, accessories)[0]
+
+
+def load_from_jsonl(filename: str) -> tuple[List, List]:
+    """Загружает инструменты и аренды из файла JSON Lines за один проход.
+
+    Args:
+        filename: Путь к файлу.
+
+    Returns:
+        Кортеж (инструменты, аренды).
+    """
+    from instruments import InstrumentInventory
+    from rental import Customer, Rental
+    inventory, rental_records, customers = InstrumentInventory(), [], {}
+    for kind, data in iter_records(filename):
+        if kind == 'instrument':
+            inventory.update(data)  # В логе с дозаписью действует последняя запись
+        elif kind == 'customer':
+            if data['customer_id'] not in customers:
+                customers[data['customer_id']] = Customer.from_dict(data)
+        elif kind == 'rental':
+            if 'instrument' in data:  # Аренда, дописанная append_rental, со вложенным инструментом
+                inventory.update(data['instrument'])
+            rental_records.append(data)
+    return list(inventory), Rental.bulk_from_dict(rental_records, customers, inventory.identity_map())
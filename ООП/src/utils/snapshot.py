@@ -0,0 +1,370 @@
+import json
+import mmap
+import os
+import struct
+from datetime import date
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import UUID
+from .exceptions import RentalNotFoundError
+
+# Формат файла снимка:
+#   заголовок | таблицы записей фиксированной ширины | индексы (id -> номер записи) | куча строк.
+# Записи ссылаются на строки кучи парами (смещение от начала кучи, длина).
+_MAGIC = b'RNTSNAP1'
+_HEADER = struct.Struct('<8s12Q')  # сигнатура, 3 x (кол-во, таблица, индекс), куча, типы (смещение, длина)
+_INSTRUMENT = struct.Struct('<16sBB?dQIQI')  # id, тип, состояние, доступность, ставка, название, доп. поля
+_CUSTOMER = struct.Struct('<16sQIQIQIQI')  # id, имя, email, телефон, разрешения
+_RENTAL = struct.Struct('<16sIIIIdQI')  # id, клиент, инструмент, начало, окончание, стоимость, аксессуары
+_INDEX = struct.Struct('<16sI')  # id, номер записи
+_NONE = 0xFFFFFFFF  # Длина ссылки для отсутствующего значения
+_CONDITIONS = ('used', 'refurbished', 'new')
+_INSTRUMENT_FIELDS = {'type', 'instrument_id', 'name', 'condition', 'daily_rate', 'is_available'}
+
+
+class _Heap:
+    """Куча строк с дедупликацией одинаковых значений."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self._seen: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, value: Optional[str]) -> Tuple[int, int]:
+        if value is None:
+            return 0, _NONE
+        ref = self._seen.get(value)
+        if ref is None:
+            encoded = value.encode('utf-8')
+            ref = self._seen[value] = (len(self.data), len(encoded))
+            self.data += encoded
+        return ref
+
+    def add_json(self, value) -> Tuple[int, int]:
+        return self.add(json.dumps(value, ensure_ascii=False, separators=(',', ':')))
+
+
+def write_snapshot_from_dicts(instruments: Iterable[Dict], rentals: Iterable[Dict], filename: str) -> None:
+    """Записывает снимок по словарям в формате to_dict().
+
+    Клиенты и инструменты, встречающиеся в арендах, записываются в свои
+    таблицы один раз; аренды ссылаются на них по номеру записи.
+
+    Args:
+        instruments: Словари инструментов.
+        rentals: Словари аренд.
+        filename: Путь к файлу снимка.
+    """
+    heap = _Heap()
+    types: List[str] = []
+    instrument_rows: List[bytes] = []
+    instrument_positions: Dict[str, int] = {}
+    customer_rows: List[bytes] = []
+    customer_positions: Dict[str, int] = {}
+    rental_rows: List[bytes] = []
+
+    def add_instrument(data: Dict) -> int:
+        key = data['instrument_id']
+        position = instrument_positions.get(key)
+        if position is None:
+            if data['type'] not in types:
+                types.append(data['type'])
+            extra = {k: v for k, v in data.items() if k not in _INSTRUMENT_FIELDS}
+            instrument_rows.append(_INSTRUMENT.pack(
+                UUID(key).bytes, types.index(data['type']), _CONDITIONS.index(data['condition']),
+                data['is_available'], data['daily_rate'], *heap.add(data['name']), *heap.add_json(extra)
+            ))
+            position = instrument_positions[key] = len(instrument_rows) - 1
+        return position
+
+    def add_customer(data: Dict) -> int:
+        key = data['customer_id']
+        position = customer_positions.get(key)
+        if position is None:
+            customer_rows.append(_CUSTOMER.pack(
+                UUID(key).bytes, *heap.add(data['name']), *heap.add(data['email']),
+                *heap.add(data.get('phone')), *heap.add_json(data.get('permissions', []))
+            ))
+            position = customer_positions[key] = len(customer_rows) - 1
+        return position
+
+    for data in instruments:
+        add_instrument(data)
+    rental_ids: List[bytes] = []
+    for data in rentals:
+        rental_ids.append(UUID(data['rental_id']).bytes)
+        rental_rows.append(_RENTAL.pack(
+            rental_ids[-1], add_customer(data['customer']), add_instrument(data['instrument']),
+            date.fromisoformat(data['start_date']).toordinal(), date.fromisoformat(data['end_date']).toordinal(),
+            data['total_cost'], *heap.add_json(data.get('accessories', []))
+        ))
+    types_ref = heap.add_json(types)
+
+    sections = [(instrument_rows, _INSTRUMENT), (customer_rows, _CUSTOMER), (rental_rows, _RENTAL)]
+    offset = _HEADER.size
+    layout = []
+    for rows, record in sections:
+        layout.append([len(rows), offset, 0])
+        offset += len(rows) * record.size
+    for entry, (rows, _) in zip(layout, sections):
+        entry[2] = offset
+        offset += len(rows) * _INDEX.size
+    heap_offset = offset
+
+    _ensure_dir(filename)
+    with open(filename, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, *[value for entry in layout for value in entry], heap_offset, *types_ref))
+        for rows, _ in sections:
+            f.write(b''.join(rows))
+        for rows, _ in sections:
+            ids = sorted((row[:16], position) for position, row in enumerate(rows))
+            f.write(b''.join(_INDEX.pack(record_id, position) for record_id, position in ids))
+        f.write(heap.data)
+
+
+def write_snapshot(instruments: Iterable, rentals: Iterable, filename: str) -> None:
+    """Записывает инструменты и аренды в бинарный снимок.
+
+    Args:
+        instruments: Инструменты.
+        rentals: Аренды.
+        filename: Путь к файлу снимка.
+    """
+    write_snapshot_from_dicts(
+        (inst.to_dict() for inst in instruments), (rental.to_dict() for rental in rentals), filename
+    )
+
+
+def convert_json_to_snapshot(json_filename: str, snapshot_filename: str) -> None:
+    """Преобразует файл save_to_json в бинарный снимок без создания объектов.
+
+    Args:
+        json_filename: Путь к JSON-файлу.
+        snapshot_filename: Путь к файлу снимка.
+    """
+    from .serialization import expand_rental_records
+    with open(json_filename, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    write_snapshot_from_dicts(data.get('instruments', []), expand_rental_records(data), snapshot_filename)
+
+
+def _ensure_dir(filename: str) -> None:
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+class SnapshotSection:
+    """Таблица записей снимка с ленивым созданием объектов."""
+
+    def __init__(self, snapshot: 'RentalSnapshot', record: struct.Struct, count: int,
+                 table_offset: int, index_offset: int, decode: Callable[[Tuple], Dict],
+                 build: Callable[[int, Dict], object]):
+        self._buffer = snapshot._buffer
+        self._record = record
+        self._count = count
+        self._table_offset = table_offset
+        self._index_offset = index_offset
+        self._decode = decode
+        self._build = build
+        self._objects: Dict[int, object] = {}
+
+    def fields(self, position: int) -> Tuple:
+        """Возвращает поля записи без декодирования строк."""
+        if not 0 <= position < self._count:
+            raise IndexError(position)
+        return self._record.unpack_from(self._buffer, self._table_offset + position * self._record.size)
+
+    def raw(self, position: int) -> Dict:
+        """Возвращает запись в формате to_dict() без создания объекта.
+
+        Args:
+            position: Номер записи.
+
+        Returns:
+            Словарь с данными записи.
+        """
+        return self._decode(self.fields(position))
+
+    def position(self, record_id: UUID) -> Optional[int]:
+        """Находит номер записи по идентификатору двоичным поиском по индексу.
+
+        Args:
+            record_id: Идентификатор записи.
+
+        Returns:
+            Номер записи или None, если запись не найдена.
+        """
+        key = record_id.bytes
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            current, position = _INDEX.unpack_from(self._buffer, self._index_offset + middle * _INDEX.size)
+            if current == key:
+                return position
+            if current < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def find(self, record_id: UUID) -> Optional[object]:
+        """Возвращает объект по идентификатору записи или None."""
+        position = self.position(record_id)
+        return None if position is None else self[position]
+
+    def __getitem__(self, position: int) -> object:
+        obj = self._objects.get(position)
+        if obj is None:
+            obj = self._objects[position] = self._build(position, self.raw(position))
+        return obj
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator:
+        return (self[position] for position in range(self._count))
+
+
+class RentalSnapshot:
+    """Бинарный снимок инструментов, клиентов и аренд, открытый через mmap.
+
+    Записи превращаются в объекты только при обращении к ним; повторное
+    обращение возвращает тот же объект.
+    """
+
+    def __init__(self, filename: str):
+        """Открывает снимок.
+
+        Args:
+            filename: Путь к файлу снимка.
+
+        Raises:
+            ValueError: Если файл пуст, обрезан или не является снимком.
+        """
+        self._file = open(filename, 'rb')
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError) as e:  # Пустой файл нельзя отобразить в память
+            self._file.close()
+            raise ValueError(f"Файл {filename} не является снимком аренд: {e}") from e
+        try:
+            header = _HEADER.unpack_from(self._buffer, 0)
+        except struct.error as e:
+            self.close()
+            raise ValueError(f"Файл {filename} обрезан: нет заголовка снимка") from e
+        if header[0] != _MAGIC:
+            self.close()
+            raise ValueError(f"Файл {filename} не является снимком аренд")
+        self._heap_offset = header[10]
+        self._types: List[str] = json.loads(self._string(header[11], header[12]))
+        self.instruments = SnapshotSection(
+            self, _INSTRUMENT, *header[1:4], self._decode_instrument, self._build_instrument
+        )
+        self.customers = SnapshotSection(
+            self, _CUSTOMER, *header[4:7], self._decode_customer, self._build_customer
+        )
+        self.rentals = SnapshotSection(
+            self, _RENTAL, *header[7:10], self._decode_rental, self._build_rental
+        )
+        self._accessories = None  # Каталог аксессуаров этого снимка, создаётся при первой аренде
+
+    @property
+    def instrument_types(self) -> List[str]:
+        """Типы инструментов в порядке их кодов в таблице инструментов."""
+        return list(self._types)
+
+    def _string(self, offset: int, length: int) -> Optional[str]:
+        if length == _NONE:
+            return None
+        start = self._heap_offset + offset
+        return self._buffer[start:start + length].decode('utf-8')
+
+    def _decode_instrument(self, fields: Tuple) -> Dict:
+        record_id, type_code, condition_code, is_available, daily_rate, *refs = fields
+        data = {
+            'type': self._types[type_code],
+            'instrument_id': str(UUID(bytes=record_id)),
+            'name': self._string(refs[0], refs[1]),
+            'condition': _CONDITIONS[condition_code],
+            'daily_rate': daily_rate,
+            'is_available': is_available,
+        }
+        data.update(json.loads(self._string(refs[2], refs[3])))
+        return data
+
+    def _decode_customer(self, fields: Tuple) -> Dict:
+        record_id, *refs = fields
+        return {
+            'customer_id': str(UUID(bytes=record_id)),
+            'name': self._string(refs[0], refs[1]),
+            'email': self._string(refs[2], refs[3]),
+            'phone': self._string(refs[4], refs[5]),
+            'permissions': json.loads(self._string(refs[6], refs[7])),
+        }
+
+    def _decode_rental(self, fields: Tuple) -> Dict:
+        record_id, customer, instrument, start, end, total_cost, *refs = fields
+        return {
+            'rental_id': str(UUID(bytes=record_id)),
+            'customer': self.customers.raw(customer),
+            'instrument': self.instruments.raw(instrument),
+            'start_date': date.fromordinal(start).isoformat(),
+            'end_date': date.fromordinal(end).isoformat(),
+            'accessories': json.loads(self._string(refs[0], refs[1])),
+            'total_cost': total_cost,
+        }
+
+    @staticmethod
+    def _build_instrument(position: int, data: Dict):
+        from instruments.musical_instrument import MusicalInstrument
+        return MusicalInstrument.from_dict(data)
+
+    @staticmethod
+    def _build_customer(position: int, data: Dict):
+        from rental import Customer
+        return Customer.from_dict(data)
+
+    def _build_rental(self, position: int, data: Dict):
+        from rental import AccessoryCatalog, Rental
+        if self._accessories is None:
+            self._accessories = AccessoryCatalog()
+        _, customer, instrument, *_ = self.rentals.fields(position)
+        return Rental.from_dict(
+            data, customer=self.customers[customer], instrument=self.instruments[instrument],
+            accessories=self._accessories
+        )
+
+    def rental(self, rental_id: UUID):
+        """Возвращает аренду по идентификатору.
+
+        Args:
+            rental_id: Идентификатор аренды.
+
+        Returns:
+            Объект аренды.
+
+        Raises:
+            RentalNotFoundError: Если аренды нет в снимке.
+        """
+        rental = self.rentals.find(rental_id)
+        if rental is None:
+            raise RentalNotFoundError(f"Аренда с ID {rental_id} не найдена")
+        return rental
+
+    def export_json(self, filename: str) -> None:
+        """Экспортирует снимок в формат save_to_json.
+
+        Args:
+            filename: Путь к JSON-файлу.
+        """
+        from .serialization import save_to_json
+        save_to_json(self.instruments, self.rentals, filename)
+
+    def close(self) -> None:
+        self._buffer.close()
+        self._file.close()
+
+    def __enter__(self) -> 'RentalSnapshot':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()